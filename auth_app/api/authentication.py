@@ -0,0 +1,64 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+
+from ..cache import token_cache
+
+class ProfileTokenAuthentication(TokenAuthentication):
+    """Token authentication loading token, user and profile in one query.
+
+    Authenticated tokens are kept in the in-process token cache, so repeated
+    requests with the same token need no authentication query at all. The
+    profile is cached on `request.user`, so profile type checks are free.
+    """
+
+    def authenticate_credentials(self, key):
+        """Return `(user, token)` for a token key, using the token cache when possible."""
+        token = token_cache.get(key)
+        if token is not None:
+            return (token.user, token)
+
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user__profile').get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        token_cache.set(key, token)
+        return (token.user, token)
+
+    async def aauthenticate(self, request):
+        """Async variant of `authenticate()` for the async read views, using the async ORM."""
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) == 1:
+            raise exceptions.AuthenticationFailed(_('Invalid token header. No credentials provided.'))
+        if len(auth) > 2:
+            raise exceptions.AuthenticationFailed(_('Invalid token header. Token string should not contain spaces.'))
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed(
+                _('Invalid token header. Token string should not contain invalid characters.')
+            )
+
+        token = token_cache.get(key)
+        if token is not None:
+            return (token.user, token)
+
+        model = self.get_model()
+        try:
+            token = await model.objects.select_related('user__profile').aget(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        token_cache.set(key, token)
+        return (token.user, token)
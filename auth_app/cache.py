@@ -0,0 +1,86 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class TokenCache:
+    """Bounded in-process LRU cache of token key -> authenticated token with user and profile.
+
+    Entries expire after `TTL` seconds and the least recently used entry is
+    evicted once `MAX_SIZE` is reached. Both values are read from
+    `settings.TOKEN_AUTH_CACHE`; a `MAX_SIZE` of 0 (the default) disables
+    the cache.
+    The cache is local to the worker process, so the TTL bounds how long a
+    change made through another process can go unnoticed.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        return settings.TOKEN_AUTH_CACHE.get('MAX_SIZE', 0)
+
+    @property
+    def ttl(self):
+        return settings.TOKEN_AUTH_CACHE.get('TTL', 0)
+
+    def get(self, key):
+        """Return a copy of the cached token for `key`, or None."""
+        if self.max_size <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, token = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        token = copy.copy(token)
+        token.user = copy.copy(token.user)
+        # The copied user shares the cached related objects (the profile).
+        fields_cache = token.user._state.fields_cache
+        for name, value in fields_cache.items():
+            fields_cache[name] = copy.copy(value)
+        return token
+
+    def set(self, key, token):
+        """Store an authenticated token, evicting the least recently used entries."""
+        max_size = self.max_size
+        if max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, token)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Drop the entry of a single token key."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_user(self, user_id):
+        """Drop all entries belonging to a user."""
+        with self._lock:
+            for key in [key for key, (_, token) in self._entries.items() if token.user_id == user_id]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache()
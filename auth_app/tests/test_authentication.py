@@ -0,0 +1,128 @@
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from auth_app.cache import token_cache
+from profile_app.models import Profile
+
+
+@override_settings(TOKEN_AUTH_CACHE={'MAX_SIZE': 10, 'TTL': 60})
+class ProfileTokenAuthenticationTests(APITestCase):
+    """Tests für die Token-Authentifizierung mit vorgeladenem Profil und Token-Cache"""
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.user, type='business')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.url = reverse('offers-list')
+        self.payload = {"title": "", "description": "Test"}
+
+    def tearDown(self):
+        token_cache.clear()
+
+    @override_settings(TOKEN_AUTH_CACHE={'MAX_SIZE': 0})
+    def test_token_user_and_profile_in_one_query(self):
+        """
+        Token, User und Profil werden mit einer Query geladen, die Rollenprüfung braucht keine weitere
+        """
+        with self.assertNumQueries(1):
+            response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_cached_token_needs_no_query(self):
+        """
+        Bei wiederholten Requests kommt der Token aus dem Cache
+        """
+        self.client.post(self.url, self.payload, format='json')
+
+        with self.assertNumQueries(0):
+            response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_deleted_token_is_invalidated(self):
+        """
+        Ein gelöschter Token wird sofort abgelehnt (401)
+        """
+        self.client.post(self.url, self.payload, format='json')
+        self.token.delete()
+
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_profile_change_is_invalidated(self):
+        """
+        Eine Änderung des Profils verwirft den gecachten Profiltyp
+        """
+        self.client.post(self.url, self.payload, format='json')
+        profile = Profile.objects.get(user=self.user)
+        profile.type = 'customer'
+        profile.save()
+
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_inactive_user_is_rejected(self):
+        """
+        Deaktivierte User werden abgelehnt (401)
+        """
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(TOKEN_AUTH_CACHE={'MAX_SIZE': 2, 'TTL': 60})
+    def test_cache_is_bounded(self):
+        """
+        Der Cache hält höchstens MAX_SIZE Einträge (LRU)
+        """
+        tokens = []
+        for i in range(3):
+            user = User.objects.create_user(username=f'user{i}', password='testpass123')
+            tokens.append(Token.objects.create(user=user))
+            token_cache.set(tokens[-1].key, tokens[-1])
+
+        self.assertIsNone(token_cache.get(tokens[0].key))
+        self.assertIsNotNone(token_cache.get(tokens[1].key))
+        self.assertIsNotNone(token_cache.get(tokens[2].key))
+
+    @override_settings(TOKEN_AUTH_CACHE={'MAX_SIZE': 10, 'TTL': 0})
+    def test_expired_entries_are_ignored(self):
+        """
+        Abgelaufene Einträge werden nicht verwendet
+        """
+        token_cache.set(self.token.key, self.token)
+
+        self.assertIsNone(token_cache.get(self.token.key))
+
+    def test_cached_profile_is_not_shared(self):
+        """
+        Jeder Treffer liefert eine eigene Kopie von User und Profil
+        """
+        token = Token.objects.select_related('user__profile').get(key=self.token.key)
+        token_cache.set(token.key, token)
+
+        first, second = token_cache.get(token.key), token_cache.get(token.key)
+
+        self.assertIsNot(first.user, second.user)
+        self.assertIsNot(first.user.profile, second.user.profile)
+        self.assertEqual(first.user.profile.type, 'business')
+
+    @override_settings(TOKEN_AUTH_CACHE={'MAX_SIZE': 0, 'TTL': 60})
+    def test_disabled_cache_queries_every_request(self):
+        """
+        Ohne Cache (Standard) wird der Token bei jedem Request geladen
+        """
+        self.client.post(self.url, self.payload, format='json')
+
+        with self.assertNumQueries(1):
+            self.client.post(self.url, self.payload, format='json')
@@ -1,3 +1,9 @@
 from django.contrib import admin
+from .models import PlatformStatistics
 
-# Register your models here.
+
+@admin.register(PlatformStatistics)
+class PlatformStatisticsAdmin(admin.ModelAdmin):
+    """Admin configuration for PlatformStatistics model."""
+    list_display = ('review_count', 'rating_sum', 'business_profile_count', 'offer_count', 'reconciled_at')
+    readonly_fields = ('review_count', 'rating_sum', 'business_profile_count', 'offer_count', 'reconciled_at')
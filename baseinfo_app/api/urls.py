@@ -1,7 +1,12 @@
 from django.urls import path
 
-from .views import BaseInfoView
+from .views import AsyncBaseInfoView, BaseInfoView
 
 urlpatterns = [
     path('base-info/', BaseInfoView.as_view(), name='baseinfo'),
 ]
+
+# Served in front of urlpatterns by core.async_urls when ASYNC_READ_VIEWS is enabled.
+async_urlpatterns = [
+    path('base-info/', AsyncBaseInfoView.as_view(sync_view=BaseInfoView.as_view()), name='baseinfo'),
+]
@@ -1,29 +1,42 @@
-from django.db import models
-
 from rest_framework import generics, mixins, status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from review_app.models import Reviews
-from offer_app.models import Offer
-from profile_app.models import Profile
+from core.async_views import AsyncReadView
+from core.response_cache import AnonymousResponseCacheMixin
+
+from ..models import PlatformStatistics
+
+def base_info_data(stats):
+    """Return the response data of /api/base-info/ for a statistics row."""
+    return {
+        'review_count': stats.review_count,
+        'average_rating': stats.average_rating,
+        'business_profile_count': stats.business_profile_count,
+        'offer_count': stats.offer_count,
+    }
 
-class BaseInfoView(mixins.ListModelMixin, generics.GenericAPIView):
+
+class BaseInfoView(AnonymousResponseCacheMixin, mixins.ListModelMixin, generics.GenericAPIView):
     """API view for retrieving base platform statistics."""
+    response_cache_namespace = 'base-info'
     permission_classes = [AllowAny]
 
     def get(self, request, *args, **kwargs):
-        """Return platform statistics including reviews, ratings, businesses, and offers."""
-        review_count = Reviews.objects.all().count()
-        average_rating = Reviews.objects.aggregate(avg_rating=models.Avg('rating'))['avg_rating'] or 0
-        business_profile_count = Profile.objects.filter(type='business').count()
-        offer_count = Offer.objects.all().count()
-
-
-        data = {
-            'review_count': review_count,
-            'average_rating': average_rating,
-            'business_profile_count': business_profile_count,
-            'offer_count': offer_count,
-        }
-        return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file
+        """Return platform statistics including reviews, ratings, businesses, and offers.
+
+        The values come from the incrementally maintained statistics row, so
+        this is a single primary key lookup.
+        """
+        stats = PlatformStatistics.current()
+        return Response(base_info_data(stats), status=status.HTTP_200_OK)
+
+
+
+class AsyncBaseInfoView(AsyncReadView):
+    """Async variant of BaseInfoView."""
+    response_cache_namespace = 'base-info'
+    permission_classes = [AllowAny]
+
+    async def get_data(self, request):
+        return base_info_data(await PlatformStatistics.acurrent())
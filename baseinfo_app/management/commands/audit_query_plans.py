@@ -0,0 +1,133 @@
+import re
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.test import RequestFactory, override_settings
+from django.urls import resolve, reverse
+from rest_framework.test import force_authenticate
+
+from offer_app.models import Offer, OfferDetail
+from order_app.models import Orders
+from profile_app.models import Profile
+from review_app.models import Reviews
+
+FULL_SCAN_PATTERNS = {
+    # A bare "SCAN <table>" line, i.e. without "USING [COVERING] INDEX".
+    'sqlite': re.compile(r'\bSCAN (?!CONSTANT ROW)(\S+)$', re.MULTILINE),
+    'postgresql': re.compile(r'Seq Scan on (\S+)'),
+}
+
+
+def seed_audit_data():
+    """Create one row per audited table, so the endpoints run all their queries, and return the IDs."""
+    business = User.objects.create_user(username='query-plan-audit-business')
+    Profile.objects.create(user=business, type='business')
+    customer = User.objects.create_user(username='query-plan-audit-customer')
+    Profile.objects.create(user=customer, type='customer')
+    offer = Offer.objects.create(user=business, title='Audit', description='Audit')
+    detail = OfferDetail.objects.create(
+        offer=offer, title='Audit', revisions=1, delivery_time_in_days=3, price=100, features=[], offer_type='basic'
+    )
+    Orders.objects.create(offer_detail=detail, customer_user=customer, business_user=business)
+    Reviews.objects.create(reviewer=customer, business_user=business, rating=5, description='Audit')
+    return customer, {'business': business.pk, 'customer': customer.pk, 'offer': offer.pk, 'detail': detail.pk}
+
+
+def canonical_requests(ids):
+    """Return (name, url name, url kwargs, query params) of the filter paths of the API endpoints."""
+    return [
+        ('offers: list', 'offers-list', {}, {}),
+        ('offers: by creator', 'offers-list', {}, {'creator_id': ids['business']}),
+        ('offers: by min price', 'offers-list', {}, {'min_price': 100, 'ordering': 'min_price'}),
+        ('offers: by delivery time', 'offers-list', {}, {'max_delivery_time': 7}),
+        ('offers: cursor', 'offers-list', {}, {'cursor': ''}),
+        ('offers: cursor by min price', 'offers-list', {}, {'cursor': '', 'ordering': '-min_price'}),
+        ('offers: detail', 'offers-detail', {'pk': ids['offer']}, {}),
+        ('offers: offer detail', 'offer-details', {'pk': ids['detail']}, {}),
+        ('reviews: list', 'reviews-list', {}, {}),
+        ('reviews: by rating', 'reviews-list', {}, {'ordering': 'rating'}),
+        ('reviews: by business user', 'reviews-list', {}, {'business_user_id': ids['business']}),
+        ('reviews: by reviewer', 'reviews-list', {}, {'reviewer_id': ids['customer']}),
+        ('orders: list', 'orders-list', {}, {}),
+        ('orders: counts', 'order-counts', {'pk': ids['business']}, {}),
+        ('profiles: business', 'profilesListBusiness', {}, {}),
+        ('profiles: business by rating', 'profilesListBusiness', {}, {'ordering': '-average_rating'}),
+        ('profiles: business by min rating', 'profilesListBusiness', {}, {'min_rating': 4, 'page': 1}),
+        ('profiles: business by min review count', 'profilesListBusiness', {}, {'min_review_count': 1}),
+        ('profiles: customer', 'profilesListCustomer', {}, {}),
+        ('profiles: detail', 'profileGetPatch', {'pk': ids['business']}, {}),
+    ]
+
+
+def capture_queries(url_name, kwargs, params, user, using):
+    """Send a GET request through the endpoint's view and return the (sql, params) of its SELECTs."""
+    request = RequestFactory().get(reverse(url_name, kwargs=kwargs), params)
+    force_authenticate(request, user=user)
+    match = resolve(request.path_info)
+    queries = []
+
+    def capture(execute, sql, sql_params, many, context):
+        if sql.lstrip().upper().startswith('SELECT'):
+            queries.append((sql, sql_params))
+        return execute(sql, sql_params, many, context)
+
+    # The serializers build absolute URLs from the request's host.
+    with override_settings(ALLOWED_HOSTS=[request.META['SERVER_NAME']]), connections[using].execute_wrapper(capture):
+        match.func(request, *match.args, **match.kwargs).render()
+    return queries
+
+
+def explain(connection, sql, params):
+    """Return the query plan of a raw query as text."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+        return '\n'.join(str(row[-1]) for row in cursor.fetchall())
+
+
+class Command(BaseCommand):
+    """Explain the queries of the API endpoints' filter paths and fail on full table scans."""
+    help = (
+        'Send GET requests for the filter paths of the API endpoints through their views, run EXPLAIN '
+        'on every query they issue and fail if any of them scans a whole table. A few rows of audit data '
+        'are created in a transaction that is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias to explain the queries on.')
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the full plan of every query.')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f'Query plan audit is not supported for {connection.vendor}.')
+
+        failures = []
+        # The audit data is rolled back at the end.
+        with transaction.atomic(using=options['database']):
+            user, ids = seed_audit_data()
+
+            if connection.vendor == 'postgresql':
+                # Small tables are scanned sequentially no matter which indexes
+                # exist; this makes the planner use an index whenever there is one.
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for name, url_name, kwargs, params in canonical_requests(ids):
+                scanned = []
+                for sql, sql_params in capture_queries(url_name, kwargs, params, user, options['database']):
+                    plan = explain(connection, sql, sql_params)
+                    scanned.extend(table for table in pattern.findall(plan) if table not in scanned)
+                    if options['verbose_plans']:
+                        self.stdout.write(f'{name}:\n{sql}\n{plan}\n')
+                if scanned:
+                    failures.append(name)
+                    self.stdout.write(self.style.ERROR(f'{name}: full scan of {", ".join(scanned)}'))
+                else:
+                    self.stdout.write(f'{name}: ok')
+            transaction.set_rollback(True, using=options['database'])
+
+        if failures:
+            raise CommandError(f'{len(failures)} endpoint filter paths fall back to a full table scan.')
+        self.stdout.write(self.style.SUCCESS('All endpoint queries use an index.'))
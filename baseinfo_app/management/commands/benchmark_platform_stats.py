@@ -0,0 +1,102 @@
+import time
+from itertools import islice
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.test.utils import CaptureQueriesContext
+
+from baseinfo_app.models import PlatformStatistics
+from offer_app.models import Offer
+from profile_app.models import Profile
+from review_app.models import Reviews
+
+BATCH_SIZE = 5000
+
+
+def compute_separately():
+    """Compute the platform statistics with one query per source table, as before."""
+    reviews = Reviews.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    return {
+        'review_count': reviews['review_count'],
+        'rating_sum': reviews['rating_sum'] or 0,
+        'business_profile_count': Profile.objects.filter(type='business').count(),
+        'offer_count': Offer.objects.count(),
+    }
+
+
+def bulk_insert(model, objects):
+    """Insert the objects of a generator in batches."""
+    objects = iter(objects)
+    while batch := list(islice(objects, BATCH_SIZE)):
+        model.objects.bulk_create(batch)
+
+
+class Command(BaseCommand):
+    """Compare the separate base-info aggregate queries with the single combined query."""
+    help = (
+        'Seed reviews, offers and profiles inside a transaction that is rolled back afterwards and time '
+        'PlatformStatistics.compute() against one query per table. The data is seeded into the live default '
+        'database, which stays write-locked (BEGIN IMMEDIATE on SQLite) from the start of the seed until the '
+        'rollback, so do not run it against a database that serves traffic.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reviews', type=int, default=1_000_000, help='Reviews to seed.')
+        parser.add_argument('--offers', type=int, default=10_000, help='Offers to seed.')
+        parser.add_argument('--users', type=int, default=1000, help='Users to seed, half of them businesses.')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per variant.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            started = time.perf_counter()
+            self.seed(options)
+            self.stdout.write(f'seeded in {time.perf_counter() - started:.1f} s')
+
+            variants = [('separate', compute_separately), ('combined', PlatformStatistics.compute)]
+            results, timings = {}, {name: [] for name, _ in variants}
+            for name, compute in variants:
+                with CaptureQueriesContext(connection) as queries:
+                    results[name] = compute()
+                timings[name].append(len(queries))
+            for _ in range(options['repeat']):
+                for name, compute in variants:
+                    started = time.perf_counter()
+                    compute()
+                    timings[name].append((time.perf_counter() - started) * 1000)
+
+            for name, (query_count, *runs) in timings.items():
+                runs.sort()
+                self.stdout.write(
+                    f'{name:<9} {query_count} queries   best {runs[0]:>8.1f} ms   '
+                    f'median {runs[len(runs) // 2]:>8.1f} ms'
+                )
+            if results['separate'] != results['combined']:
+                self.stdout.write(self.style.ERROR(f'results differ: {results}'))
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        prefix = f'benchmark-{time.time_ns()}'
+        users = options['users']
+        bulk_insert(User, (User(username=f'{prefix}-{index}') for index in range(users)))
+        user_ids = list(User.objects.filter(username__startswith=prefix).values_list('pk', flat=True))
+        businesses, customers = user_ids[::2], user_ids[1::2] or user_ids
+
+        bulk_insert(Profile, (
+            Profile(user_id=pk, type='business' if index % 2 == 0 else 'customer')
+            for index, pk in enumerate(user_ids)
+        ))
+        bulk_insert(Offer, (
+            Offer(user_id=businesses[index % len(businesses)], title='Offer', description='Benchmark')
+            for index in range(options['offers'])
+        ))
+        bulk_insert(Reviews, (
+            Reviews(
+                reviewer_id=customers[index % len(customers)],
+                business_user_id=businesses[index % len(businesses)],
+                rating=index % 5 + 1,
+                description='Benchmark',
+            )
+            for index in range(options['reviews'])
+        ))
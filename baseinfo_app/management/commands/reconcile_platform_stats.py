@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from baseinfo_app.models import PlatformStatistics
+from core.response_cache import invalidate_namespace
+
+
+class Command(BaseCommand):
+    """Recompute the platform statistics served by /api/base-info/ from the source tables."""
+    help = 'Reconcile the stored platform statistics, or report drift with --check.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report counters that differ from the source tables, without writing.',
+        )
+
+    def handle(self, *args, **options):
+        expected = PlatformStatistics.compute()
+        stored = PlatformStatistics.objects.filter(pk=PlatformStatistics.SINGLETON_PK).first()
+
+        drift = {
+            field: (getattr(stored, field, None), value)
+            for field, value in expected.items()
+            if getattr(stored, field, None) != value
+        }
+        for field, (stored_value, value) in drift.items():
+            self.stdout.write(f'{field}: stored {stored_value}, actual {value}')
+
+        if options['check']:
+            if drift:
+                raise CommandError(f'{len(drift)} platform statistics counters have drifted.')
+            self.stdout.write(self.style.SUCCESS('Platform statistics are up to date.'))
+            return
+
+        PlatformStatistics.reconcile()
+        invalidate_namespace('base-info')
+        self.stdout.write(self.style.SUCCESS('Platform statistics reconciled.'))
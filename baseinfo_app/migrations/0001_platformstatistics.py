@@ -0,0 +1,53 @@
+# Generated by Django 5.2.8 on 2026-10-18 00:54
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+
+def initialize_statistics(apps, schema_editor):
+    PlatformStatistics = apps.get_model('baseinfo_app', 'PlatformStatistics')
+    Reviews = apps.get_model('review_app', 'Reviews')
+    Profile = apps.get_model('profile_app', 'Profile')
+    Offer = apps.get_model('offer_app', 'Offer')
+
+    reviews = Reviews.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    PlatformStatistics.objects.update_or_create(
+        pk=1,
+        defaults={
+            'review_count': reviews['review_count'],
+            'rating_sum': reviews['rating_sum'] or 0,
+            'business_profile_count': Profile.objects.filter(type='business').count(),
+            'offer_count': Offer.objects.count(),
+            'reconciled_at': timezone.now(),
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('offer_app', '0006_offer_search_index'),
+        ('profile_app', '0001_initial'),
+        ('review_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformStatistics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.BigIntegerField(default=0)),
+                ('business_profile_count', models.IntegerField(default=0)),
+                ('offer_count', models.IntegerField(default=0)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Platform statistics',
+            },
+        ),
+        migrations.RunPython(initialize_statistics, migrations.RunPython.noop),
+    ]
@@ -1 +1,128 @@
-from django.db import models
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, router
+from django.db.models import F
+from django.utils import timezone
+
+RECONCILE_LOCK_KEY = 'platform-statistics:reconcile-lock'
+RECONCILE_LOCK_TIMEOUT = 300
+
+
+class SubqueryCount(models.Subquery):
+    """Uncorrelated scalar subquery counting the rows of a queryset.
+
+    It yields a single value for the whole result, so it may be selected
+    next to aggregates in `QuerySet.aggregate()`.
+    """
+    template = '(SELECT COUNT(*) FROM (%(subquery)s) _count)'
+    output_field = models.IntegerField()
+    contains_aggregate = True
+
+
+class PlatformStatistics(models.Model):
+    """Single-row table with the platform counters served by /api/base-info/.
+
+    The counters are adjusted incrementally by signals (see signals.py) and
+    recomputed from the source tables by `reconcile()`, which runs from the
+    `reconcile_platform_stats` command and, once the last reconciliation is
+    older than `settings.BASE_INFO_STATS_MAX_AGE` seconds, by a single
+    request (see `current()`).
+    """
+    SINGLETON_PK = 1
+
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.BigIntegerField(default=0)
+    business_profile_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = "Platform statistics"
+
+    @property
+    def average_rating(self):
+        """Return the average review rating, or 0 if there are no reviews."""
+        if not self.review_count:
+            return 0
+        return self.rating_sum / self.review_count
+
+    @property
+    def is_stale(self):
+        """Return True if the counters have not been reconciled within the staleness bound."""
+        max_age = timedelta(seconds=settings.BASE_INFO_STATS_MAX_AGE)
+        return self.reconciled_at is None or timezone.now() - self.reconciled_at > max_age
+
+    @classmethod
+    def compute(cls, using=None):
+        """Compute all counters from the source tables in a single query on database `using`."""
+        from offer_app.models import Offer
+        from profile_app.models import Profile
+        from review_app.models import Reviews
+
+        stats = Reviews.objects.using(using).aggregate(
+            review_count=models.Count('id'),
+            rating_sum=models.Sum('rating'),
+            business_profile_count=SubqueryCount(Profile.objects.filter(type='business').values('pk')),
+            offer_count=SubqueryCount(Offer.objects.values('pk')),
+        )
+        return {**stats, 'rating_sum': stats['rating_sum'] or 0}
+
+    @classmethod
+    def reconcile(cls):
+        """Recompute all counters from the source tables and store them.
+
+        The counters are read from the database they are written to, not
+        from a replica that may lag behind.
+        """
+        using = router.db_for_write(cls)
+        stats, _ = cls.objects.using(using).update_or_create(
+            pk=cls.SINGLETON_PK,
+            defaults={**cls.compute(using=using), 'reconciled_at': timezone.now()},
+        )
+        return stats
+
+    @classmethod
+    def current(cls):
+        """Return the stored counters, computing them if they are missing.
+
+        Stale counters are reconciled by the one request that gets the
+        reconcile lock, all other requests serve the stale row meanwhile.
+        """
+        stats = cls.objects.filter(pk=cls.SINGLETON_PK).first()
+        if stats is None:
+            return cls.reconcile()
+        if stats.is_stale and cache.add(RECONCILE_LOCK_KEY, True, RECONCILE_LOCK_TIMEOUT):
+            try:
+                stats = cls.reconcile()
+            finally:
+                cache.delete(RECONCILE_LOCK_KEY)
+        return stats
+
+    @classmethod
+    async def acurrent(cls):
+        """Async variant of `current()`, reconciling in a worker thread when needed."""
+        stats = await cls.objects.filter(pk=cls.SINGLETON_PK).afirst()
+        if stats is None:
+            return await sync_to_async(cls.reconcile)()
+        if stats.is_stale and await cache.aadd(RECONCILE_LOCK_KEY, True, RECONCILE_LOCK_TIMEOUT):
+            try:
+                stats = await sync_to_async(cls.reconcile)()
+            finally:
+                await cache.adelete(RECONCILE_LOCK_KEY)
+        return stats
+
+    @classmethod
+    def increment(cls, **deltas):
+        """Atomically add the given deltas to the stored counters."""
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        updated = cls.objects.filter(pk=cls.SINGLETON_PK).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+        if not updated:
+            cls.reconcile()
@@ -0,0 +1,66 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.response_cache import invalidate_namespace
+from offer_app.models import Offer
+from profile_app.models import Profile
+from review_app.models import Reviews
+
+from .models import PlatformStatistics
+
+
+@receiver(post_save, sender=Reviews)
+def review_saved(sender, instance, created, **kwargs):
+    """Count a new review and apply rating changes to the rating sum."""
+    if created:
+        PlatformStatistics.increment(review_count=1, rating_sum=instance.rating)
+    else:
+        loaded_rating = getattr(instance, '_loaded_rating', None)
+        if loaded_rating is None:
+            PlatformStatistics.reconcile()
+        else:
+            PlatformStatistics.increment(rating_sum=instance.rating - loaded_rating)
+
+
+@receiver(post_delete, sender=Reviews)
+def review_deleted(sender, instance, **kwargs):
+    """Remove a deleted review from the counters."""
+    PlatformStatistics.increment(review_count=-1, rating_sum=-instance.rating)
+
+
+@receiver(post_save, sender=Profile)
+def profile_saved(sender, instance, created, **kwargs):
+    """Count a new business profile."""
+    if created and instance.type == 'business':
+        PlatformStatistics.increment(business_profile_count=1)
+
+
+@receiver(post_delete, sender=Profile)
+def profile_deleted(sender, instance, **kwargs):
+    """Remove a deleted business profile from the counters."""
+    if instance.type == 'business':
+        PlatformStatistics.increment(business_profile_count=-1)
+
+
+@receiver(post_save, sender=Offer)
+def offer_saved(sender, instance, created, **kwargs):
+    """Count a new offer."""
+    if created:
+        PlatformStatistics.increment(offer_count=1)
+
+
+@receiver(post_delete, sender=Offer)
+def offer_deleted(sender, instance, **kwargs):
+    """Remove a deleted offer from the counters."""
+    PlatformStatistics.increment(offer_count=-1)
+
+
+@receiver(post_save, sender=Reviews)
+@receiver(post_delete, sender=Reviews)
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_base_info_cache(sender, **kwargs):
+    """Drop cached base-info responses after the counters changed."""
+    invalidate_namespace('base-info')
@@ -1,10 +1,20 @@
+from io import StringIO
+
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+from django.utils import timezone
 from unittest.mock import patch
 
+from baseinfo_app.models import RECONCILE_LOCK_KEY, PlatformStatistics
+from core.query_budget import QueryBudgetMixin
 from profile_app.models import Profile
 from offer_app.models import Offer
+from review_app.api.views import ReviewsViewSet
 from review_app.models import Reviews
 
 
@@ -265,4 +275,295 @@ class BaseInfoUnhappyPathTests(APITestCase):
         
         self.assertEqual(response.status_code, 405)
 
-   
\ No newline at end of file
+   
+
+class PlatformStatisticsTests(APITestCase):
+    """
+    Tests für die inkrementell gepflegten Plattform-Statistiken
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        self.customer_user = User.objects.create_user(username='customer1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        Profile.objects.create(user=self.customer_user, type='customer')
+        self.offer = Offer.objects.create(user=self.business_user, title='Offer', description='Test')
+        self.review = Reviews.objects.create(
+            reviewer=self.customer_user,
+            business_user=self.business_user,
+            rating=4,
+            description='Gut'
+        )
+        PlatformStatistics.objects.filter(pk=PlatformStatistics.SINGLETON_PK).update(reconciled_at=timezone.now())
+
+    def test_base_info_is_served_with_one_query(self):
+        """
+        Die Statistiken werden mit einer einzigen Query gelesen
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('baseinfo'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['review_count'], 1)
+        self.assertEqual(response.data['average_rating'], 4)
+        self.assertEqual(response.data['business_profile_count'], 1)
+        self.assertEqual(response.data['offer_count'], 1)
+
+    def test_rating_update_changes_average(self):
+        """
+        Eine geänderte Bewertung wird in den Durchschnitt übernommen
+        """
+        review = Reviews.objects.get(pk=self.review.pk)
+        review.rating = 2
+        review.save()
+
+        response = self.client.get(reverse('baseinfo'))
+
+        self.assertEqual(response.data['review_count'], 1)
+        self.assertEqual(response.data['average_rating'], 2)
+
+    def test_stale_statistics_are_reconciled(self):
+        """
+        Veraltete Statistiken werden beim nächsten Request neu berechnet
+        """
+        PlatformStatistics.objects.update(offer_count=99)
+
+        response = self.client.get(reverse('baseinfo'))
+        self.assertEqual(response.data['offer_count'], 99)
+
+        cache.clear()
+        with override_settings(BASE_INFO_STATS_MAX_AGE=0):
+            response = self.client.get(reverse('baseinfo'))
+        self.assertEqual(response.data['offer_count'], 1)
+
+    def test_stale_statistics_are_served_while_reconciling(self):
+        """
+        Solange ein anderer Request die Statistiken neu berechnet, werden die veralteten ausgeliefert
+        """
+        PlatformStatistics.objects.update(offer_count=99)
+        cache.add(RECONCILE_LOCK_KEY, True)
+
+        with override_settings(BASE_INFO_STATS_MAX_AGE=0), self.assertNumQueries(1):
+            response = self.client.get(reverse('baseinfo'))
+
+        self.assertEqual(response.data['offer_count'], 99)
+
+    def test_missing_statistics_are_computed(self):
+        """
+        Fehlt die Zeile, wird sie beim Request sofort berechnet
+        """
+        PlatformStatistics.objects.all().delete()
+
+        response = self.client.get(reverse('baseinfo'))
+
+        self.assertEqual(response.data['offer_count'], 1)
+        self.assertEqual(response.data['review_count'], 1)
+
+    def test_reconcile_command(self):
+        """
+        Der Management-Command erkennt und behebt Abweichungen
+        """
+        PlatformStatistics.objects.update(review_count=7)
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_platform_stats', '--check', stdout=StringIO())
+
+        call_command('reconcile_platform_stats', stdout=StringIO())
+        call_command('reconcile_platform_stats', '--check', stdout=StringIO())
+        self.assertEqual(PlatformStatistics.current().review_count, 1)
+
+    def test_compute_uses_one_query(self):
+        """
+        Die Neuberechnung liest alle vier Werte mit einer einzigen Query
+        """
+        Profile.objects.create(
+            user=User.objects.create_user(username='business2', password='testpass123'), type='business'
+        )
+
+        with self.assertNumQueries(1):
+            stats = PlatformStatistics.compute()
+
+        self.assertEqual(stats, {
+            'review_count': 1,
+            'rating_sum': 4,
+            'business_profile_count': 2,
+            'offer_count': 1,
+        })
+
+    def test_compute_without_reviews(self):
+        """
+        Ohne Bewertungen werden die übrigen Zähler trotzdem berechnet
+        """
+        Reviews.objects.all().delete()
+
+        stats = PlatformStatistics.compute()
+
+        self.assertEqual(stats['review_count'], 0)
+        self.assertEqual(stats['rating_sum'], 0)
+        self.assertEqual(stats['business_profile_count'], 1)
+        self.assertEqual(stats['offer_count'], 1)
+
+    def test_base_info_is_served_from_cache_with_etag(self):
+        """
+        Wiederholte Anfragen kommen ohne Query aus und lassen sich per ETag mit 304 revalidieren
+        """
+        etag = self.client.get(reverse('baseinfo'))['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('baseinfo'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_review_write_invalidates_cached_base_info(self):
+        """
+        Eine neue Bewertung verwirft die gecachte Antwort
+        """
+        etag = self.client.get(reverse('baseinfo'))['ETag']
+
+        Reviews.objects.create(
+            reviewer=self.customer_user,
+            business_user=User.objects.create_user(username='business2', password='testpass123'),
+            rating=2,
+            description='Geht so'
+        )
+        response = self.client.get(reverse('baseinfo'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['review_count'], 2)
+        self.assertEqual(response.data['average_rating'], 3)
+
+
+class QueryPlanAuditTests(APITestCase):
+    """
+    Tests für den Management-Command audit_query_plans
+    """
+
+    def test_endpoint_queries_use_indexes(self):
+        """
+        Alle Queries der Endpoint-Filterpfade nutzen einen Index
+        """
+        out = StringIO()
+
+        call_command('audit_query_plans', stdout=out)
+
+        self.assertIn('All endpoint queries use an index.', out.getvalue())
+        self.assertIn('orders: list: ok', out.getvalue())
+
+    def test_audit_data_is_rolled_back(self):
+        """
+        Die Audit-Testdaten werden nach dem Command wieder entfernt
+        """
+        call_command('audit_query_plans', stdout=StringIO())
+
+        self.assertEqual(User.objects.count(), 0)
+        self.assertEqual(Offer.objects.count(), 0)
+
+    def test_full_table_scan_fails(self):
+        """
+        Ein Endpoint, dessen Query keinen passenden Index hat, lässt den Command fehlschlagen
+        """
+        out = StringIO()
+
+        with patch.object(ReviewsViewSet, 'get_queryset', lambda view: Reviews.objects.filter(description='Test')):
+            with self.assertRaises(CommandError):
+                call_command('audit_query_plans', stdout=out)
+
+        self.assertIn('reviews: list: full scan of review_app_reviews', out.getvalue())
+
+
+class PlatformStatisticsBenchmarkTests(APITestCase):
+    """
+    Tests für den Benchmark der Plattform-Statistiken
+    """
+
+    def test_benchmark_command(self):
+        """
+        Test: benchmark_platform_stats vergleicht beide Varianten und verwirft die Testdaten
+        """
+        out = StringIO()
+
+        call_command(
+            'benchmark_platform_stats', '--reviews', '20', '--offers', '5', '--users', '4', '--repeat', '1',
+            stdout=out,
+        )
+
+        self.assertIn('separate  3 queries', out.getvalue())
+        self.assertIn('combined  1 queries', out.getvalue())
+        self.assertNotIn('results differ', out.getvalue())
+        self.assertFalse(Reviews.objects.exists())
+        self.assertFalse(User.objects.exists())
+
+
+class BaseInfoQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query-Budget Tests: /api/base-info/ darf nicht mit der Anzahl der Bewertungen wachsen
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.customer_user = User.objects.create_user(username='customer1', password='testpass123')
+        Profile.objects.create(user=self.customer_user, type='customer')
+        PlatformStatistics.current()
+
+    def create_reviews(self, count):
+        for i in range(count):
+            Reviews.objects.create(
+                business_user=self.business_user,
+                reviewer=self.customer_user,
+                rating=i % 5 + 1,
+                description=f'Review {i}'
+            )
+
+    def test_baseinfo_budget(self):
+        """
+        Die Plattform-Statistik bleibt bei 1 und 10 Bewertungen im Budget
+        """
+        self.assertQueryBudget('baseinfo', self.create_reviews)
+
+
+@override_settings(ROOT_URLCONF='core.async_urls')
+class AsyncBaseInfoViewTests(APITestCase):
+    """
+    Tests für die asynchrone Base-Info-View (ASYNC_READ_VIEWS)
+    """
+
+    def setUp(self):
+        business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=business_user, type='business')
+        customer_user = User.objects.create_user(username='customer1', password='testpass123')
+        Profile.objects.create(user=customer_user, type='customer')
+        Reviews.objects.create(business_user=business_user, reviewer=customer_user, rating=4, description='Gut')
+        Offer.objects.create(user=business_user, title='Logo Design', description='Logo')
+
+    def test_statistics(self):
+        """
+        Die asynchrone View liefert die Plattform-Statistik ohne Authentifizierung
+        """
+        response = self.client.get(reverse('baseinfo'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'review_count': 1, 'average_rating': 4.0, 'business_profile_count': 1, 'offer_count': 1
+        })
+
+    def test_response_is_cached(self):
+        """
+        Anonyme Antworten werden gecacht und per ETag revalidiert
+        """
+        etag = self.client.get(reverse('baseinfo'))['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('baseinfo'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_stale_statistics_are_reconciled(self):
+        """
+        Veraltete Statistiken werden auch im asynchronen Pfad neu berechnet
+        """
+        PlatformStatistics.objects.update(review_count=0, reconciled_at=None)
+
+        response = self.client.get(reverse('baseinfo'))
+
+        self.assertEqual(response.json()['review_count'], 1)
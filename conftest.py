@@ -0,0 +1,22 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache, cached responses do not survive the test database rollback."""
+    cache.clear()
+    yield
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Warn about endpoints in QUERY_BUDGETS that no test checked during a full run."""
+    from core.query_budget import QUERY_BUDGETS, checked_url_names
+
+    if not checked_url_names:
+        return
+    unchecked = sorted(set(QUERY_BUDGETS) - checked_url_names)
+    if unchecked:
+        terminalreporter.write_line(
+            'Query budgets without a test: ' + ', '.join(unchecked), yellow=True
+        )
@@ -0,0 +1,19 @@
+"""
+URL configuration of the ASGI serving path.
+
+Used as ROOT_URLCONF when ASYNC_READ_VIEWS is enabled: the async read views
+of the apps are matched first, everything else falls through to core.urls.
+"""
+from django.urls import include, path
+
+from baseinfo_app.api.urls import async_urlpatterns as baseinfo_async_urlpatterns
+from offer_app.api.urls import async_urlpatterns as offer_async_urlpatterns
+from order_app.api.urls import async_urlpatterns as order_async_urlpatterns
+
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path('api/', include(offer_async_urlpatterns)),
+    path('api/', include(order_async_urlpatterns)),
+    path('api/', include(baseinfo_async_urlpatterns)),
+] + sync_urlpatterns
@@ -0,0 +1,119 @@
+"""Async implementations of read-only endpoints for the ASGI serving path.
+
+With `ASYNC_READ_VIEWS` enabled, `core.async_urls` routes the hot read
+endpoints to subclasses of `AsyncReadView`, which read with the async ORM
+instead of blocking a worker thread for the whole request.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.http import Http404
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+from auth_app.api.authentication import ProfileTokenAuthentication
+
+from .response_cache import AnonymousResponseCacheMixin
+
+
+class AsyncReadView(AnonymousResponseCacheMixin, View):
+    """Serve GET/HEAD of an endpoint asynchronously, delegating everything else to its DRF view.
+
+    `sync_view` is the regular DRF view of the same URL and is passed to
+    `as_view()`. It handles unsafe methods, OPTIONS and requests for the
+    browsable API, and subclasses can hand over more requests through
+    `should_delegate()`. Subclasses implement `get_data()` with the async
+    ORM and may implement `get_etag()`. Authentication, permissions, errors,
+    ETags and the anonymous response cache (`response_cache_namespace`)
+    behave like in the DRF view, responses are always JSON.
+    """
+    sync_view = None
+    permission_classes = [IsAuthenticated]
+    authentication_class = ProfileTokenAuthentication
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # CSRF is enforced by DRF's session authentication, as for APIView.
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def dispatch(self, request, *args, **kwargs):
+        # The response cache is handled in get(), not by the sync mixin dispatch.
+        return View.dispatch(self, request, *args, **kwargs)
+
+    def should_delegate(self, request):
+        """Return True if the request is handled by `sync_view`."""
+        return 'text/html' in request.headers.get('Accept', '')
+
+    async def delegate(self, request, *args, **kwargs):
+        return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+
+    post = put = patch = delete = options = delegate
+
+    async def get(self, request, *args, **kwargs):
+        if self.should_delegate(request):
+            return await self.delegate(request, *args, **kwargs)
+
+        cacheable = self.response_cache_namespace is not None and self.is_response_cacheable(request)
+        if cacheable:
+            key = await sync_to_async(self.get_response_cache_key)(request)
+            entry = await cache.aget(key)
+            if entry is not None:
+                return self.cached_response(request, entry)
+
+        response = await self.build_response(request, *args, **kwargs)
+        if cacheable and response.status_code == 200:
+            return await sync_to_async(self.store_response)(key, response) or response
+        return response
+
+    async def build_response(self, request, *args, **kwargs):
+        """Authenticate, check permissions and ETag, and render the data of `get_data()`."""
+        drf_request = Request(request, authenticators=[])
+        etag = None
+        try:
+            await self.authenticate(drf_request)
+            self.check_permissions(drf_request)
+            etag = await self.get_etag(drf_request, *args, **kwargs)
+            if etag is not None:
+                not_modified = get_conditional_response(request, etag=etag)
+                if not_modified is not None:
+                    return not_modified
+            response = Response(await self.get_data(drf_request, *args, **kwargs))
+        except (exceptions.APIException, Http404) as exc:
+            if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                exc.auth_header = self.authentication_class().authenticate_header(drf_request)
+            response = exception_handler(exc, {'view': self, 'request': drf_request})
+
+        response.accepted_renderer = JSONRenderer()
+        response.accepted_media_type = 'application/json'
+        response.renderer_context = {'view': self, 'request': drf_request, 'response': response}
+        response.render()
+        patch_vary_headers(response, ('Accept',))
+        if etag is not None and response.status_code == 200:
+            response['ETag'] = etag
+        return response
+
+    async def authenticate(self, request):
+        user_auth = await self.authentication_class().aauthenticate(request)
+        request.user, request.auth = user_auth or (AnonymousUser(), None)
+
+    def check_permissions(self, request):
+        for permission_class in self.permission_classes:
+            if not permission_class().has_permission(request, self):
+                if not request.user.is_authenticated:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied()
+
+    async def get_etag(self, request, *args, **kwargs):
+        """Return the ETag of the requested resource, or None."""
+        return None
+
+    async def get_data(self, request, *args, **kwargs):
+        """Return the response data, reading with the async ORM."""
+        raise NotImplementedError
@@ -0,0 +1,40 @@
+"""Checks for features that share state between worker processes through the default cache."""
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured
+
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+# add() and incr() are single server-side operations here; the file and
+# database caches implement them as a read followed by a write.
+ATOMIC_COUNTER_BACKENDS = (BaseMemcachedCache, RedisCache)
+
+
+def is_shared_cache(alias='default'):
+    """Return True if the cache is visible to all worker processes."""
+    return not isinstance(caches[alias], PROCESS_LOCAL_BACKENDS)
+
+
+def has_atomic_counters(alias='default'):
+    """Return True if the cache is shared and its add() and incr() are atomic across processes."""
+    return isinstance(caches[alias], ATOMIC_COUNTER_BACKENDS)
+
+
+def require_shared_cache(feature, alias='default', atomic_counters=False):
+    """Raise ImproperlyConfigured if `feature` would keep its state in a per-process cache.
+
+    With `atomic_counters`, only memcached and redis are accepted.
+    """
+    if atomic_counters:
+        if not has_atomic_counters(alias):
+            raise ImproperlyConfigured(
+                f'{feature} needs atomic counters in a cache shared by all worker processes; '
+                'set CACHE_BACKEND to memcached or redis.'
+            )
+    elif not is_shared_cache(alias):
+        raise ImproperlyConfigured(
+            f'{feature} needs a cache shared by all worker processes; '
+            'set CACHE_BACKEND to file, memcached or redis.'
+        )
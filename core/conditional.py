@@ -0,0 +1,24 @@
+"""Validators for conditional GET requests on single resources."""
+import hashlib
+
+
+def timestamp_etag(queryset, *fields):
+    """Return a weak ETag built from the given timestamp fields of a single row.
+
+    Only the listed columns are selected, so computing the validator is much
+    cheaper than loading and serializing the object. Returns None if the row
+    does not exist, which lets the view answer with its regular 404.
+    """
+    return _row_etag(queryset.model, queryset.values_list(*fields).first())
+
+
+async def atimestamp_etag(queryset, *fields):
+    """Async variant of `timestamp_etag()` for the async read views."""
+    return _row_etag(queryset.model, await queryset.values_list(*fields).afirst())
+
+
+def _row_etag(model, row):
+    if row is None:
+        return None
+    digest = hashlib.md5(repr((model._meta.label, row)).encode('utf-8')).hexdigest()
+    return f'W/"{digest}"'
@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+
+class Command(BaseCommand):
+    """Compare the per-request cost of opening a new connection with reusing one."""
+    help = (
+        'Simulate requests against the configured database with CONN_MAX_AGE=0 '
+        '(new connection per request) and with persistent or pooled connections.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='Simulated requests per mode.')
+        parser.add_argument('--database', default='default', help='Database alias to benchmark.')
+        parser.add_argument('--max-age', type=int, default=600, help='CONN_MAX_AGE of the persistent mode.')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        settings_dict = connection.settings_dict
+        original_max_age = settings_dict['CONN_MAX_AGE']
+        pooled = bool(settings_dict['OPTIONS'].get('pool'))
+
+        modes = [('per-request', 0), ('pooled' if pooled else 'persistent', 0 if pooled else options['max_age'])]
+        try:
+            for mode, max_age in modes:
+                connection.close()
+                settings_dict['CONN_MAX_AGE'] = max_age
+                elapsed, opened = self.run_requests(connection, options['requests'])
+                self.stdout.write(
+                    f'{mode:<12} {elapsed / options["requests"] * 1000:>8.3f} ms/request   '
+                    f'connections opened {opened}'
+                )
+        finally:
+            connection.close()
+            settings_dict['CONN_MAX_AGE'] = original_max_age
+
+    def run_requests(self, connection, count):
+        """Run `count` request cycles of one query and return (seconds, connections opened)."""
+        opened = []
+
+        def on_connection_created(sender, connection, **kwargs):
+            opened.append(connection.alias)
+
+        connection_created.connect(on_connection_created)
+        try:
+            started = time.perf_counter()
+            for _ in range(count):
+                request_started.send(sender=self.__class__)
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+                request_finished.send(sender=self.__class__)
+            elapsed = time.perf_counter() - started
+        finally:
+            connection_created.disconnect(on_connection_created)
+        return elapsed, len(opened)
@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.db import SQLITE_PROFILES, sqlite_options
+
+
+def connect(path, options):
+    """Open a SQLite connection the way Django does for the given OPTIONS."""
+    conn = sqlite3.connect(path, timeout=options.get('timeout', 5), isolation_level=None)
+    for command in options.get('init_command', '').split(';'):
+        if command.strip():
+            conn.execute(command)
+    return conn
+
+
+def run_worker(path, options, role, duration, results):
+    """Run reads or order-like write transactions until `duration` seconds have passed."""
+    conn = connect(path, options)
+    begin = f"BEGIN {options.get('transaction_mode', 'DEFERRED')}"
+    done = errors = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        try:
+            if role == 'writer':
+                conn.execute(begin)
+                conn.execute('SELECT COUNT(*) FROM bench_orders WHERE status = ?', ('in_progress',)).fetchone()
+                conn.execute(
+                    'INSERT INTO bench_orders (status, payload) VALUES (?, ?)', ('in_progress', 'x' * 200)
+                )
+                conn.execute('COMMIT')
+            else:
+                conn.execute('SELECT id, payload FROM bench_orders ORDER BY id DESC LIMIT 20').fetchall()
+            done += 1
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+    conn.close()
+    results.put((role, done, errors))
+
+
+class Command(BaseCommand):
+    """Measure reader/writer throughput of the SQLite profiles with several worker processes."""
+    help = 'Benchmark concurrent SQLite reads and writes per tuning profile on a temporary database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile',
+            action='append',
+            choices=sorted(SQLITE_PROFILES),
+            help='Profile to benchmark, can be repeated (default: all profiles).',
+        )
+        parser.add_argument('--readers', type=int, default=4, help='Number of reader processes.')
+        parser.add_argument('--writers', type=int, default=4, help='Number of writer processes.')
+        parser.add_argument('--duration', type=float, default=5, help='Seconds per profile.')
+
+    def handle(self, *args, **options):
+        if options['readers'] + options['writers'] < 1:
+            raise CommandError('At least one reader or writer process is needed.')
+
+        for profile in options['profile'] or sorted(SQLITE_PROFILES):
+            reads, writes, errors = self.benchmark(profile, options)
+            duration = options['duration']
+            self.stdout.write(
+                f'{profile:<12} reads/s {reads / duration:>10.0f}   writes/s {writes / duration:>8.0f}   '
+                f'locked errors {errors}'
+            )
+
+    def benchmark(self, profile, options):
+        db_options = sqlite_options(profile)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'benchmark.sqlite3')
+            conn = connect(path, db_options)
+            conn.execute(
+                'CREATE TABLE bench_orders (id INTEGER PRIMARY KEY, status TEXT NOT NULL, payload TEXT NOT NULL)'
+            )
+            conn.execute('CREATE INDEX bench_orders_status ON bench_orders (status)')
+            conn.executemany(
+                'INSERT INTO bench_orders (status, payload) VALUES (?, ?)',
+                [('completed', 'x' * 200)] * 1000,
+            )
+            conn.close()
+
+            results = multiprocessing.Queue()
+            roles = ['reader'] * options['readers'] + ['writer'] * options['writers']
+            workers = [
+                multiprocessing.Process(
+                    target=run_worker, args=(path, db_options, role, options['duration'], results)
+                )
+                for role in roles
+            ]
+            for worker in workers:
+                worker.start()
+            totals = {'reader': 0, 'writer': 0, 'errors': 0}
+            for _ in workers:
+                role, done, errors = results.get()
+                totals[role] += done
+                totals['errors'] += errors
+            for worker in workers:
+                worker.join()
+        return totals['reader'], totals['writer'], totals['errors']
@@ -0,0 +1,34 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    """Copy the primary SQLite database to the SQLite replicas for local replica setups."""
+    help = 'Copy the primary SQLite database to all SQLite replicas with the online backup API.'
+
+    def handle(self, *args, **options):
+        primary = connections['default']
+        if primary.vendor != 'sqlite':
+            raise CommandError('The primary database is not SQLite, replicas are kept in sync by the database server.')
+
+        replicas = [alias for alias in settings.DATABASE_REPLICAS if connections[alias].vendor == 'sqlite']
+        if not replicas:
+            self.stdout.write('No SQLite replicas configured (DATABASE_REPLICA_URLS).')
+            return
+
+        source = sqlite3.connect(primary.settings_dict['NAME'])
+        try:
+            for alias in replicas:
+                connections[alias].close()
+                target = sqlite3.connect(connections[alias].settings_dict['NAME'])
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(f'{alias}: copied from default')
+        finally:
+            source.close()
+        self.stdout.write(self.style.SUCCESS(f'{len(replicas)} SQLite replicas synced.'))
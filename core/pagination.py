@@ -0,0 +1,19 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    """Page number pagination that clients opt into.
+
+    Without `?page=` or `?page_size=` the list is returned unpaginated as a
+    plain JSON array, so existing clients keep working. With either
+    parameter the response has the usual `count`/`next`/`previous`/`results`
+    envelope.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not ({self.page_query_param, self.page_size_query_param} & set(request.query_params)):
+            return None
+        return super().paginate_queryset(queryset, request, view)
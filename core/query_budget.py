@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Maximum number of queries per endpoint, keyed by URL name. Measured with an
+# authenticated client (force_authenticate) and a cold response cache, token
+# authentication adds at most one query on top.
+QUERY_BUDGETS = {
+    'offers-list': 3,
+    'offers-detail': 3,
+    'orders-list': 1,
+    'reviews-list': 1,
+    'profilesListBusiness': 1,
+    'profilesListCustomer': 1,
+    'baseinfo': 1,
+}
+
+# URL names checked during the test run, reported by the pytest plugin in conftest.py.
+checked_url_names = set()
+
+
+def count_queries(client, url, params=None):
+    """Request `url` with a cold response cache and return (response, captured queries)."""
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, params)
+    return response, context.captured_queries
+
+
+def assert_query_budget(client, url_name, populate, kwargs=None, params=None, sizes=(1, 10)):
+    """Fail if the endpoint `url_name` issues more queries for more objects or exceeds its budget.
+
+    `populate(count)` must add `count` objects to what the endpoint returns;
+    it is called until `sizes[0]`, then `sizes[1]` objects exist, and the
+    endpoint is requested after each step.
+    """
+    budget = QUERY_BUDGETS[url_name]
+    url = reverse(url_name, kwargs=kwargs)
+    checked_url_names.add(url_name)
+
+    counts = []
+    created = 0
+    for size in sizes:
+        populate(size - created)
+        created = size
+        response, queries = count_queries(client, url, params)
+        assert response.status_code == 200, f'{url_name} returned {response.status_code}'
+        counts.append(len(queries))
+
+        if len(queries) > budget:
+            raise AssertionError(
+                f'{url_name} issued {len(queries)} queries with {size} objects, budget is {budget}:\n'
+                + '\n'.join(query['sql'] for query in queries)
+            )
+
+    if counts[-1] > counts[0]:
+        raise AssertionError(
+            f'{url_name} query count grows with the number of objects: '
+            + ', '.join(f'{size} objects: {count}' for size, count in zip(sizes, counts))
+        )
+
+
+class QueryBudgetMixin:
+    """TestCase mixin checking endpoints against QUERY_BUDGETS with `self.client`."""
+
+    def assertQueryBudget(self, url_name, populate, kwargs=None, params=None, sizes=(1, 10)):
+        assert_query_budget(self.client, url_name, populate, kwargs=kwargs, params=params, sizes=sizes)
@@ -0,0 +1,174 @@
+import hashlib
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from rest_framework.authentication import TokenAuthentication
+
+from .caches import require_shared_cache
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+PIN_COOKIE = 'primary_pin'
+# Response field of the login and registration endpoints carrying a new token.
+ISSUED_TOKEN_FIELD = 'token'
+
+_read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+def authorization_pin_key(authorization):
+    """Return the cache key pinning the client with this Authorization header."""
+    return 'replica-pin:' + hashlib.sha256(authorization.encode()).hexdigest()
+
+
+def _replica_reads(content):
+    token = _read_from_replica.set(True)
+    try:
+        yield from content
+    finally:
+        _read_from_replica.reset(token)
+
+
+async def _areplica_reads(content):
+    token = _read_from_replica.set(True)
+    try:
+        async for part in content:
+            yield part
+    finally:
+        _read_from_replica.reset(token)
+
+
+class ReplicaRouter:
+    """Send reads of read-only requests to a random replica in `DATABASE_REPLICAS`.
+
+    Reads outside of such a request (unsafe methods, management commands,
+    shell) and all writes go to the primary. Replicas are never migrated,
+    they are copies of the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if replicas and _read_from_replica.get():
+            return random.choice(replicas)
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {'default', *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """Route the reads of GET/HEAD/OPTIONS requests to the replicas.
+
+    After a successful write the client is pinned to the primary for
+    `REPLICA_PIN_SECONDS`, so it reads its own writes while the replicas
+    catch up. Token clients are pinned through the cache, keyed by a hash of
+    the Authorization header, all other clients through a cookie, so the
+    cache must be shared by all worker processes. Without replicas Django
+    drops the middleware at startup. Streamed responses keep reading from
+    the replicas while their content is iterated. The middleware runs in
+    sync (WSGI) and async (ASGI) middleware chains.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        require_shared_cache('Read replica pinning')
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        pin_key = self.get_pin_key(request)
+        pinned = PIN_COOKIE in request.COOKIES or (pin_key is not None and cache.get(pin_key) is not None)
+
+        read_from_replica = request.method in SAFE_METHODS and not pinned
+        token = _read_from_replica.set(read_from_replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_from_replica.reset(token)
+
+        if read_from_replica and response.streaming:
+            self.stream_from_replica(response)
+
+        if self.should_pin(request, response):
+            cache.set_many(
+                dict.fromkeys(self.get_write_pin_keys(pin_key, response), True), settings.REPLICA_PIN_SECONDS
+            )
+            self.set_pin_cookie(response)
+        return response
+
+    async def __acall__(self, request):
+        pin_key = self.get_pin_key(request)
+        pinned = PIN_COOKIE in request.COOKIES or (pin_key is not None and await cache.aget(pin_key) is not None)
+
+        read_from_replica = request.method in SAFE_METHODS and not pinned
+        token = _read_from_replica.set(read_from_replica)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _read_from_replica.reset(token)
+
+        if read_from_replica and response.streaming:
+            self.stream_from_replica(response)
+
+        if self.should_pin(request, response):
+            await cache.aset_many(
+                dict.fromkeys(self.get_write_pin_keys(pin_key, response), True), settings.REPLICA_PIN_SECONDS
+            )
+            self.set_pin_cookie(response)
+        return response
+
+    def get_pin_key(self, request):
+        authorization = request.headers.get('Authorization')
+        if not authorization:
+            return None
+        return authorization_pin_key(authorization)
+
+    def get_write_pin_keys(self, request_pin_key, response):
+        """Return the pin keys of a successful write.
+
+        Besides the client's own Authorization header this pins a token
+        issued by login or registration, which the client sends from its
+        next request on; token clients often ignore the pin cookie.
+        """
+        keys = [] if request_pin_key is None else [request_pin_key]
+        data = getattr(response, 'data', None)
+        if isinstance(data, dict) and isinstance(data.get(ISSUED_TOKEN_FIELD), str):
+            keys.append(authorization_pin_key(f'{TokenAuthentication.keyword} {data[ISSUED_TOKEN_FIELD]}'))
+        return keys
+
+    def stream_from_replica(self, response):
+        """Route the reads made while the streamed content is iterated to the replicas."""
+        if response.is_async:
+            response.streaming_content = _areplica_reads(response.streaming_content)
+        else:
+            response.streaming_content = _replica_reads(response.streaming_content)
+
+    def should_pin(self, request, response):
+        return request.method not in SAFE_METHODS and response.status_code < 400
+
+    def set_pin_cookie(self, response):
+        response.set_cookie(
+            PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax'
+        )
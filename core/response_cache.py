@@ -0,0 +1,114 @@
+"""Shared response caching for anonymous GET endpoints.
+
+Cached responses are stored in the default cache under a key that contains
+a per-namespace generation number. Writes that affect a namespace call
+`invalidate_namespace()`, which bumps the generation, so all previously
+cached responses of that namespace are never served again and simply expire.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+GENERATION_KEY = 'response-cache:generation:{namespace}'
+RESPONSE_KEY = 'response-cache:{namespace}:{generation}:{path}'
+
+
+def get_generation(namespace):
+    """Return the current generation of a cache namespace."""
+    key = GENERATION_KEY.format(namespace=namespace)
+    generation = cache.get(key)
+    if generation is None:
+        # Start from the current time, so a lost generation key never
+        # resurrects responses cached under an earlier generation.
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def invalidate_namespace(namespace):
+    """Invalidate all cached responses of a namespace."""
+    key = GENERATION_KEY.format(namespace=namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+class AnonymousResponseCacheMixin:
+    """Cache rendered JSON responses of anonymous GET requests with ETag / Last-Modified validators.
+
+    Views set `response_cache_namespace`; viewsets can restrict caching to
+    certain actions with `response_cache_actions`. Requests carrying an
+    Authorization header or asking for HTML are never served from the cache.
+    """
+    response_cache_namespace = None
+    response_cache_actions = None
+
+    def is_response_cacheable(self, request):
+        """Return True if the response to this request may be served from or stored in the cache."""
+        if request.method != 'GET' or 'HTTP_AUTHORIZATION' in request.META:
+            return False
+        if 'text/html' in request.META.get('HTTP_ACCEPT', ''):
+            return False
+        if self.response_cache_actions is not None:
+            action_map = getattr(self, 'action_map', None) or {}
+            return action_map.get('get') in self.response_cache_actions
+        return True
+
+    def get_response_cache_key(self, request):
+        """Return the cache key of the response for this request."""
+        path = hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest()
+        generation = get_generation(self.response_cache_namespace)
+        return RESPONSE_KEY.format(namespace=self.response_cache_namespace, generation=generation, path=path)
+
+    def patch_cacheable_response(self, response, etag, last_modified):
+        """Add the validators and caching headers to a cacheable response."""
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, public=True, max_age=settings.ANONYMOUS_CACHE_MAX_AGE)
+        patch_vary_headers(response, ('Accept', 'Authorization'))
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.is_response_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = self.get_response_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            return self.cached_response(request, entry)
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200 and hasattr(response, 'add_post_render_callback'):
+            response.add_post_render_callback(lambda rendered: self.store_response(key, rendered))
+        return response
+
+    def cached_response(self, request, entry):
+        """Build the response for a cache entry, answering conditional requests with 304."""
+        response = HttpResponse(entry['content'], content_type=entry['content_type'])
+        self.patch_cacheable_response(response, entry['etag'], entry['last_modified'])
+        return get_conditional_response(
+            request, etag=entry['etag'], last_modified=entry['last_modified'], response=response
+        )
+
+    def store_response(self, key, response):
+        """Store a rendered JSON response and answer conditional requests for it."""
+        content_type = response.get('Content-Type', '')
+        if not content_type.startswith('application/json'):
+            return
+
+        entry = {
+            'content': response.content,
+            'content_type': content_type,
+            'etag': f'"{hashlib.md5(response.content).hexdigest()}"',
+            'last_modified': int(time.time()),
+        }
+        cache.set(key, entry, timeout=settings.ANONYMOUS_CACHE_TIMEOUT)
+        self.patch_cacheable_response(response, entry['etag'], entry['last_modified'])
+        return get_conditional_response(
+            self.request, etag=entry['etag'], last_modified=entry['last_modified'], response=response
+        )
@@ -0,0 +1,58 @@
+from django.db import models
+from rest_framework import serializers
+
+
+class SparseFieldsetMixin:
+    """Serializer mixin limiting the output to the fields listed in `?fields=`.
+
+    `?fields=user,username,file` serializes only these fields; unknown
+    field names are rejected with a 400 response.
+    """
+    fields_query_param = 'fields'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        requested = request.query_params.get(self.fields_query_param) if request is not None else None
+        if not requested:
+            return
+
+        names = {name.strip() for name in requested.split(',') if name.strip()}
+        unknown = names - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError(
+                {self.fields_query_param: [f'Unknown fields: {", ".join(sorted(unknown))}.']}
+            )
+
+        for name in set(self.fields) - names:
+            self.fields.pop(name)
+
+
+class NullAsEmptyStringMixin:
+    """Field mixin rendering a None attribute as an empty string."""
+
+    def get_attribute(self, instance):
+        value = super().get_attribute(instance)
+        return '' if value is None else value
+
+
+class NullAsEmptyCharField(NullAsEmptyStringMixin, serializers.CharField):
+    pass
+
+
+class NullAsEmptyEmailField(NullAsEmptyStringMixin, serializers.EmailField):
+    pass
+
+
+class NullAsEmptyStringModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer rendering null text columns as empty strings.
+
+    The conversion happens per field while serializing, so no extra pass
+    over the representation is needed.
+    """
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.CharField: NullAsEmptyCharField,
+        models.TextField: NullAsEmptyCharField,
+    }
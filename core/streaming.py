@@ -0,0 +1,76 @@
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.utils import encoders
+
+ASYNC_STREAM_BATCH_SIZE = 500
+
+
+async def aiterate(iterator, batch_size=ASYNC_STREAM_BATCH_SIZE):
+    """Yield the items of a sync iterator, advancing it `batch_size` items at a time in a worker thread.
+
+    The thread-sensitive worker is the thread the view ran in, so database
+    cursors opened by the iterator stay on their connection.
+    """
+    iterator = iter(iterator)
+    next_batch = sync_to_async(lambda: list(islice(iterator, batch_size)))
+    try:
+        while batch := await next_batch():
+            for item in batch:
+                yield item
+    finally:
+        if hasattr(iterator, 'close'):
+            await sync_to_async(iterator.close)()
+
+
+def streaming_response(request, content, **kwargs):
+    """Return a StreamingHttpResponse over the sync iterator `content`.
+
+    Under ASGI the content is wrapped in `aiterate()`, as Django would
+    otherwise read a sync iterator completely into memory before sending it.
+    """
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        content = aiterate(content)
+    return StreamingHttpResponse(content, **kwargs)
+
+
+class StreamingListMixin:
+    """List mixin streaming the JSON array row by row instead of rendering it at once.
+
+    Streaming is opt-in with `?stream=1`, or the default for views that set
+    `stream_by_default = True`. The queryset is read with
+    `iterator(chunk_size=stream_chunk_size)`, so only one chunk of rows is
+    held in memory. Pagination is not applied to streamed lists.
+    """
+    stream_query_param = 'stream'
+    stream_by_default = False
+    stream_chunk_size = 2000
+
+    def should_stream(self, request):
+        """Return True if the list should be streamed for this request."""
+        value = request.query_params.get(self.stream_query_param)
+        if value is None:
+            return self.stream_by_default
+        return value.lower() in ('1', 'true', 'yes')
+
+    def list(self, request, *args, **kwargs):
+        if not self.should_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return streaming_response(request, self.stream_json(queryset), content_type='application/json')
+
+    def stream_json(self, queryset):
+        """Yield the serialized rows as chunks of one compact JSON array."""
+        serializer = self.get_serializer()
+        separator = b'['
+        for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+            row = serializer.to_representation(instance)
+            yield separator + json.dumps(
+                row, cls=encoders.JSONEncoder, ensure_ascii=False, separators=(',', ':')
+            ).encode('utf-8')
+            separator = b','
+        yield b']' if separator == b',' else b'[]'
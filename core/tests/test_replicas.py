@@ -0,0 +1,196 @@
+import tempfile
+from io import StringIO
+
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.management import call_command
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework.response import Response
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core.replicas import PIN_COOKIE, ReplicaRouter, ReplicaRoutingMiddleware
+from offer_app.models import Offer
+
+REPLICAS = ['replica1', 'replica2']
+SHARED_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': tempfile.mkdtemp(prefix='replica-tests-'),
+    }
+}
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS, REPLICA_PIN_SECONDS=10, CACHES=SHARED_CACHES)
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    Tests für das Routing lesender Requests auf die Read-Replicas
+    """
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+        self.read_databases = []
+
+    def get_response(self, request, status=200):
+        """Simulierte View: merkt sich die Datenbank, von der gelesen würde."""
+        self.read_databases.append(self.router.db_for_read(Offer) or 'default')
+        return HttpResponse(status=status)
+
+    def call(self, request, status=200):
+        middleware = ReplicaRoutingMiddleware(lambda request: self.get_response(request, status))
+        return middleware(request)
+
+    def test_reads_outside_requests_use_primary(self):
+        """
+        Test: Ohne Request (Management Commands, Shell) wird vom Primary gelesen
+        """
+        self.assertIsNone(self.router.db_for_read(Offer))
+        self.assertEqual(self.router.db_for_write(Offer), 'default')
+
+    def test_get_request_reads_from_replica(self):
+        """
+        Test: GET-Requests lesen von einer der Replicas
+        """
+        self.call(self.factory.get('/api/offers/'))
+
+        self.assertIn(self.read_databases[0], REPLICAS)
+
+    def test_write_request_reads_from_primary_and_pins(self):
+        """
+        Test: Schreibende Requests lesen vom Primary und setzen das Pin-Cookie
+        """
+        response = self.call(self.factory.post('/api/orders/'), status=201)
+
+        self.assertEqual(self.read_databases, ['default'])
+        self.assertEqual(response.cookies[PIN_COOKIE]['max-age'], 10)
+
+    def test_pinned_cookie_reads_from_primary(self):
+        """
+        Test: Nach einem Schreibzugriff liest der Client über das Cookie vom Primary
+        """
+        request = self.factory.get('/api/orders/')
+        request.COOKIES[PIN_COOKIE] = '1'
+
+        self.call(request)
+
+        self.assertEqual(self.read_databases, ['default'])
+
+    def test_token_client_is_pinned_through_cache(self):
+        """
+        Test: Token-Clients ohne Cookies werden über den Cache auf den Primary gepinnt
+        """
+        self.call(self.factory.post('/api/reviews/', HTTP_AUTHORIZATION='Token abc'), status=201)
+        self.call(self.factory.get('/api/reviews/', HTTP_AUTHORIZATION='Token abc'))
+        self.call(self.factory.get('/api/reviews/', HTTP_AUTHORIZATION='Token other'))
+
+        self.assertEqual(self.read_databases[1], 'default')
+        self.assertIn(self.read_databases[2], REPLICAS)
+
+    def test_issued_token_is_pinned(self):
+        """
+        Test: Ein bei Login/Registrierung ausgegebener Token ist sofort auf den Primary gepinnt,
+        auch wenn der Client das Cookie nicht mitschickt
+        """
+        def login(request):
+            self.read_databases.append(self.router.db_for_read(Offer) or 'default')
+            return Response({'token': 'new-token', 'username': 'customer1'})
+
+        ReplicaRoutingMiddleware(login)(self.factory.post('/api/login/'))
+        self.call(self.factory.get('/api/profile/1/', HTTP_AUTHORIZATION='Token new-token'))
+        self.call(self.factory.get('/api/profile/1/', HTTP_AUTHORIZATION='Token other'))
+
+        self.assertEqual(self.read_databases[1], 'default')
+        self.assertIn(self.read_databases[2], REPLICAS)
+
+    def test_issued_token_is_pinned_in_async_chain(self):
+        """
+        Test: Auch in der asynchronen Middleware-Kette wird der ausgegebene Token gepinnt
+        """
+        async def registration(request):
+            return Response({'token': 'async-token'}, status=201)
+
+        async_to_sync(ReplicaRoutingMiddleware(registration))(self.factory.post('/api/registration/'))
+        self.call(self.factory.get('/api/profile/1/', HTTP_AUTHORIZATION='Token async-token'))
+
+        self.assertEqual(self.read_databases, ['default'])
+
+    def test_failed_write_does_not_pin(self):
+        """
+        Test: Fehlgeschlagene Schreibzugriffe (4xx) pinnen nicht
+        """
+        response = self.call(self.factory.post('/api/orders/'), status=400)
+
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_async_middleware_chain(self):
+        """
+        Test: In einer asynchronen Middleware-Kette (ASGI) wird ebenso geroutet und gepinnt
+        """
+        async def get_response(request):
+            return self.get_response(request, status=201 if request.method == 'POST' else 200)
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        async_to_sync(middleware)(self.factory.get('/api/offers/'))
+        response = async_to_sync(middleware)(self.factory.post('/api/offers/'))
+
+        self.assertIn(self.read_databases[0], REPLICAS)
+        self.assertEqual(self.read_databases[1], 'default')
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_streamed_content_reads_from_replica(self):
+        """
+        Test: Gestreamte Antworten lesen auch beim Iterieren des Inhalts von den Replicas
+        """
+        def rows():
+            yield self.router.db_for_read(Offer) or 'default'
+
+        async def arows():
+            yield self.router.db_for_read(Offer) or 'default'
+
+        response = ReplicaRoutingMiddleware(lambda request: StreamingHttpResponse(rows()))(
+            self.factory.get('/api/orders/')
+        )
+        self.assertIn(b''.join(response.streaming_content).decode(), REPLICAS)
+
+        async def get_response(request):
+            return StreamingHttpResponse(arows())
+
+        async def consume():
+            response = await ReplicaRoutingMiddleware(get_response)(self.factory.get('/api/orders/'))
+            return b''.join([part async for part in response.streaming_content])
+
+        self.assertIn(async_to_sync(consume)().decode(), REPLICAS)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_process_local_cache_is_rejected(self):
+        """
+        Test: Mit einem prozesslokalen Cache (locmem) lassen sich Replicas nicht aktivieren
+        """
+        with self.assertRaises(ImproperlyConfigured):
+            ReplicaRoutingMiddleware(lambda request: HttpResponse())
+
+    def test_replicas_are_not_migrated(self):
+        """
+        Test: Auf den Replicas werden keine Migrationen ausgeführt
+        """
+        self.assertFalse(self.router.allow_migrate('replica1', 'offer_app'))
+        self.assertIsNone(self.router.allow_migrate('default', 'offer_app'))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_middleware_unused_without_replicas(self):
+        """
+        Test: Ohne Replicas wird die Middleware beim Start entfernt
+        """
+        with self.assertRaises(MiddlewareNotUsed):
+            ReplicaRoutingMiddleware(lambda request: HttpResponse())
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_sync_command_without_replicas(self):
+        """
+        Test: sync_sqlite_replicas meldet, dass keine Replicas konfiguriert sind
+        """
+        out = StringIO()
+
+        call_command('sync_sqlite_replicas', stdout=out)
+
+        self.assertIn('No SQLite replicas configured', out.getvalue())
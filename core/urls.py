@@ -27,4 +27,5 @@ urlpatterns = [
     path('api/', include('order_app.api.urls')),
     path('api/', include('review_app.api.urls')),
     path('api/', include('baseinfo_app.api.urls')),
+    path('api/', include('metrics_app.api.urls')),
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
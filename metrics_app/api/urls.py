@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import RequestMetricsView
+
+urlpatterns = [
+    path('metrics/requests/', RequestMetricsView.as_view(), name='request-metrics'),
+]
@@ -0,0 +1,25 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .. import store
+
+
+class RequestMetricsView(APIView):
+    """API view exposing the per-endpoint request metrics to staff users."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, format=None):
+        """Return the percentiles of query count, timings and response size per endpoint."""
+        data = {
+            'enabled': settings.REQUEST_METRICS['ENABLED'],
+            'endpoints': store.summarize(),
+        }
+        return Response(data, status=status.HTTP_200_OK)
+
+    def delete(self, request, format=None):
+        """Discard all recorded samples."""
+        store.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
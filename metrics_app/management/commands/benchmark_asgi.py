@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.util import setup_testing_defaults
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from metrics_app.store import percentile
+
+
+class Command(BaseCommand):
+    """Compare WSGI with sync views against ASGI with the async read views under many slow clients."""
+    help = (
+        'Send concurrent GET requests through the WSGI handler (sync views, fixed worker threads) and the '
+        'ASGI handler (async read views) in this process and report throughput and latency.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            action='append',
+            help='Path to request, can be repeated (default: /api/base-info/ and /api/offers/).',
+        )
+        parser.add_argument('--requests', type=int, default=1000, help='Requests per mode.')
+        parser.add_argument('--concurrency', type=int, default=200, help='Concurrent clients.')
+        parser.add_argument('--threads', type=int, default=8, help='Worker threads of the WSGI mode.')
+        parser.add_argument(
+            '--client-delay',
+            type=float,
+            default=50,
+            help='Milliseconds a slow client takes to read the response.',
+        )
+        parser.add_argument('--token', help='Token sent in the Authorization header.')
+
+    def handle(self, *args, **options):
+        paths = options['path'] or ['/api/base-info/', '/api/offers/']
+        headers = {'HTTP_HOST': 'localhost'}
+        if options['token']:
+            headers['HTTP_AUTHORIZATION'] = f'Token {options["token"]}'
+        requests = [paths[index % len(paths)] for index in range(options['requests'])]
+
+        with override_settings(ROOT_URLCONF='core.urls'):
+            wsgi = self.run_wsgi(requests, headers, options)
+        with override_settings(ROOT_URLCONF='core.async_urls'):
+            asgi = asyncio.run(self.run_asgi(requests, headers, options))
+
+        for mode, (elapsed, latencies, statuses) in (('wsgi', wsgi), ('asgi', asgi)):
+            self.stdout.write(
+                f'{mode}  {len(latencies) / elapsed:>8.0f} req/s   '
+                f'p50 {percentile(latencies, 50):>7.1f} ms   p95 {percentile(latencies, 95):>7.1f} ms   '
+                f'status {dict(sorted(statuses.items()))}'
+            )
+
+    def run_wsgi(self, requests, headers, options):
+        """Serve the requests with a pool of `--threads` workers, each blocked while its client reads.
+
+        Up to `--concurrency` clients are connected at a time, latencies
+        include the time a client waits for a free worker.
+        """
+        handler = WSGIHandler()
+        delay = options['client_delay'] / 1000
+        limit = threading.BoundedSemaphore(options['concurrency'])
+        statuses = {}
+
+        def request(path, started):
+            environ = {'PATH_INFO': path, 'REQUEST_METHOD': 'GET', **headers}
+            setup_testing_defaults(environ)
+
+            def start_response(status, response_headers, exc_info=None):
+                code = int(status.split()[0])
+                statuses[code] = statuses.get(code, 0) + 1
+
+            response = handler(environ, start_response)
+            b''.join(response)
+            time.sleep(delay)
+            response.close()
+            return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        futures = []
+        with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+            for path in requests:
+                limit.acquire()
+                future = executor.submit(request, path, time.perf_counter())
+                future.add_done_callback(lambda future: limit.release())
+                futures.append(future)
+        latencies = [future.result() for future in futures]
+        return time.perf_counter() - started, latencies, statuses
+
+    async def run_asgi(self, requests, headers, options):
+        """Serve the requests concurrently as coroutines, up to `--concurrency` at a time."""
+        handler = ASGIHandler()
+        delay = options['client_delay'] / 1000
+        limit = asyncio.Semaphore(options['concurrency'])
+        raw_headers = [
+            (name[5:].lower().replace('_', '-').encode(), value.encode()) for name, value in headers.items()
+        ]
+        statuses = {}
+
+        async def request(path):
+            async with limit:
+                started = time.perf_counter()
+                disconnected = asyncio.Event()
+                body_sent = False
+
+                async def receive():
+                    nonlocal body_sent
+                    if not body_sent:
+                        body_sent = True
+                        return {'type': 'http.request', 'body': b'', 'more_body': False}
+                    await disconnected.wait()
+                    return {'type': 'http.disconnect'}
+
+                async def send(message):
+                    if message['type'] == 'http.response.start':
+                        statuses[message['status']] = statuses.get(message['status'], 0) + 1
+                    elif not message.get('more_body'):
+                        await asyncio.sleep(delay)
+
+                scope = {
+                    'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+                    'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+                    'root_path': '', 'headers': raw_headers, 'server': ('localhost', 80),
+                    'client': ('127.0.0.1', 50000),
+                }
+                await handler(scope, receive, send)
+                disconnected.set()
+                return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(request(path) for path in requests))
+        return time.perf_counter() - started, latencies, statuses
@@ -0,0 +1,51 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from metrics_app import store
+
+
+class Command(BaseCommand):
+    """Print the per-endpoint request metrics recorded by RequestMetricsMiddleware."""
+    help = 'Dump the recorded per-endpoint request metrics as a table or JSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the report as JSON instead of a table.',
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Discard the recorded samples after dumping them.',
+        )
+
+    def handle(self, *args, **options):
+        report = store.summarize()
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        elif not report:
+            self.stdout.write('No request metrics recorded.')
+        else:
+            self.stdout.write(
+                f'{"endpoint":<32} {"method":<7} {"count":>6} {"queries p50/p95":>16} '
+                f'{"db ms p95":>10} {"ser ms p95":>10} {"total ms p50/p95/p99":>22} {"bytes p95":>10}'
+            )
+            for entry in report:
+                queries = _join(entry['queries'], 'p50', 'p95')
+                total = _join(entry['total_ms'], 'p50', 'p95', 'p99')
+                self.stdout.write(
+                    f'{entry["endpoint"]:<32} {entry["method"]:<7} {entry["count"]:>6} {queries:>16} '
+                    f'{_join(entry["db_ms"], "p95"):>10} {_join(entry["serializer_ms"], "p95"):>10} '
+                    f'{total:>22} {_join(entry["response_bytes"], "p95"):>10}'
+                )
+
+        if options['reset']:
+            store.reset()
+            self.stdout.write(self.style.SUCCESS('Request metrics reset.'))
+
+
+def _join(percentiles, *names):
+    return '/'.join('-' if percentiles[name] is None else str(percentiles[name]) for name in names)
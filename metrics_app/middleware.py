@@ -0,0 +1,121 @@
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+from rest_framework.serializers import BaseSerializer
+
+from core.caches import require_shared_cache
+
+from . import store
+
+_current = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Counters collected while one request is handled."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        """Database execute wrapper counting queries and their duration."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started
+
+
+def install_serializer_timing():
+    """Wrap `BaseSerializer.data` so the time spent serializing is added to the current request.
+
+    Only the outermost `.data` access is timed, nested serializers are part
+    of it. Queries triggered while serializing count towards both the
+    database and the serializer time. The wrapper is removed again by
+    `uninstall_serializer_timing()` when request metrics are disabled.
+    """
+    if hasattr(BaseSerializer.data.fget, 'original'):
+        return
+    original = BaseSerializer.data
+
+    def data(self):
+        metrics = _current.get()
+        if metrics is None or metrics.serializing:
+            return original.fget(self)
+        metrics.serializing = True
+        started = time.perf_counter()
+        try:
+            return original.fget(self)
+        finally:
+            metrics.serializer_time += time.perf_counter() - started
+            metrics.serializing = False
+
+    data.original = original
+    BaseSerializer.data = property(data)
+
+
+def uninstall_serializer_timing():
+    """Restore the original `BaseSerializer.data`."""
+    original = getattr(BaseSerializer.data.fget, 'original', None)
+    if original is not None:
+        BaseSerializer.data = original
+
+
+@receiver(setting_changed)
+def remove_serializer_timing(setting, **kwargs):
+    """Remove the serializer wrapper once request metrics are disabled, e.g. after a test."""
+    if setting == 'REQUEST_METRICS' and not settings.REQUEST_METRICS['ENABLED']:
+        uninstall_serializer_timing()
+
+
+class RequestMetricsMiddleware:
+    """Record query count, database time, serializer time and response size per endpoint.
+
+    Enabled with `REQUEST_METRICS['ENABLED']`, otherwise Django drops the
+    middleware at startup. Samples are stored in the default cache, which
+    must be memcached or redis (see `store.record()`). Samples are keyed by the resolved URL name and
+    method. Queries of streamed responses run after the response leaves the
+    middleware and are not counted, their size is not recorded. The metrics
+    endpoint itself is not recorded.
+    """
+    excluded_url_names = {'request-metrics'}
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS['ENABLED']:
+            raise MiddlewareNotUsed
+        require_shared_cache('Request metrics', atomic_counters=True)
+        install_serializer_timing()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_time = time.perf_counter() - started
+
+        match = request.resolver_match
+        if match is not None and match.url_name and match.url_name not in self.excluded_url_names:
+            store.record(match.url_name, request.method, {
+                'queries': metrics.queries,
+                'db_ms': metrics.db_time * 1000,
+                'serializer_ms': metrics.serializer_time * 1000,
+                'total_ms': total_time * 1000,
+                'response_bytes': None if response.streaming else len(response.content),
+            })
+        return response
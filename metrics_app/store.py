@@ -0,0 +1,110 @@
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+
+METRICS = ('queries', 'db_ms', 'serializer_ms', 'total_ms', 'response_bytes')
+PERCENTILES = (50, 95, 99)
+
+GENERATION_KEY = 'request-metrics:generation'
+ENDPOINT_COUNT_KEY = 'request-metrics:{generation}:endpoints'
+ENDPOINT_KEY = 'request-metrics:{generation}:endpoint:{number}'
+COUNTER_KEY = 'request-metrics:{generation}:count:{endpoint}:{method}'
+SAMPLE_KEY = 'request-metrics:{generation}:sample:{endpoint}:{method}:{slot}'
+
+
+def _generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def _incr(key):
+    cache.add(key, 0, None)
+    return cache.incr(key)
+
+
+def record(endpoint, method, sample):
+    """Store one request sample, keeping the last `SAMPLE_SIZE` samples per endpoint.
+
+    Samples live in the default cache, which must be memcached or redis:
+    slots and endpoint numbers come from cache.add() and cache.incr(),
+    which are only atomic across worker processes there. Every sample gets its own key in a ring of
+    `SAMPLE_SIZE` slots per endpoint, picked with an atomic counter, so
+    recording costs the same few cache calls whatever the sample size and
+    concurrent requests do not overwrite each other.
+    """
+    generation = _generation()
+    counter_key = COUNTER_KEY.format(generation=generation, endpoint=endpoint, method=method)
+    if cache.add(counter_key, 0, None):
+        number = _incr(ENDPOINT_COUNT_KEY.format(generation=generation))
+        cache.set(ENDPOINT_KEY.format(generation=generation, number=number), (endpoint, method), None)
+
+    slot = (_incr(counter_key) - 1) % settings.REQUEST_METRICS['SAMPLE_SIZE']
+    cache.set(
+        SAMPLE_KEY.format(generation=generation, endpoint=endpoint, method=method, slot=slot),
+        tuple(sample.get(metric) for metric in METRICS),
+        None,
+    )
+
+
+def _endpoints(generation):
+    count = cache.get(ENDPOINT_COUNT_KEY.format(generation=generation)) or 0
+    keys = [ENDPOINT_KEY.format(generation=generation, number=number) for number in range(1, count + 1)]
+    return list(cache.get_many(keys).values())
+
+
+def _sample_keys(generation, endpoint, method):
+    count = cache.get(COUNTER_KEY.format(generation=generation, endpoint=endpoint, method=method)) or 0
+    slots = min(count, settings.REQUEST_METRICS['SAMPLE_SIZE'])
+    return [
+        SAMPLE_KEY.format(generation=generation, endpoint=endpoint, method=method, slot=slot)
+        for slot in range(slots)
+    ]
+
+
+def percentile(values, p):
+    """Return the nearest-rank percentile `p` of `values`, or None if there are none."""
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        return None
+    return values[max(math.ceil(p / 100 * len(values)) - 1, 0)]
+
+
+def summarize():
+    """Return the aggregated percentiles of every recorded endpoint, busiest first."""
+    report = []
+    generation = _generation()
+    for endpoint, method in _endpoints(generation):
+        samples = list(cache.get_many(_sample_keys(generation, endpoint, method)).values())
+        if not samples:
+            continue
+        entry = {'endpoint': endpoint, 'method': method, 'count': len(samples)}
+        for index, metric in enumerate(METRICS):
+            values = [sample[index] for sample in samples]
+            entry[metric] = {f'p{p}': _round(percentile(values, p)) for p in PERCENTILES}
+            entry[metric]['max'] = _round(percentile(values, 100))
+        report.append(entry)
+    return sorted(report, key=lambda entry: (-entry['count'], entry['endpoint'], entry['method']))
+
+
+def reset():
+    """Delete all recorded samples and start a new generation of keys."""
+    generation = _generation()
+    count_key = ENDPOINT_COUNT_KEY.format(generation=generation)
+    keys = [count_key]
+    keys.extend(
+        ENDPOINT_KEY.format(generation=generation, number=number)
+        for number in range(1, (cache.get(count_key) or 0) + 1)
+    )
+    for endpoint, method in _endpoints(generation):
+        keys.append(COUNTER_KEY.format(generation=generation, endpoint=endpoint, method=method))
+        keys.extend(_sample_keys(generation, endpoint, method))
+    _incr(GENERATION_KEY)
+    cache.delete_many(keys)
+
+
+def _round(value):
+    return round(value, 2) if isinstance(value, float) else value
@@ -0,0 +1,294 @@
+import json
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.serializers import BaseSerializer
+from rest_framework.test import APITestCase
+
+from metrics_app import store
+from metrics_app.middleware import RequestMetricsMiddleware
+from offer_app.models import Offer, OfferDetail
+from profile_app.models import Profile
+
+METRICS_ENABLED = {'ENABLED': True, 'SAMPLE_SIZE': 500}
+# memcached and redis are not available in the test run; the tests run in a
+# single process, where the file cache stands in for them.
+SHARED_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': tempfile.mkdtemp(prefix='metrics-tests-'),
+    }
+}
+
+
+class RequestMetricsTestMixin:
+    """
+    Gemeinsame Testdaten: ein Business User mit Angebot und ein Staff User
+    """
+
+    def setUp(self):
+        atomic_counters = patch('core.caches.has_atomic_counters', return_value=True)
+        atomic_counters.start()
+        self.addCleanup(atomic_counters.stop)
+
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.staff_user = User.objects.create_user(username='staff1', password='testpass123', is_staff=True)
+        Profile.objects.create(user=self.staff_user, type='customer')
+        self.staff_token = Token.objects.create(user=self.staff_user)
+
+        offer = Offer.objects.create(user=self.business_user, title='Logo Design', description='Logo')
+        OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=100, features=['Logo'], offer_type='basic'
+        )
+
+    def get_entry(self, endpoint, method='GET'):
+        return next(
+            (entry for entry in store.summarize() if entry['endpoint'] == endpoint and entry['method'] == method),
+            None
+        )
+
+
+@override_settings(REQUEST_METRICS=METRICS_ENABLED, CACHES=SHARED_CACHES)
+class RequestMetricsMiddlewareTests(RequestMetricsTestMixin, APITestCase):
+    """
+    Tests für die Aufzeichnung der Request-Metriken pro Endpoint
+    """
+
+    def test_records_sample_keyed_by_url_name(self):
+        """
+        Test: Ein Request wird unter dem aufgelösten URL-Namen und der Methode gespeichert
+        """
+        response = self.client.get(reverse('offers-list'))
+        self.assertEqual(response.status_code, 200)
+
+        entry = self.get_entry('offers-list')
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry['count'], 1)
+        self.assertGreater(entry['queries']['p50'], 0)
+        self.assertGreater(entry['db_ms']['max'], 0)
+        self.assertGreater(entry['serializer_ms']['max'], 0)
+        self.assertEqual(entry['response_bytes']['max'], len(response.content))
+
+    def test_profile_detail_uses_url_name(self):
+        """
+        Test: Die Profilansicht wird als 'profileGetPatch' erfasst
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.business_token.key}')
+        self.client.get(reverse('profileGetPatch', kwargs={'pk': self.business_user.pk}))
+
+        self.assertIsNotNone(self.get_entry('profileGetPatch'))
+
+    def test_methods_are_recorded_separately(self):
+        """
+        Test: GET und POST auf denselben Endpoint werden getrennt aggregiert
+        """
+        self.client.get(reverse('offers-list'))
+        self.client.post(reverse('offers-list'), {}, format='json')
+
+        self.assertEqual(self.get_entry('offers-list', 'GET')['count'], 1)
+        self.assertEqual(self.get_entry('offers-list', 'POST')['count'], 1)
+
+    @override_settings(REQUEST_METRICS={'ENABLED': True, 'SAMPLE_SIZE': 3})
+    def test_sample_size_is_bounded(self):
+        """
+        Test: Pro Endpoint werden nur die letzten SAMPLE_SIZE Requests behalten
+        """
+        for _ in range(5):
+            self.client.get(reverse('offers-list'), {'search': 'x'})
+
+        self.assertEqual(self.get_entry('offers-list')['count'], 3)
+
+    def test_unresolved_urls_are_not_recorded(self):
+        """
+        Test: Requests ohne aufgelöste URL (404) werden nicht erfasst
+        """
+        self.client.get('/api/does-not-exist/')
+
+        self.assertEqual(store.summarize(), [])
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_process_local_cache_is_rejected(self):
+        """
+        Test: Mit einem prozesslokalen Cache (locmem) lassen sich die Metriken nicht aktivieren
+        """
+        patch.stopall()
+
+        with self.assertRaises(ImproperlyConfigured):
+            RequestMetricsMiddleware(lambda request: None)
+
+    def test_file_cache_is_rejected(self):
+        """
+        Test: Der Datei-Cache hat keine atomaren Zähler und wird abgelehnt
+        """
+        patch.stopall()
+
+        with self.assertRaises(ImproperlyConfigured):
+            RequestMetricsMiddleware(lambda request: None)
+
+    def test_serializer_timing_is_removed_when_disabled(self):
+        """
+        Test: Die Zeitmessung von BaseSerializer.data wird entfernt, sobald die Metriken deaktiviert werden
+        """
+        self.client.get(reverse('offers-list'))
+        self.assertTrue(hasattr(BaseSerializer.data.fget, 'original'))
+
+        with override_settings(REQUEST_METRICS={'ENABLED': False, 'SAMPLE_SIZE': 500}):
+            self.assertFalse(hasattr(BaseSerializer.data.fget, 'original'))
+
+    def test_samples_keep_their_slots(self):
+        """
+        Test: Jeder Request belegt einen eigenen Slot, ältere Samples bleiben unverändert
+        """
+        with override_settings(REQUEST_METRICS={'ENABLED': True, 'SAMPLE_SIZE': 2}):
+            for queries in (1, 2, 3):
+                store.record('offers-list', 'GET', {'queries': queries})
+
+            entry = self.get_entry('offers-list')
+
+        self.assertEqual(entry['count'], 2)
+        self.assertEqual(entry['queries']['max'], 3)
+        self.assertEqual(entry['queries']['p50'], 2)
+
+    @override_settings(REQUEST_METRICS={'ENABLED': False, 'SAMPLE_SIZE': 500})
+    def test_disabled_by_setting(self):
+        """
+        Test: Ohne REQUEST_METRICS['ENABLED'] wird nichts aufgezeichnet
+        """
+        self.client.get(reverse('offers-list'))
+
+        self.assertEqual(store.summarize(), [])
+
+
+@override_settings(REQUEST_METRICS=METRICS_ENABLED, CACHES=SHARED_CACHES)
+class RequestMetricsEndpointTests(RequestMetricsTestMixin, APITestCase):
+    """
+    Tests für den Staff-Endpoint /api/metrics/requests/ und das Management Command
+    """
+
+    def test_staff_user_gets_report(self):
+        """
+        Test: Staff User erhalten die aggregierten Perzentile
+        """
+        self.client.get(reverse('offers-list'))
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.staff_token.key}')
+
+        response = self.client.get(reverse('request-metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['enabled'])
+        endpoints = {entry['endpoint'] for entry in response.data['endpoints']}
+        self.assertIn('offers-list', endpoints)
+        entry = response.data['endpoints'][0]
+        self.assertEqual(set(entry['total_ms']), {'p50', 'p95', 'p99', 'max'})
+
+    def test_regular_user_is_forbidden(self):
+        """
+        Test: Nicht-Staff User erhalten 403
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.business_token.key}')
+
+        response = self.client.get(reverse('request-metrics'))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_anonymous_user_is_unauthorized(self):
+        """
+        Test: Anonyme Requests erhalten 401
+        """
+        response = self.client.get(reverse('request-metrics'))
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_delete_resets_samples(self):
+        """
+        Test: DELETE verwirft alle aufgezeichneten Samples
+        """
+        self.client.get(reverse('offers-list'))
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.staff_token.key}')
+
+        response = self.client.delete(reverse('request-metrics'))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(store.summarize(), [])
+
+    def test_dump_command_json(self):
+        """
+        Test: dump_request_metrics --json gibt den Report als JSON aus
+        """
+        self.client.get(reverse('offers-list'))
+        out = StringIO()
+
+        call_command('dump_request_metrics', '--json', stdout=out)
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report[0]['endpoint'], 'offers-list')
+
+    def test_dump_command_table_and_reset(self):
+        """
+        Test: dump_request_metrics gibt eine Tabelle aus und setzt mit --reset zurück
+        """
+        self.client.get(reverse('offers-list'))
+        out = StringIO()
+
+        call_command('dump_request_metrics', '--reset', stdout=out)
+
+        self.assertIn('offers-list', out.getvalue())
+        self.assertIn('Request metrics reset.', out.getvalue())
+        self.assertEqual(store.summarize(), [])
+
+
+class PercentileTests(SimpleTestCase):
+    """
+    Tests für die Perzentil-Berechnung (Nearest Rank)
+    """
+
+    def test_nearest_rank(self):
+        """
+        Test: Perzentile werden nach dem Nearest-Rank-Verfahren berechnet
+        """
+        values = list(range(1, 101))
+
+        self.assertEqual(store.percentile(values, 50), 50)
+        self.assertEqual(store.percentile(values, 95), 95)
+        self.assertEqual(store.percentile(values, 100), 100)
+
+    def test_ignores_missing_values(self):
+        """
+        Test: Fehlende Werte (z.B. Größe gestreamter Antworten) werden ignoriert
+        """
+        self.assertEqual(store.percentile([None, 3, 1], 50), 1)
+        self.assertIsNone(store.percentile([None], 50))
+
+
+@override_settings(ALLOWED_HOSTS=['localhost'])
+class AsgiBenchmarkTests(TransactionTestCase):
+    """
+    Tests für den Vergleich von WSGI und ASGI
+    """
+
+    def test_benchmark_command(self):
+        """
+        Test: benchmark_asgi schickt die Anfragen durch beide Handler
+        """
+        out = StringIO()
+
+        call_command(
+            'benchmark_asgi', '--path', '/api/base-info/', '--requests', '4', '--concurrency', '2',
+            '--client-delay', '0', stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('wsgi'))
+        self.assertTrue(lines[1].startswith('asgi'))
+        self.assertIn('status {200: 4}', out.getvalue())
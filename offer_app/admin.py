@@ -5,10 +5,10 @@ from .models import Offer, OfferDetail
 @admin.register(Offer)
 class OfferAdmin(admin.ModelAdmin):
     """Admin configuration for Offer model."""
-    list_display = ('title', 'user', 'created_at', 'updated_at')
+    list_display = ('title', 'user', 'min_price', 'min_delivery_time', 'created_at', 'updated_at')
     list_filter = ('created_at', 'updated_at', 'user')
     search_fields = ('title', 'description', 'user__username')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('min_price', 'min_delivery_time', 'created_at', 'updated_at')
     date_hierarchy = 'created_at'
 
 
@@ -0,0 +1,147 @@
+import json
+import math
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+class OfferPagination(PageNumberPagination):
+    """Pagination configuration for offers.
+
+    Page numbers (`?page=`) stay the default. Passing `?cursor=` (empty for
+    the first page) switches to keyset pagination, which seeks by the last
+    seen `(ordering value, id)` and issues neither COUNT nor OFFSET.
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    cursor_query_param = 'cursor'
+    ordering_param = api_settings.ORDERING_PARAM
+    cursor_orderings = ['-updated_at', 'updated_at', 'min_price', '-min_price']
+    default_cursor_ordering = '-updated_at'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_cursor_request(self, request):
+        """Return True if the client opted into keyset pagination."""
+        return self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_cursor = self.is_cursor_request(request)
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        ordering, position = self.decode_cursor(request)
+        field = ordering.lstrip('-')
+        descending = ordering.startswith('-')
+
+        if position is not None:
+            queryset = queryset.filter(self.seek_condition(field, descending, *position))
+
+        order = F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True)
+        tiebreaker = '-pk' if descending else 'pk'
+        rows = list(queryset.order_by(order, tiebreaker)[:page_size + 1])
+
+        self.has_next = len(rows) > page_size
+        self.page_rows = rows[:page_size]
+        self.cursor_ordering = ordering
+        return self.page_rows
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async variant of `paginate_queryset()` for the async offer list.
+
+        Django has no async paginator and the async query methods run in a
+        worker thread anyway, so the page is read by `paginate_queryset()`
+        in a single worker thread call.
+        """
+        return await sync_to_async(self.paginate_queryset)(queryset, request, view)
+
+    def seek_condition(self, field, descending, value, pk):
+        """Build the WHERE clause selecting rows after the `(value, pk)` position."""
+        after = 'lt' if descending else 'gt'
+
+        if value is None:
+            return Q(**{f'{field}__isnull': True, f'pk__{after}': pk})
+
+        condition = Q(**{f'{field}__{after}': value}) | Q(**{field: value, f'pk__{after}': pk})
+        if field == 'min_price':
+            condition |= Q(min_price__isnull=True)
+        return condition
+
+    def get_cursor_ordering(self, request):
+        """Return the requested keyset ordering, falling back to the default."""
+        ordering = request.query_params.get(self.ordering_param, '').strip()
+        return ordering if ordering in self.cursor_orderings else self.default_cursor_ordering
+
+    def decode_cursor(self, request):
+        """Return `(ordering, position)` for the request; position is None on the first page."""
+        encoded = request.query_params.get(self.cursor_query_param, '')
+        if not encoded:
+            return self.get_cursor_ordering(request), None
+
+        try:
+            payload = json.loads(b64decode(encoded.encode('ascii'), validate=True).decode('utf-8'))
+            ordering, value, pk = payload['o'], payload['v'], payload['id']
+            if ordering not in self.cursor_orderings or not self.is_database_int(pk):
+                raise ValueError(ordering)
+            value = self.decode_cursor_value(ordering.lstrip('-'), value)
+        except (BinasciiError, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return ordering, (value, pk)
+
+    def decode_cursor_value(self, field, value):
+        """Return the ordering value of a cursor; raise ValueError if it does not fit the field."""
+        if value is None:
+            return None
+        if field == 'updated_at':
+            if not isinstance(value, str):
+                raise TypeError(value)
+            value = parse_datetime(value)
+            if value is None:
+                raise ValueError(value)
+            return value
+        if self.is_database_int(value) or (isinstance(value, (float, Decimal)) and math.isfinite(value)):
+            return value
+        raise TypeError(value)
+
+    @staticmethod
+    def is_database_int(value):
+        """Return True for integers the database can compare against (signed 64 bit)."""
+        return isinstance(value, int) and not isinstance(value, bool) and -2 ** 63 <= value < 2 ** 63
+
+    def encode_cursor(self, instance):
+        """Encode the position of `instance` as an opaque cursor string."""
+        value = getattr(instance, self.cursor_ordering.lstrip('-'))
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        payload = json.dumps({'o': self.cursor_ordering, 'v': value, 'id': instance.pk}, separators=(',', ':'))
+        return b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page_rows[-1]))
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
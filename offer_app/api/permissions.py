@@ -1,7 +1,7 @@
-from django.contrib.auth.models import User
-
 from rest_framework.permissions import BasePermission
 
+from profile_app.roles import is_business
+
 class IsOfferOwner(BasePermission):
     """
     Custom permission to only allow owners of an offer to edit or delete it.
@@ -10,16 +10,14 @@ class IsOfferOwner(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Check if the user is the owner of the offer."""
-        return obj.user == request.user
+        return obj.user_id == request.user.pk
     
 class IsBusinessUser(BasePermission):
     """
     Custom permission to only allow business users to create offers.
-    Assumes the user model has a `type` attribute.
+    The profile type is resolved once per request.
     """
 
     def has_permission(self, request, view):
         """Check if the user is authenticated and is of type 'business'."""
-        user = User.objects.get(pk=request.user.pk)
-
-        return request.user.is_authenticated and getattr(user.profile, 'type', None) == 'business'
\ No newline at end of file
+        return request.user.is_authenticated and is_business(request)
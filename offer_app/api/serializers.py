@@ -55,10 +55,15 @@ class OfferSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """Create a new offer with associated details."""
         details_data = validated_data.pop('details')
-        offer = Offer.objects.create(**validated_data)
-
-        for detail in details_data:
-            OfferDetail.objects.create(offer=offer, **detail)
+        offer = Offer.objects.create(
+            min_price=min(detail['price'] for detail in details_data),
+            min_delivery_time=min(detail['delivery_time_in_days'] for detail in details_data),
+            **validated_data
+        )
+
+        OfferDetail.objects.bulk_create(
+            OfferDetail(offer=offer, **detail) for detail in details_data
+        )
 
         return offer
     
@@ -2,7 +2,9 @@ from django.urls import path, include
 
 from rest_framework.routers import DefaultRouter
 
-from .views import OffersViewSet, OfferDetailsView
+from .views import (
+    AsyncOfferDetailsView, AsyncOfferListView, AsyncOfferRetrieveView, OfferDetailsView, OffersViewSet,
+)
 
 router = DefaultRouter()
 router.register(r'offers', OffersViewSet, basename='offers')
@@ -11,3 +13,24 @@ urlpatterns = [
     path('offerdetails/<int:pk>/', OfferDetailsView.as_view(), name='offer-details'),
     path('', include(router.urls)),
 ]
+
+# Served in front of urlpatterns by core.async_urls when ASYNC_READ_VIEWS is enabled.
+async_urlpatterns = [
+    path(
+        'offers/',
+        AsyncOfferListView.as_view(sync_view=OffersViewSet.as_view({'get': 'list', 'post': 'create'})),
+        name='offers-list',
+    ),
+    path(
+        'offers/<int:pk>/',
+        AsyncOfferRetrieveView.as_view(sync_view=OffersViewSet.as_view(
+            {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+        )),
+        name='offers-detail',
+    ),
+    path(
+        'offerdetails/<int:pk>/',
+        AsyncOfferDetailsView.as_view(sync_view=OfferDetailsView.as_view()),
+        name='offer-details',
+    ),
+]
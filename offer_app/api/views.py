@@ -1,44 +1,53 @@
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django.db.models import Min
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework import viewsets, views, status, filters as drf_filters
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
 
 
+from core.async_views import AsyncReadView
+from core.conditional import atimestamp_etag, timestamp_etag
+from core.response_cache import AnonymousResponseCacheMixin
+
+from .pagination import OfferPagination
 from .serializers import OfferSerializer, OfferDetailSerializer
 from ..models import Offer, OfferDetail
 from ..filters.offer_filters import OfferFilter
+from ..filters.offer_search import OfferSearchFilter
 from .permissions import IsOfferOwner, IsBusinessUser
 
-class OfferPagination(PageNumberPagination):
-    """Pagination configuration for offers."""
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+def offer_etag(request, pk=None, **kwargs):
+    """ETag of an offer, covering its details through the touched updated_at."""
+    return timestamp_etag(Offer.objects.filter(pk=pk), 'updated_at')
+
+
+def offer_detail_etag(request, pk=None, **kwargs):
+    """ETag of an offer detail, taken from its parent offer."""
+    return timestamp_etag(OfferDetail.objects.filter(pk=pk), 'offer__updated_at')
 
-class OffersViewSet(viewsets.ModelViewSet):
+
+@method_decorator(condition(etag_func=offer_etag), name='retrieve')
+class OffersViewSet(AnonymousResponseCacheMixin, viewsets.ModelViewSet):
     """ViewSet for managing offers with filtering, searching, and ordering."""
+    response_cache_namespace = 'offers'
+    response_cache_actions = ('list',)
     serializer_class = OfferSerializer
-    filter_backends = [DjangoFilterBackend, drf_filters.SearchFilter, drf_filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OfferSearchFilter, drf_filters.OrderingFilter]
     filterset_class = OfferFilter
-    search_fields = ['title', 'description']
     ordering_fields = ['updated_at', 'min_price']
     pagination_class = OfferPagination
 
 
     def get_queryset(self):
-        """Return optimized queryset with related user and details."""
+        """Return optimized queryset with related user, profile and details."""
         return (
              Offer.objects.all()
-        .select_related('user')
+        .select_related('user__profile')
         .prefetch_related('details')
-        .annotate(
-            min_price_value=Min('details__price'),
-            min_delivery_time_value=Min('details__delivery_time_in_days')
-        )
         .order_by('-updated_at')
         )
     
@@ -64,6 +73,7 @@ class OffersViewSet(viewsets.ModelViewSet):
         """Save offer with the current user as owner."""
         serializer.save(user=self.request.user)
 
+@method_decorator(condition(etag_func=offer_detail_etag), name='get')
 class OfferDetailsView(views.APIView):
     """API view for retrieving specific offer detail."""
     permission_classes = [IsAuthenticated]
@@ -72,4 +82,47 @@ class OfferDetailsView(views.APIView):
         """Retrieve a specific offer detail by ID."""
         offer_detail = get_object_or_404(OfferDetail, pk=pk)
         serializer = OfferDetailSerializer(offer_detail)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class AsyncOfferListView(AsyncReadView):
+    """Async offer list with the filters, search, ordering and pagination of OffersViewSet."""
+    permission_classes = [AllowAny]
+    response_cache_namespace = 'offers'
+
+    async def get_data(self, request):
+        viewset = OffersViewSet(request=request, args=(), kwargs={}, format_kwarg=None, action='list')
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+
+        page = await viewset.paginator.apaginate_queryset(queryset, request, viewset)
+        serializer = OfferSerializer(page, many=True, context=viewset.get_serializer_context())
+        return viewset.paginator.get_paginated_response(serializer.data).data
+
+
+class AsyncOfferRetrieveView(AsyncReadView):
+    """Async retrieval of a single offer, with the ETag of OffersViewSet.retrieve."""
+
+    async def get_etag(self, request, pk):
+        return await atimestamp_etag(Offer.objects.filter(pk=pk), 'updated_at')
+
+    async def get_data(self, request, pk):
+        viewset = OffersViewSet(request=request, args=(), kwargs={'pk': pk}, format_kwarg=None, action='retrieve')
+        try:
+            offer = await viewset.get_queryset().aget(pk=pk)
+        except Offer.DoesNotExist:
+            raise Http404('No Offer matches the given query.')
+        return OfferSerializer(offer, context=viewset.get_serializer_context()).data
+
+
+class AsyncOfferDetailsView(AsyncReadView):
+    """Async retrieval of a specific offer detail, with the ETag of OfferDetailsView."""
+
+    async def get_etag(self, request, pk):
+        return await atimestamp_etag(OfferDetail.objects.filter(pk=pk), 'offer__updated_at')
+
+    async def get_data(self, request, pk):
+        try:
+            offer_detail = await OfferDetail.objects.aget(pk=pk)
+        except OfferDetail.DoesNotExist:
+            raise Http404('No OfferDetail matches the given query.')
+        return OfferDetailSerializer(offer_detail).data
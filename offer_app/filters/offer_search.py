@@ -0,0 +1,19 @@
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+from ..search import get_search_backend
+
+class OfferSearchFilter(BaseFilterBackend):
+    """Filter backend running the `search` query parameter through the configured full-text search backend."""
+    search_param = api_settings.SEARCH_PARAM
+
+    def get_search_term(self, request):
+        """Return the raw search term from the query parameters."""
+        return request.query_params.get(self.search_param, '').replace('\x00', '').strip()
+
+    def filter_queryset(self, request, queryset, view):
+        """Restrict the queryset to matching offers, ranked by relevance."""
+        term = self.get_search_term(request)
+        if not term:
+            return queryset
+        return get_search_backend(queryset.db).search(queryset, term)
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from core.response_cache import invalidate_namespace
+from offer_app.models import Offer
+from offer_app.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """Rebuild the full-text search index of all offers."""
+    help = 'Re-index all offers in the configured full-text search backend.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias to rebuild the index for.')
+
+    def handle(self, *args, **options):
+        backend = get_search_backend(options['database'])
+        backend.rebuild(Offer)
+        invalidate_namespace('offers')
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt offer search index using {type(backend).__name__}.'))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.response_cache import invalidate_namespace
+from offer_app.models import Offer
+
+
+class Command(BaseCommand):
+    """Backfill or verify the denormalized min_price / min_delivery_time columns of offers."""
+    help = 'Backfill the stored minimum price and delivery time of all offers, or verify them with --check.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report offers whose stored values differ from their details, without writing.',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            return self.check_values()
+
+        updated = Offer.refresh_min_values()
+        invalidate_namespace('offers')
+        self.stdout.write(self.style.SUCCESS(f'Updated minimum values of {updated} offers.'))
+
+    def check_values(self):
+        """Compare the stored columns with freshly aggregated values and fail on drift."""
+        expected = Offer.min_values_subqueries()
+        rows = (
+            Offer.objects.annotate(
+                expected_min_price=expected['min_price'],
+                expected_min_delivery_time=expected['min_delivery_time'],
+            )
+            .values_list('pk', 'min_price', 'expected_min_price', 'min_delivery_time', 'expected_min_delivery_time')
+            .iterator(chunk_size=2000)
+        )
+        drifted = [
+            pk for pk, min_price, expected_price, min_delivery_time, expected_delivery_time in rows
+            if min_price != expected_price or min_delivery_time != expected_delivery_time
+        ]
+
+        if drifted:
+            raise CommandError(f'{len(drifted)} offers have stale minimum values, e.g. {drifted[:20]}.')
+
+        self.stdout.write(self.style.SUCCESS('All stored minimum values are up to date.'))
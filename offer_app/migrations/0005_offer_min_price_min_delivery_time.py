@@ -0,0 +1,41 @@
+# Generated by Django 5.2.8 on 2026-10-18 00:45
+
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery
+
+
+def backfill_min_values(apps, schema_editor):
+    Offer = apps.get_model('offer_app', 'Offer')
+    OfferDetail = apps.get_model('offer_app', 'OfferDetail')
+
+    details = OfferDetail.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+    Offer.objects.update(
+        min_price=Subquery(details.annotate(value=Min('price')).values('value')),
+        min_delivery_time=Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offer_app', '0004_alter_offerdetail_delivery_time_in_days_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.PositiveIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='offer',
+            name='image',
+            field=models.FileField(blank=True, null=True, upload_to='static/offers/'),
+        ),
+        migrations.RunPython(backfill_min_values, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:12
+
+from django.db import migrations
+
+from offer_app.search import get_search_backend
+
+
+def install_search_index(apps, schema_editor):
+    Offer = apps.get_model('offer_app', 'Offer')
+    get_search_backend(schema_editor.connection.alias).install(schema_editor, Offer)
+
+
+def uninstall_search_index(apps, schema_editor):
+    Offer = apps.get_model('offer_app', 'Offer')
+    get_search_backend(schema_editor.connection.alias).uninstall(schema_editor, Offer)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offer_app', '0005_offer_min_price_min_delivery_time'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
@@ -1,6 +1,6 @@
 from django.contrib.auth.models import User
 from django.db import models
-from django.db.models import Min
+from django.db.models import Min, OuterRef, Subquery
 
 class Offer(models.Model):
     """Model representing a service offer created by business users."""
@@ -8,17 +8,36 @@ class Offer(models.Model):
     title = models.CharField(max_length=255)
     image = models.FileField(upload_to='static/offers/', null=True, blank=True)
     description = models.TextField()
+    min_price = models.PositiveIntegerField(null=True, blank=True, editable=False, db_index=True)
+    min_delivery_time = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def min_price(self):
-        """Return the minimum price among all offer details."""
-        return self.details.aggregate(min_value=Min('price'))['min_value']
-    
-    def min_delivery_time(self):
-        """Return the minimum delivery time among all offer details."""
-        return self.details.aggregate(min_value=Min('delivery_time_in_days'))['min_value']
-    
+    class Meta:
+        indexes = [
+            models.Index(fields=['-updated_at'], name='offer_updated_idx'),
+            models.Index(fields=['user', '-updated_at'], name='offer_user_updated_idx'),
+        ]
+
+    @classmethod
+    def min_values_subqueries(cls):
+        """Return correlated subqueries computing the minimum price and delivery time of an offer."""
+        details = OfferDetail.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+        return {
+            'min_price': Subquery(details.annotate(value=Min('price')).values('value')),
+            'min_delivery_time': Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+        }
+
+    @classmethod
+    def refresh_min_values(cls, queryset=None, **fields):
+        """Recalculate the stored minimum values for the given offers in a single UPDATE.
+
+        Additional field values, e.g. a new updated_at, are written in the same statement.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+        return queryset.update(**cls.min_values_subqueries(), **fields)
+
     def __str__(self):
         return self.title
     
@@ -38,5 +57,10 @@ class OfferDetail(models.Model):
     features = models.JSONField(default=list)
     offer_type = models.CharField(max_length=20, choices=OFFER_TYPE_CHOICES)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['offer', 'offer_type'], name='offerdetail_offer_type_idx'),
+        ]
+
     def __str__(self):
-        return f"{self.offer.title} - {self.offer_type}"
\ No newline at end of file
+        return f"{self.offer.title} - {self.offer_type}"
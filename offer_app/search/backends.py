@@ -0,0 +1,192 @@
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+SEARCH_FIELDS = ('title', 'description')
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(query):
+    """Split a free text search query into plain word tokens."""
+    return TOKEN_PATTERN.findall(query or '')
+
+
+class BaseSearchBackend:
+    """Interface for full-text search backends used by the offer list.
+
+    A backend owns its index structure (`install` / `uninstall`, called from
+    migrations), keeps it up to date (`index` / `remove`, called from the
+    offer signals) and turns a search term into a ranked queryset (`search`).
+    """
+
+    def __init__(self, using='default'):
+        self.using = using
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def install(self, schema_editor, model):
+        """Create the index structure for the given Offer model."""
+
+    def uninstall(self, schema_editor, model):
+        """Drop the index structure created by `install`."""
+
+    def rebuild(self, model):
+        """Re-index all offers from scratch."""
+
+    def index(self, offer):
+        """Add or refresh a single offer in the index."""
+
+    def remove(self, offer):
+        """Remove a single offer from the index."""
+
+    def search(self, queryset, query):
+        """Return `queryset` restricted to offers matching `query`, best matches first."""
+        raise NotImplementedError
+
+
+class LikeSearchBackend(BaseSearchBackend):
+    """Fallback backend using case-insensitive substring matching (no index)."""
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset
+
+        for term in terms:
+            condition = Q()
+            for field in SEARCH_FIELDS:
+                condition |= Q(**{f'{field}__icontains': term})
+            queryset = queryset.filter(condition)
+        return queryset
+
+
+class SQLiteFTS5Backend(BaseSearchBackend):
+    """Full-text search using an SQLite FTS5 virtual table ranked by bm25."""
+
+    def table_name(self, model):
+        return f'{model._meta.db_table}_fts'
+
+    def install(self, schema_editor, model):
+        table = schema_editor.quote_name(self.table_name(model))
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} "
+            f"USING fts5({', '.join(SEARCH_FIELDS)}, tokenize='unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {table}(rowid, {', '.join(SEARCH_FIELDS)}) "
+            f"SELECT id, {', '.join(SEARCH_FIELDS)} FROM {schema_editor.quote_name(model._meta.db_table)}"
+        )
+
+    def uninstall(self, schema_editor, model):
+        schema_editor.execute(f'DROP TABLE IF EXISTS {schema_editor.quote_name(self.table_name(model))}')
+
+    def rebuild(self, model):
+        table = self.connection.ops.quote_name(self.table_name(model))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table}')
+            cursor.execute(
+                f"INSERT INTO {table}(rowid, {', '.join(SEARCH_FIELDS)}) "
+                f"SELECT id, {', '.join(SEARCH_FIELDS)} FROM {self.connection.ops.quote_name(model._meta.db_table)}"
+            )
+
+    def index(self, offer):
+        table = self.connection.ops.quote_name(self.table_name(type(offer)))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table} WHERE rowid = %s', [offer.pk])
+            cursor.execute(
+                f"INSERT INTO {table}(rowid, {', '.join(SEARCH_FIELDS)}) VALUES (%s, %s, %s)",
+                [offer.pk, offer.title, offer.description],
+            )
+
+    def remove(self, offer):
+        table = self.connection.ops.quote_name(self.table_name(type(offer)))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table} WHERE rowid = %s', [offer.pk])
+
+    def match_expression(self, query):
+        """Build a safe FTS5 MATCH expression: every token must match as a prefix."""
+        return ' '.join(f'"{term}"*' for term in tokenize(query))
+
+    def search(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return queryset
+
+        quote = self.connection.ops.quote_name
+        table = quote(self.table_name(queryset.model))
+        offer_table = quote(queryset.model._meta.db_table)
+
+        return (
+            queryset
+            .filter(pk__in=RawSQL(f'SELECT rowid FROM {table} WHERE {table} MATCH %s', [match]))
+            .annotate(search_rank=RawSQL(
+                f'SELECT bm25({table}) FROM {table} WHERE {table} MATCH %s AND rowid = {offer_table}.id',
+                [match],
+            ))
+            .order_by('search_rank', '-updated_at')
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Full-text search using a GIN index on a tsvector expression, ranked by ts_rank.
+
+    The index is an expression index, so PostgreSQL keeps it up to date on
+    its own and `index` / `remove` are no-ops.
+    """
+    config = 'simple'
+    index_name = 'offer_search_vector_idx'
+
+    def vector(self):
+        from django.contrib.postgres.search import SearchVector
+        return SearchVector(*SEARCH_FIELDS, config=self.config)
+
+    def install(self, schema_editor, model):
+        from django.contrib.postgres.indexes import GinIndex
+        schema_editor.add_index(model, GinIndex(self.vector(), name=self.index_name))
+
+    def uninstall(self, schema_editor, model):
+        from django.contrib.postgres.indexes import GinIndex
+        schema_editor.remove_index(model, GinIndex(self.vector(), name=self.index_name))
+
+    def search(self, queryset, query):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        terms = tokenize(query)
+        if not terms:
+            return queryset
+
+        search_query = SearchQuery(' & '.join(f'{term}:*' for term in terms), config=self.config, search_type='raw')
+        return (
+            queryset
+            .annotate(search_vector=self.vector())
+            .filter(search_vector=search_query)
+            .annotate(search_rank=SearchRank(self.vector(), search_query))
+            .order_by('-search_rank', '-updated_at')
+        )
+
+
+VENDOR_BACKENDS = {
+    'sqlite': SQLiteFTS5Backend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend(using='default'):
+    """Return the search backend for a database alias.
+
+    `settings.OFFER_SEARCH_BACKEND` may name a backend class explicitly;
+    otherwise the backend is chosen from the database vendor.
+    """
+    backend_path = getattr(settings, 'OFFER_SEARCH_BACKEND', None)
+    if backend_path:
+        backend_class = import_string(backend_path)
+    else:
+        backend_class = VENDOR_BACKENDS.get(connections[using].vendor, LikeSearchBackend)
+    return backend_class(using=using)
@@ -0,0 +1,45 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core.response_cache import invalidate_namespace
+from profile_app.models import Profile
+
+from .models import Offer, OfferDetail
+from .search import get_search_backend
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_min_values(sender, instance, **kwargs):
+    """Keep the denormalized minimum price and delivery time of the parent offer in sync.
+
+    The offer's updated_at is touched as well, so its ETag changes with its details.
+    """
+    Offer.refresh_min_values(Offer.objects.filter(pk=instance.offer_id), updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Offer)
+def index_offer(sender, instance, using, **kwargs):
+    """Add or refresh the offer in the full-text search index."""
+    get_search_backend(using).index(instance)
+
+
+@receiver(post_delete, sender=Offer)
+def remove_offer_from_index(sender, instance, using, **kwargs):
+    """Remove a deleted offer from the full-text search index."""
+    get_search_backend(using).remove(instance)
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_offer_list_cache(sender, **kwargs):
+    """Drop cached offer list responses after writes to offers or their owners."""
+    invalidate_namespace('offers')
@@ -1,8 +1,22 @@
+import json
+from base64 import b64encode
+from io import StringIO
+from urllib.parse import parse_qs, urlparse
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
-from django.urls import reverse
+from django.urls import resolve, reverse
 
+from core.query_budget import QueryBudgetMixin
 from profile_app.models import Profile
+from offer_app.api.views import AsyncOfferDetailsView, AsyncOfferListView, AsyncOfferRetrieveView
 from offer_app.models import Offer, OfferDetail
 
 
@@ -834,15 +848,17 @@ class OfferModelMethodTests(APITestCase):
     
     def test_min_price_method(self):
         """
-        min_price Methode gibt den niedrigsten Preis zurück
+        min_price Spalte enthält den niedrigsten Preis
         """
-        self.assertEqual(self.offer.min_price(), 50)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 50)
     
     def test_min_delivery_time_method(self):
         """
-        min_delivery_time Methode gibt die kürzeste Lieferzeit zurück
+        min_delivery_time Spalte enthält die kürzeste Lieferzeit
         """
-        self.assertEqual(self.offer.min_delivery_time(), 3)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_delivery_time, 3)
     
     def test_user_details_in_serializer(self):
         """
@@ -872,4 +888,715 @@ class OfferModelMethodTests(APITestCase):
         __str__ Methode des OfferDetail Models gibt korrekte Darstellung zurück
         """
         basic_detail = OfferDetail.objects.get(offer=self.offer, offer_type='basic')
-        self.assertEqual(str(basic_detail), "Test Offer - basic")
\ No newline at end of file
+        self.assertEqual(str(basic_detail), "Test Offer - basic")
+
+class OfferMinValuesTests(APITestCase):
+    """Tests für die gespeicherten min_price / min_delivery_time Spalten"""
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.client.force_authenticate(user=self.business_user)
+
+        self.cheap_offer = Offer.objects.create(user=self.business_user, title="Cheap", description="Test")
+        self.basic_detail = OfferDetail.objects.create(
+            offer=self.cheap_offer, title="Basic", revisions=1, delivery_time_in_days=9,
+            price=50, features=[], offer_type="basic"
+        )
+        OfferDetail.objects.create(
+            offer=self.cheap_offer, title="Premium", revisions=3, delivery_time_in_days=4,
+            price=300, features=[], offer_type="premium"
+        )
+
+        self.expensive_offer = Offer.objects.create(user=self.business_user, title="Expensive", description="Test")
+        OfferDetail.objects.create(
+            offer=self.expensive_offer, title="Basic", revisions=1, delivery_time_in_days=2,
+            price=500, features=[], offer_type="basic"
+        )
+
+    def test_values_are_updated_when_detail_changes(self):
+        """
+        Änderungen an einem Detail aktualisieren die gespeicherten Minimalwerte
+        """
+        self.basic_detail.price = 400
+        self.basic_detail.save()
+
+        self.cheap_offer.refresh_from_db()
+        self.assertEqual(self.cheap_offer.min_price, 300)
+        self.assertEqual(self.cheap_offer.min_delivery_time, 4)
+
+    def test_values_are_updated_when_detail_is_deleted(self):
+        """
+        Das Löschen eines Details aktualisiert die gespeicherten Minimalwerte
+        """
+        self.basic_detail.delete()
+
+        self.cheap_offer.refresh_from_db()
+        self.assertEqual(self.cheap_offer.min_price, 300)
+
+    def test_values_are_set_on_create_via_api(self):
+        """
+        Beim Erstellen eines Angebots über die API werden die Minimalwerte gespeichert
+        """
+        payload = {
+            "title": "Neues Angebot",
+            "description": "Test",
+            "details": [
+                {"title": "B", "revisions": 1, "delivery_time_in_days": 7, "price": 120, "features": [], "offer_type": "basic"},
+                {"title": "S", "revisions": 2, "delivery_time_in_days": 5, "price": 220, "features": [], "offer_type": "standard"},
+                {"title": "P", "revisions": 3, "delivery_time_in_days": 3, "price": 320, "features": [], "offer_type": "premium"},
+            ]
+        }
+        response = self.client.post(reverse('offers-list'), payload, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        offer = Offer.objects.get(pk=response.data['id'])
+        self.assertEqual(offer.min_price, 120)
+        self.assertEqual(offer.min_delivery_time, 3)
+
+    def test_values_are_updated_on_patch_via_api(self):
+        """
+        PATCH mit Details aktualisiert die gespeicherten Minimalwerte
+        """
+        url = reverse('offers-detail', kwargs={'pk': self.cheap_offer.pk})
+        payload = {"details": [{"offer_type": "basic", "price": 20, "delivery_time_in_days": 1}]}
+        response = self.client.patch(url, payload, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.cheap_offer.refresh_from_db()
+        self.assertEqual(self.cheap_offer.min_price, 20)
+        self.assertEqual(self.cheap_offer.min_delivery_time, 1)
+
+    def test_filter_and_ordering_use_stored_values(self):
+        """
+        min_price / max_delivery_time Filter und ordering=min_price nutzen die gespeicherten Spalten
+        """
+        url = reverse('offers-list')
+
+        response = self.client.get(url, {'min_price': 100})
+        self.assertEqual([o['id'] for o in response.data['results']], [self.expensive_offer.id])
+
+        response = self.client.get(url, {'max_delivery_time': 3})
+        self.assertEqual([o['id'] for o in response.data['results']], [self.expensive_offer.id])
+
+        response = self.client.get(url, {'ordering': 'min_price'})
+        self.assertEqual(
+            [o['id'] for o in response.data['results']],
+            [self.cheap_offer.id, self.expensive_offer.id]
+        )
+        self.assertEqual(response.data['results'][0]['min_price'], 50)
+
+    def test_sync_command_backfills_and_checks(self):
+        """
+        Der Management-Command füllt veraltete Werte auf und erkennt Abweichungen mit --check
+        """
+        Offer.objects.filter(pk=self.cheap_offer.pk).update(min_price=None, min_delivery_time=None)
+
+        with self.assertRaises(CommandError):
+            call_command('sync_offer_min_values', '--check', stdout=StringIO())
+
+        call_command('sync_offer_min_values', stdout=StringIO())
+        call_command('sync_offer_min_values', '--check', stdout=StringIO())
+
+        self.cheap_offer.refresh_from_db()
+        self.assertEqual(self.cheap_offer.min_price, 50)
+
+
+class OfferListQueryCountTests(APITestCase):
+    """Regressionstests für die Anzahl der SQL-Queries der Angebotsliste"""
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business', first_name='Max')
+
+    def create_offers(self, count):
+        for i in range(count):
+            offer = Offer.objects.create(user=self.business_user, title=f"Offer {i}", description="Test")
+            for offer_type, price in [('basic', 100), ('standard', 200), ('premium', 300)]:
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1, delivery_time_in_days=5,
+                    price=price + i, features=[], offer_type=offer_type
+                )
+
+    def test_list_query_count_is_independent_of_page_size(self):
+        """
+        Die Angebotsliste benötigt unabhängig von der Seitengröße gleich viele Queries
+        (COUNT, Angebote inkl. User/Profil, Prefetch der Details)
+        """
+        url = reverse('offers-list')
+
+        self.create_offers(1)
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'page_size': 100})
+        self.assertEqual(len(response.data['results']), 1)
+
+        self.create_offers(30)
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'page_size': 100})
+        self.assertEqual(len(response.data['results']), 31)
+        self.assertEqual(response.data['results'][0]['user_details']['first_name'], 'Max')
+        self.assertIsNotNone(response.data['results'][0]['min_price'])
+
+    def test_retrieve_query_count(self):
+        """
+        Ein einzelnes Angebot wird ohne zusätzliche Queries pro Detail serialisiert
+        (ETag, Angebot inkl. User/Profil, Prefetch der Details)
+        """
+        self.create_offers(1)
+        offer = Offer.objects.get()
+        self.client.force_authenticate(user=self.business_user)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('offers-detail', kwargs={'pk': offer.pk}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['min_price'], 100)
+        self.assertEqual(len(response.data['details']), 3)
+
+
+class OfferSearchTests(APITestCase):
+    """Tests für die Volltextsuche über ?search="""
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+
+        self.web_offer = Offer.objects.create(
+            user=self.business_user,
+            title="Webentwicklung mit Django",
+            description="Backend und Frontend"
+        )
+        self.design_offer = Offer.objects.create(
+            user=self.business_user,
+            title="Logo Design",
+            description="Kreatives Design für Django Projekte"
+        )
+        self.other_offer = Offer.objects.create(
+            user=self.business_user,
+            title="Übersetzung",
+            description="Texte übersetzen"
+        )
+
+    def search(self, term):
+        response = self.client.get(reverse('offers-list'), {'search': term})
+        self.assertEqual(response.status_code, 200)
+        return [offer['id'] for offer in response.data['results']]
+
+    def test_search_matches_title_and_description(self):
+        """
+        Die Suche findet Treffer in Titel und Beschreibung, sortiert nach Relevanz
+        """
+        self.assertEqual(self.search('design'), [self.design_offer.id])
+        self.assertEqual(set(self.search('django')), {self.web_offer.id, self.design_offer.id})
+
+    def test_search_matches_prefixes_and_diacritics(self):
+        """
+        Präfixe (Tippen im Suchfeld) und Umlaute werden gefunden
+        """
+        self.assertEqual(self.search('webent'), [self.web_offer.id])
+        self.assertEqual(self.search('ubersetz'), [self.other_offer.id])
+
+    def test_search_requires_all_terms(self):
+        """
+        Mehrere Suchbegriffe müssen alle vorkommen
+        """
+        self.assertEqual(self.search('django logo'), [self.design_offer.id])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        """
+        Der Suchindex wird beim Aktualisieren und Löschen von Angeboten angepasst
+        """
+        self.web_offer.title = "Mobile Apps"
+        self.web_offer.save()
+        self.assertEqual(self.search('webentwicklung'), [])
+        self.assertEqual(self.search('mobile'), [self.web_offer.id])
+
+        self.design_offer.delete()
+        self.assertEqual(self.search('logo'), [])
+
+    def test_search_with_query_syntax_characters(self):
+        """
+        Sonderzeichen im Suchbegriff führen nicht zu Fehlern
+        """
+        self.assertEqual(self.search('"design* ('), [self.design_offer.id])
+        self.assertEqual(len(self.search('"*')), 3)
+
+    @override_settings(OFFER_SEARCH_BACKEND='offer_app.search.backends.LikeSearchBackend')
+    def test_like_backend_can_be_selected(self):
+        """
+        Über OFFER_SEARCH_BACKEND kann ein anderes Such-Backend gewählt werden
+        """
+        self.assertEqual(self.search('design'), [self.design_offer.id])
+
+    def test_rebuild_command(self):
+        """
+        Der Management-Command baut den Suchindex neu auf
+        """
+        Offer.objects.filter(pk=self.other_offer.pk).update(title="Lektorat")
+        self.assertEqual(self.search('lektorat'), [])
+
+        call_command('rebuild_offer_search_index', stdout=StringIO())
+
+        self.assertEqual(self.search('lektorat'), [self.other_offer.id])
+
+
+class OfferCursorPaginationTests(APITestCase):
+    """Tests für die Keyset-Pagination der Angebotsliste über ?cursor="""
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+
+        self.offers = []
+        for i in range(12):
+            offer = Offer.objects.create(user=self.business_user, title=f"Offer {i}", description="Test")
+            OfferDetail.objects.create(
+                offer=offer, title="Basic", revisions=1, delivery_time_in_days=5,
+                price=100 + (i % 4) * 10, features=[], offer_type="basic"
+            )
+            self.offers.append(offer)
+        self.offer_without_details = Offer.objects.create(user=self.business_user, title="Leer", description="Test")
+
+    def walk(self, params):
+        """Alle Seiten über die next-Links abrufen und die IDs sammeln."""
+        ids = []
+        response = self.client.get(reverse('offers-list'), params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            ids.extend(offer['id'] for offer in response.data['results'])
+            if not response.data['next']:
+                return ids
+            response = self.client.get(response.data['next'])
+
+    def test_cursor_walks_all_offers_by_updated_at(self):
+        """
+        ?cursor= liefert alle Angebote genau einmal, neueste zuerst
+        """
+        ids = self.walk({'cursor': '', 'page_size': 5})
+
+        expected = list(Offer.objects.order_by('-updated_at', '-pk').values_list('pk', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_cursor_walks_all_offers_by_min_price(self):
+        """
+        Keyset-Pagination nach min_price mit gleichen Preisen und Angeboten ohne Preis
+        """
+        ids = self.walk({'cursor': '', 'page_size': 4, 'ordering': 'min_price'})
+
+        self.assertEqual(len(ids), 13)
+        self.assertEqual(len(set(ids)), 13)
+        self.assertEqual(ids[-1], self.offer_without_details.id)
+        prices = [Offer.objects.get(pk=pk).min_price for pk in ids[:-1]]
+        self.assertEqual(prices, sorted(prices))
+
+        ids = self.walk({'cursor': '', 'page_size': 4, 'ordering': '-min_price'})
+        self.assertEqual(len(set(ids)), 13)
+        self.assertEqual(ids[-1], self.offer_without_details.id)
+
+    def test_cursor_pages_skip_count_and_offset(self):
+        """
+        Im Cursor-Modus werden weder COUNT noch OFFSET ausgeführt
+        """
+        first = self.client.get(reverse('offers-list'), {'cursor': '', 'page_size': 5})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(first.data['next'])
+
+        self.assertEqual(response.status_code, 200)
+        sql = ' '.join(query['sql'] for query in queries.captured_queries).upper()
+        self.assertNotIn('COUNT(', sql)
+        self.assertNotIn('OFFSET', sql)
+
+    def test_invalid_cursor(self):
+        """
+        Ein ungültiger Cursor liefert Status 404
+        """
+        response = self.client.get(reverse('offers-list'), {'cursor': 'kaputt'})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_forged_cursor_values(self):
+        """
+        Cursor mit Werten, die nicht zur Sortierung passen, liefern Status 404 statt 500
+        """
+        payloads = [
+            {'o': '-updated_at', 'v': 5, 'id': 1},
+            {'o': '-updated_at', 'v': '2024-13-45T00:00:00', 'id': 1},
+            {'o': '-updated_at', 'v': 'gestern', 'id': 1},
+            {'o': 'min_price', 'v': 'abc', 'id': 1},
+            {'o': 'min_price', 'v': [1], 'id': 1},
+            {'o': 'min_price', 'v': True, 'id': 1},
+            {'o': 'min_price', 'v': 2 ** 64, 'id': 1},
+            {'o': 'min_price', 'v': 100, 'id': '1'},
+            {'o': 'min_price', 'v': 100, 'id': 1.5},
+            {'o': 'title', 'v': 'a', 'id': 1},
+            {'o': '-updated_at', 'v': None},
+            [1, 2],
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                cursor = b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+                response = self.client.get(reverse('offers-list'), {'cursor': cursor})
+
+                self.assertEqual(response.status_code, 404)
+
+    def test_cursor_with_float_price(self):
+        """
+        Ein Cursor mit Kommazahl als min_price wird akzeptiert
+        """
+        cursor = b64encode(json.dumps({'o': 'min_price', 'v': 109.5, 'id': 1}).encode('utf-8')).decode('ascii')
+
+        response = self.client.get(reverse('offers-list'), {'cursor': cursor})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(offer['min_price'] in (110, 120, 130, None) for offer in response.data['results']))
+
+    def test_page_number_pagination_is_unchanged(self):
+        """
+        Ohne ?cursor= bleibt die Seitennummer-Pagination mit count erhalten
+        """
+        response = self.client.get(reverse('offers-list'), {'page': 2, 'page_size': 5})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 13)
+        self.assertEqual(len(response.data['results']), 5)
+
+
+class OfferListResponseCacheTests(APITestCase):
+    """Tests für das Response-Caching der anonymen Angebotsliste"""
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.offer = Offer.objects.create(user=self.business_user, title='Logo Design', description='Test')
+        self.url = reverse('offers-list')
+
+    def test_second_anonymous_request_is_served_from_cache(self):
+        """
+        Eine wiederholte anonyme Anfrage kommt ohne Datenbank-Queries aus
+        """
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertIn('Last-Modified', second)
+        self.assertIn('Authorization', second['Vary'])
+
+    def test_matching_etag_returns_304(self):
+        """
+        Mit passendem If-None-Match antwortet die Liste mit 304 ohne Body
+        """
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_offer_write_invalidates_cached_list(self):
+        """
+        Nach dem Ändern eines Angebots wird die Liste neu gerendert
+        """
+        etag = self.client.get(self.url)['ETag']
+
+        self.offer.title = 'Website Design'
+        self.offer.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['title'], 'Website Design')
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_profile_write_invalidates_cached_list(self):
+        """
+        Nach dem Ändern des Anbieterprofils wird die Liste neu gerendert
+        """
+        self.client.get(self.url)
+
+        Profile.objects.filter(user=self.business_user).get().save()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertGreater(len(queries), 0)
+
+    def test_authenticated_requests_are_not_cached(self):
+        """
+        Anfragen mit Authorization-Header werden weder aus dem Cache bedient noch gespeichert
+        """
+        token = self.client.post(reverse('login'), {'username': 'business1', 'password': 'testpass123'}).data['token']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertGreater(len(queries), 0)
+        self.assertNotIn('ETag', response)
+
+    def test_offer_detail_is_not_cached(self):
+        """
+        Nur die Liste wird gecacht, nicht die Detailansicht
+        """
+        url = reverse('offers-detail', kwargs={'pk': self.offer.pk})
+        self.client.get(url)
+
+        response = self.client.get(url)
+
+        self.assertNotIn('ETag', response)
+
+
+class OfferConditionalGetTests(APITestCase):
+    """Tests für bedingte GET-Anfragen (ETag / If-None-Match) auf Angebote und Angebotsdetails"""
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business', first_name='Max')
+        self.offer = Offer.objects.create(user=self.business_user, title='Logo Design', description='Test')
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title='Basic', revisions=1, delivery_time_in_days=5,
+            price=100, features=[], offer_type='basic'
+        )
+        self.client.force_authenticate(user=self.business_user)
+        self.url = reverse('offers-detail', kwargs={'pk': self.offer.pk})
+
+    def test_unchanged_offer_returns_304(self):
+        """
+        Ein unverändertes Angebot wird mit 304 beantwortet, ohne es zu laden
+        """
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_detail_change_changes_offer_etag(self):
+        """
+        Eine Änderung an einem Angebotsdetail liefert wieder das vollständige Angebot
+        """
+        etag = self.client.get(self.url)['ETag']
+
+        self.detail.price = 150
+        self.detail.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['min_price'], 150)
+
+    def test_unchanged_offer_detail_returns_304(self):
+        """
+        Ein unverändertes Angebotsdetail wird mit 304 beantwortet
+        """
+        url = reverse('offer-details', kwargs={'pk': self.detail.pk})
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.detail.title = 'Basic Plus'
+        self.detail.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], 'Basic Plus')
+
+    def test_missing_offer_still_returns_404(self):
+        """
+        Für nicht existierende Angebote bleibt es bei 404
+        """
+        response = self.client.get(reverse('offers-detail', kwargs={'pk': 999}), HTTP_IF_NONE_MATCH='W/"abc"')
+
+        self.assertEqual(response.status_code, 404)
+
+
+class OfferQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query-Budget Tests: Liste und Detailansicht der Angebote dürfen nicht mit der Anzahl der Objekte wachsen
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business', first_name='Max')
+        self.client.force_authenticate(user=self.business_user)
+
+    def create_offers(self, count):
+        for i in range(count):
+            offer = Offer.objects.create(user=self.business_user, title=f"Offer {i}", description="Test")
+            self.create_details(offer, 3)
+
+    def create_details(self, offer, count):
+        for i in range(count):
+            OfferDetail.objects.create(
+                offer=offer, title=f'Detail {i}', revisions=1, delivery_time_in_days=5,
+                price=100 + i, features=['Logo'], offer_type='basic'
+            )
+
+    def test_offers_list_budget(self):
+        """
+        Die Angebotsliste bleibt bei 1 und 10 Angeboten im Budget
+        """
+        self.assertQueryBudget('offers-list', self.create_offers)
+
+    def test_offers_list_anonymous_budget(self):
+        """
+        Auch anonym (ohne Cache-Treffer) bleibt die Angebotsliste im Budget
+        """
+        self.client.force_authenticate(user=None)
+        self.assertQueryBudget('offers-list', self.create_offers)
+
+    def test_offers_detail_budget(self):
+        """
+        Ein Angebot mit 1 und 10 Details bleibt im Budget
+        """
+        offer = Offer.objects.create(user=self.business_user, title='Offer', description='Test')
+        self.assertQueryBudget(
+            'offers-detail', lambda count: self.create_details(offer, count), kwargs={'pk': offer.pk}
+        )
+
+
+@override_settings(ROOT_URLCONF='core.async_urls')
+class AsyncOfferViewTests(APITestCase):
+    """
+    Tests für die asynchronen Lese-Views der Angebote (ASYNC_READ_VIEWS)
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business', first_name='Max')
+        self.token = Token.objects.create(user=self.business_user)
+        for i in range(12):
+            offer = Offer.objects.create(user=self.business_user, title=f'Offer {i}', description='Test')
+            for offer_type, price in [('basic', 100), ('standard', 200), ('premium', 300)]:
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1, delivery_time_in_days=5,
+                    price=price + i, features=['Logo'], offer_type=offer_type
+                )
+        self.offer = Offer.objects.order_by('pk').first()
+
+    def sync_response(self, url, params=None):
+        with override_settings(ROOT_URLCONF='core.urls'):
+            cache.clear()
+            response = self.client.get(url, params)
+        cache.clear()
+        return response
+
+    def test_async_views_are_routed(self):
+        """
+        Die Lese-Endpoints werden auf die asynchronen Views geroutet
+        """
+        self.assertIs(resolve('/api/offers/').func.view_class, AsyncOfferListView)
+        self.assertIs(resolve(f'/api/offers/{self.offer.pk}/').func.view_class, AsyncOfferRetrieveView)
+        self.assertIs(resolve('/api/offerdetails/1/').func.view_class, AsyncOfferDetailsView)
+
+    def test_list_matches_sync_view(self):
+        """
+        Die asynchrone Liste liefert dieselben Daten wie das ViewSet, inkl. Filter, Sortierung und Seiten
+        """
+        for params in [{}, {'page': 2}, {'min_price': 105, 'ordering': 'min_price'}, {'search': 'Offer', 'page_size': 5}]:
+            expected = self.sync_response(reverse('offers-list'), params)
+            response = self.client.get(reverse('offers-list'), params)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), expected.json())
+
+    def test_list_errors(self):
+        """
+        Ungültige Seiten liefern 404, ungültige Filter 400
+        """
+        self.assertEqual(self.client.get(reverse('offers-list'), {'page': 99}).status_code, 404)
+        self.assertEqual(self.client.get(reverse('offers-list'), {'min_price': 'abc'}).status_code, 400)
+
+    def test_anonymous_list_is_cached(self):
+        """
+        Anonyme Listen werden wie beim ViewSet gecacht und per ETag revalidiert
+        """
+        etag = self.client.get(reverse('offers-list'))['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('offers-list'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_cursor_pagination(self):
+        """
+        Keyset-Pagination (?cursor=) liefert dieselbe Antwort wie das ViewSet
+        """
+        expected = self.sync_response(reverse('offers-list'), {'cursor': '', 'page_size': 5})
+        response = self.client.get(reverse('offers-list'), {'cursor': '', 'page_size': 5})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected.json())
+        self.assertNotIn('count', response.json())
+
+        params = {key: values[0] for key, values in parse_qs(urlparse(response.json()['next']).query).items()}
+        expected = self.sync_response(reverse('offers-list'), params)
+        response = self.client.get(reverse('offers-list'), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected.json())
+        self.assertEqual(self.client.get(reverse('offers-list'), {'cursor': 'x'}).status_code, 404)
+
+    def test_create_is_delegated(self):
+        """
+        POST auf die Liste wird an das ViewSet weitergegeben
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        details = [
+            {'title': offer_type, 'revisions': 1, 'delivery_time_in_days': 5, 'price': 100,
+             'features': ['Logo'], 'offer_type': offer_type}
+            for offer_type in ('basic', 'standard', 'premium')
+        ]
+
+        response = self.client.post(
+            reverse('offers-list'), {'title': 'Neu', 'description': 'Test', 'details': details}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+
+    def test_retrieve(self):
+        """
+        Ein Angebot wird nur authentifiziert geliefert, mit ETag und 304
+        """
+        url = reverse('offers-detail', kwargs={'pk': self.offer.pk})
+        self.assertEqual(self.client.get(url).status_code, 401)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        response = self.client.get(url)
+        expected = self.sync_response(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected.json())
+        self.assertEqual(response['ETag'], expected['ETag'])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.client.get(reverse('offers-detail', kwargs={'pk': 999})).status_code, 404)
+
+    def test_invalid_token(self):
+        """
+        Ein ungültiger Token liefert 401 mit WWW-Authenticate
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token invalid')
+
+        response = self.client.get(reverse('offers-detail', kwargs={'pk': self.offer.pk}))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Token')
+
+    def test_offer_detail(self):
+        """
+        Ein Angebotsdetail liefert dieselben Daten wie die synchrone View
+        """
+        detail = self.offer.details.first()
+        url = reverse('offer-details', kwargs={'pk': detail.pk})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), self.sync_response(url).json())
+        self.assertEqual(self.client.get(reverse('offer-details', kwargs={'pk': 999})).status_code, 404)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Orders
+from .models import BusinessOrderCounter, Orders
 
 
 @admin.register(Orders)
@@ -12,3 +12,11 @@ class OrdersAdmin(admin.ModelAdmin):
     list_editable = ('status',)
     date_hierarchy = 'created_at'
     raw_id_fields = ('offer_detail', 'customer_user', 'business_user')
+
+
+@admin.register(BusinessOrderCounter)
+class BusinessOrderCounterAdmin(admin.ModelAdmin):
+    """Admin configuration for the materialized order counters."""
+    list_display = ('business_user', 'in_progress', 'completed', 'cancelled')
+    search_fields = ('business_user__username',)
+    readonly_fields = ('business_user', 'in_progress', 'completed', 'cancelled')
@@ -1,11 +1,11 @@
-from django.contrib.auth.models import User
-
 from rest_framework.permissions import BasePermission
+
+from profile_app.roles import is_business, is_customer
    
 class IsBusinessUser(BasePermission):
     """
-    Custom permission to only allow business users to create offers.
-    Assumes the user model has a `type` attribute.
+    Custom permission to only allow business users to update orders.
+    The profile type is resolved once per request.
     """
 
     def has_permission(self, request, view):
@@ -15,23 +15,18 @@ class IsBusinessUser(BasePermission):
         if view.action in ['update', 'partial_update']:
             return request.user.is_authenticated
         
-        user = User.objects.get(pk=request.user.pk)
-        return request.user.is_authenticated and getattr(user.profile, 'type', None) == 'business'
+        return request.user.is_authenticated and is_business(request)
     
     def has_object_permission(self, request, view, obj):
         """Check if the user is the business user associated with the order."""
-        user = User.objects.get(pk=request.user.pk)
-        is_business_type = getattr(user.profile, 'type', None) == 'business'
-        return is_business_type and obj.business_user == request.user
+        return is_business(request) and obj.business_user_id == request.user.pk
     
 class IsCustomerUser(BasePermission):
     """
-    Custom permission to only allow business users to create offers.
-    Assumes the user model has a `type` attribute.
+    Custom permission to only allow customer users to create orders.
+    The profile type is resolved once per request.
     """
 
     def has_permission(self, request, view):
         """Check if the user is authenticated and is of type 'customer'."""
-        user = User.objects.get(pk=request.user.pk)
-
-        return request.user.is_authenticated and getattr(user.profile, 'type', None) == 'customer'
\ No newline at end of file
+        return request.user.is_authenticated and is_customer(request)
@@ -1,11 +1,16 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+
 from rest_framework import serializers
 
-from ..models import Orders
+from ..models import BusinessOrderCounter, Orders
 from offer_app.models import OfferDetail
 
 class OrderSerializer(serializers.ModelSerializer):
     """Serializer for orders with offer detail information."""
-    offer_detail_id = serializers.PrimaryKeyRelatedField(queryset=OfferDetail.objects.all(), source='offer_detail', read_only=False, error_messages={'does_not_exist': 'Offer detail with the given ID does not exist.'})
+    offer_detail_id = serializers.PrimaryKeyRelatedField(queryset=OfferDetail.objects.select_related('offer'), source='offer_detail', read_only=False, error_messages={'does_not_exist': 'Offer detail with the given ID does not exist.'})
  
     title = serializers.CharField(source='offer_detail.title', read_only=True)
     revisions = serializers.IntegerField(source='offer_detail.revisions', read_only=True)
@@ -85,7 +90,7 @@ class OrderSerializer(serializers.ModelSerializer):
 
         offer_detail = validated_data['offer_detail']
 
-        validated_data['business_user'] = offer_detail.offer.user
+        validated_data['business_user_id'] = offer_detail.offer.user_id
         validated_data['customer_user'] = request.user
 
 
@@ -103,11 +108,55 @@ class OrderSerializer(serializers.ModelSerializer):
 
         data.pop("offer_detail_id", None)
        
-        if request and request.method == 'POST' and action == 'create':
+        if request and request.method == 'POST' and action in ('create', 'bulk_create'):
             data.pop("updated_at", None)
             
             return data
 
         return data
 
-    
+
+class BulkOrderSerializer(serializers.Serializer):
+    """Serializer for placing several orders at once from a list of offer detail IDs."""
+    offer_detail_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+    )
+
+    def validate_offer_detail_ids(self, value):
+        """Resolve all offer details with their offers in one query and reject unknown IDs."""
+        max_size = settings.ORDER_BULK_MAX_SIZE
+        if len(value) > max_size:
+            raise serializers.ValidationError(f'At most {max_size} orders can be placed at once.')
+
+        offer_details = OfferDetail.objects.select_related('offer').in_bulk(value)
+        missing = sorted(set(value) - set(offer_details))
+        if missing:
+            raise serializers.ValidationError(
+                f'Offer details with the following IDs do not exist: {", ".join(map(str, missing))}.'
+            )
+
+        self.offer_details = offer_details
+        return value
+
+    def create(self, validated_data):
+        """Insert one order per offer detail ID and count them in a single transaction.
+
+        bulk_create sends no post_save signals, so the order counters of the
+        business users are incremented here.
+        """
+        customer_user = self.context['request'].user
+        orders = [
+            Orders(
+                offer_detail=self.offer_details[offer_detail_id],
+                customer_user=customer_user,
+                business_user_id=self.offer_details[offer_detail_id].offer.user_id,
+            )
+            for offer_detail_id in validated_data['offer_detail_ids']
+        ]
+
+        with transaction.atomic():
+            orders = Orders.objects.bulk_create(orders)
+            for business_user_id, count in Counter(order.business_user_id for order in orders).items():
+                BusinessOrderCounter.increment(business_user_id, in_progress=count)
+        return orders
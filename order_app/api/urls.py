@@ -2,7 +2,10 @@ from django.urls import path, include
 
 from rest_framework.routers import DefaultRouter
 
-from .views import OrdersViewSet, CountInProgressOrdersView, CountCompletedOrdersView
+from .views import (
+    AsyncCountCompletedOrdersView, AsyncCountInProgressOrdersView, AsyncOrderCountsView,
+    CountCompletedOrdersView, CountInProgressOrdersView, OrderCountsView, OrdersViewSet,
+)
 
 router = DefaultRouter()
 router.register(r'orders', OrdersViewSet, basename='orders')
@@ -10,5 +13,25 @@ router.register(r'orders', OrdersViewSet, basename='orders')
 urlpatterns = [
     path('order-count/<int:pk>/', CountInProgressOrdersView.as_view(), name='order-count-in-progress'),
     path('completed-order-count/<int:pk>/', CountCompletedOrdersView.as_view(), name='order-count-completed'),
+    path('order-counts/<int:pk>/', OrderCountsView.as_view(), name='order-counts'),
     path('', include(router.urls)),
 ]
+
+# Served in front of urlpatterns by core.async_urls when ASYNC_READ_VIEWS is enabled.
+async_urlpatterns = [
+    path(
+        'order-count/<int:pk>/',
+        AsyncCountInProgressOrdersView.as_view(sync_view=CountInProgressOrdersView.as_view()),
+        name='order-count-in-progress',
+    ),
+    path(
+        'completed-order-count/<int:pk>/',
+        AsyncCountCompletedOrdersView.as_view(sync_view=CountCompletedOrdersView.as_view()),
+        name='order-count-completed',
+    ),
+    path(
+        'order-counts/<int:pk>/',
+        AsyncOrderCountsView.as_view(sync_view=OrderCountsView.as_view()),
+        name='order-counts',
+    ),
+]
@@ -1,30 +1,56 @@
-from django.contrib.auth.models import User
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from rest_framework import viewsets, views, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 
-from .serializers import OrderSerializer
-from ..models import Orders
+from core.async_views import AsyncReadView
+from core.conditional import timestamp_etag
+from core.exports import export_response
+from core.pagination import OptionalPageNumberPagination
+from core.streaming import StreamingListMixin
+from profile_app.models import Profile
+
+from .serializers import BulkOrderSerializer, OrderSerializer
+from ..filters.order_filters import OrderExportFilter
+from ..models import BusinessOrderCounter, Orders
 from .permissions import IsBusinessUser, IsCustomerUser
 
-class OrdersViewSet(viewsets.ModelViewSet):
-    """ViewSet for managing orders with role-based permissions."""
+def order_etag(request, pk=None, **kwargs):
+    """ETag of an order, covering the offer detail it was placed for."""
+    return timestamp_etag(Orders.objects.filter(pk=pk), 'updated_at', 'offer_detail__offer__updated_at')
+
+
+@method_decorator(condition(etag_func=order_etag), name='retrieve')
+class OrdersViewSet(StreamingListMixin, viewsets.ModelViewSet):
+    """ViewSet for managing orders with role-based permissions; `?stream=1` streams the list."""
     permission_classes = [IsAuthenticated]
     serializer_class = OrderSerializer
+    pagination_class = OptionalPageNumberPagination
     queryset = None
 
+    export_fields = [
+        'id', 'status', 'created_at', 'updated_at', 'customer_user', 'business_user', 'offer_detail',
+        'offer_detail__title', 'offer_detail__offer_type', 'offer_detail__price',
+        'offer_detail__delivery_time_in_days', 'offer_detail__revisions',
+    ]
+    export_columns = [
+        'id', 'status', 'created_at', 'updated_at', 'customer_user', 'business_user', 'offer_detail_id',
+        'title', 'offer_type', 'price', 'delivery_time_in_days', 'revisions',
+    ]
+
     def get_permissions(self):
         """Determine permissions based on action.
 
         - GET: IsAuthenticated
-        - POST: IsAuthenticated and type = customer
+        - POST (single or bulk): IsAuthenticated and type = customer
         - PATCH: IsAuthenticated and type = business
         - DELETE: IsStaffUser
         """
-        if self.action == 'create':
+        if self.action in ['create', 'bulk_create']:
             self.permission_classes = [IsAuthenticated, IsCustomerUser]
         elif self.action in ['update', 'partial_update']:
             self.permission_classes = [IsAuthenticated, IsBusinessUser]
@@ -35,49 +61,131 @@ class OrdersViewSet(viewsets.ModelViewSet):
         return super().get_permissions()
 
     def get_queryset(self):
-        """Return orders filtered by user involvement (customer or business)."""
-        action = self.action
+        """Return orders filtered by user involvement (customer or business).
+
+        For the list, the orders of both roles are collected with a UNION ALL
+        of two scans on the (customer_user, -created_at) and
+        (business_user, -created_at) indexes instead of an OR across columns.
+        The offer detail is joined, since every order serializes its fields.
+        """
+        queryset = Orders.objects.select_related('offer_detail')
 
-        if action == 'list':
-            return Orders.objects.filter(
-                Q(customer_user=self.request.user) | Q(business_user=self.request.user)
-            )
+        if self.action in ['list', 'export']:
+            return queryset.filter(pk__in=self.get_user_order_ids()).order_by('-created_at', '-pk')
         else:
-            return Orders.objects.all()
+            return queryset
 
-class CountInProgressOrdersView(views.APIView):
-    """API view for counting in-progress orders for a business user."""
+    def get_user_order_ids(self):
+        """Return a UNION ALL subquery of the IDs of the user's customer and business orders."""
+        user = self.request.user
+        return Orders.objects.filter(customer_user=user).values('pk').union(
+            Orders.objects.filter(business_user=user).values('pk'),
+            all=True,
+        )
+
+    @action(detail=False, methods=['get'], url_path=r'export/(?P<export_format>csv|ndjson)')
+    def export(self, request, export_format):
+        """Stream the user's orders as CSV or NDJSON, optionally limited to a created_at range."""
+        filterset = OrderExportFilter(request.query_params, queryset=self.get_queryset())
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        return export_response(request, export_format, filterset.qs, self.export_fields, self.export_columns, 'orders')
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        """Place one order per offer detail ID with a single batched insert."""
+        serializer = BulkOrderSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        orders = serializer.save()
+
+        data = self.get_serializer(orders, many=True).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+def order_counters_query(pk):
+    """Query selecting the profile type and the order counters of a user in one row."""
+    return (
+        Profile.objects.filter(user_id=pk)
+        .values_list('type', *(f'user__order_counter__{status}' for status in BusinessOrderCounter.STATUS_FIELDS))
+    )
+
+
+def order_counters_from_row(row):
+    """Return the counters of a row of `order_counters_query()`, raising 404 for non-business users."""
+    if row is None:
+        raise NotFound('User not found.')
+
+    profile_type, *counts = row
+    if profile_type != 'business':
+        raise NotFound('User is not a business user.')
+
+    return {status: count or 0 for status, count in zip(BusinessOrderCounter.STATUS_FIELDS, counts)}
+
+
+class BusinessOrderCountView(views.APIView):
+    """Base view for the order counters of a business user."""
     permission_classes = [IsAuthenticated]
-    
-    def get(self, request, pk, format=None):
-        """Return count of in-progress orders for the specified business user."""
-        user = get_object_or_404(User, pk=pk)
 
-        if user.profile.type != 'business':
-            return Response({'detail': 'User is not a business user.'}, status=status.HTTP_404_NOT_FOUND)
+    def get_counters(self, pk):
+        """Return the stored order counters of a business user, raising 404 for other users.
+
+        Profile type and counters are read with a single query.
+        """
+        return order_counters_from_row(order_counters_query(pk).first())
+
+
+class CountInProgressOrdersView(BusinessOrderCountView):
+    """API view for counting in-progress orders for a business user."""
 
-        count = Orders.objects.filter(
-            business_user=user,
-            status='in_progress'
-        ).count()
+    def get(self, request, pk, format=None):
+        """Return count of in-progress orders for the specified business user."""
+        counters = self.get_counters(pk)
+        return Response({'order_count': counters['in_progress']}, status=status.HTTP_200_OK)
 
-        return Response({'order_count': count}, status=status.HTTP_200_OK)
-    
 
-class CountCompletedOrdersView(views.APIView):
+class CountCompletedOrdersView(BusinessOrderCountView):
     """API view for counting completed orders for a business user."""
-    passpermission_classes = [IsAuthenticated]
-    
+
     def get(self, request, pk, format=None):
         """Return count of completed orders for the specified business user."""
-        user = get_object_or_404(User, pk=pk)
+        counters = self.get_counters(pk)
+        return Response({'completed_order_count': counters['completed']}, status=status.HTTP_200_OK)
+
+
+class OrderCountsView(BusinessOrderCountView):
+    """API view returning all order counters of a business user in one call."""
+
+    def get(self, request, pk, format=None):
+        """Return the number of in-progress, completed and cancelled orders of the business user."""
+        return Response(self.get_counters(pk), status=status.HTTP_200_OK)
+
+
+
+class AsyncBusinessOrderCountView(AsyncReadView):
+    """Base view for async reads of the order counters of a business user."""
+
+    async def get_counters(self, pk):
+        return order_counters_from_row(await order_counters_query(pk).afirst())
+
+
+class AsyncCountInProgressOrdersView(AsyncBusinessOrderCountView):
+    """Async variant of CountInProgressOrdersView."""
+
+    async def get_data(self, request, pk):
+        counters = await self.get_counters(pk)
+        return {'order_count': counters['in_progress']}
+
+
+class AsyncCountCompletedOrdersView(AsyncBusinessOrderCountView):
+    """Async variant of CountCompletedOrdersView."""
+
+    async def get_data(self, request, pk):
+        counters = await self.get_counters(pk)
+        return {'completed_order_count': counters['completed']}
 
-        if user.profile.type != 'business':
-            return Response({'detail': 'User is not a business user.'}, status=status.HTTP_404_NOT_FOUND)
 
-        count = Orders.objects.filter(
-            business_user=user,
-            status='completed'
-        ).count()
+class AsyncOrderCountsView(AsyncBusinessOrderCountView):
+    """Async variant of OrderCountsView."""
 
-        return Response({'completed_order_count': count}, status=status.HTTP_200_OK)
\ No newline at end of file
+    async def get_data(self, request, pk):
+        return await self.get_counters(pk)
@@ -0,0 +1,12 @@
+from django_filters import rest_framework as filters
+
+from ..models import Orders
+
+class OrderExportFilter(filters.FilterSet):
+    created_after = filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='gte')
+    created_before = filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='lt')
+    status = filters.ChoiceFilter(choices=Orders.status_choices)
+
+    class Meta:
+        model = Orders
+        fields = ['created_after', 'created_before', 'status']
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from order_app.models import BusinessOrderCounter
+
+
+class Command(BaseCommand):
+    """Recompute the per-business order counters served by the order count endpoints."""
+    help = 'Reconcile the stored order counters of all business users, or report drift with --check.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report business users whose counters differ from the orders table, without writing.',
+        )
+
+    def handle(self, *args, **options):
+        expected = BusinessOrderCounter.compute()
+        fields = BusinessOrderCounter.STATUS_FIELDS
+        empty = dict.fromkeys(fields, 0)
+        stored = {
+            row['business_user']: {field: row[field] for field in fields}
+            for row in BusinessOrderCounter.objects.values('business_user', *fields)
+        }
+
+        drifted = sorted(
+            business_user_id
+            for business_user_id in set(expected) | set(stored)
+            if expected.get(business_user_id, empty) != stored.get(business_user_id, empty)
+        )
+        for business_user_id in drifted[:20]:
+            self.stdout.write(
+                f'business user {business_user_id}: stored {stored.get(business_user_id, empty)}, '
+                f'actual {expected.get(business_user_id, empty)}'
+            )
+
+        if options['check']:
+            if drifted:
+                raise CommandError(f'{len(drifted)} business users have drifted order counters.')
+            self.stdout.write(self.style.SUCCESS('Order counters are up to date.'))
+            return
+
+        BusinessOrderCounter.reconcile()
+        self.stdout.write(self.style.SUCCESS(f'Order counters reconciled, {len(drifted)} business users corrected.'))
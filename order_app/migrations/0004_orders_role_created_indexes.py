@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offer_app', '0006_offer_search_index'),
+        ('order_app', '0003_alter_orders_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='orders',
+            options={'verbose_name_plural': 'Orders'},
+        ),
+        migrations.AddIndex(
+            model_name='orders',
+            index=models.Index(fields=['customer_user', '-created_at'], name='orders_customer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orders',
+            index=models.Index(fields=['business_user', '-created_at'], name='orders_business_created_idx'),
+        ),
+    ]
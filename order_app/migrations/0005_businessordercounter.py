@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    Orders = apps.get_model('order_app', 'Orders')
+    BusinessOrderCounter = apps.get_model('order_app', 'BusinessOrderCounter')
+
+    counters = {}
+    rows = Orders.objects.order_by().values_list('business_user', 'status').annotate(count=Count('pk'))
+    for business_user_id, status, count in rows:
+        counters.setdefault(business_user_id, {})[status] = count
+
+    BusinessOrderCounter.objects.bulk_create(
+        BusinessOrderCounter(business_user_id=business_user_id, **values)
+        for business_user_id, values in counters.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('order_app', '0004_orders_role_created_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderCounter',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress', models.IntegerField(default=0)),
+                ('completed', models.IntegerField(default=0)),
+                ('cancelled', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offer_app', '0007_hot_path_indexes'),
+        ('order_app', '0005_businessordercounter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='orders',
+            index=models.Index(fields=['business_user', 'status'], name='orders_business_status_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order_app', '0006_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='orders',
+            name='orders_business_status_idx',
+        ),
+    ]
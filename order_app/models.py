@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import Count, F
 from django.contrib.auth.models import User
 
 from offer_app.models import OfferDetail
@@ -22,3 +23,92 @@ class Orders(models.Model):
 
     class Meta:
         verbose_name_plural = "Orders"
+        indexes = [
+            models.Index(fields=['customer_user', '-created_at'], name='orders_customer_created_idx'),
+            models.Index(fields=['business_user', '-created_at'], name='orders_business_created_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded status, so status changes can be applied to the order counters."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save the order and update the counters of its business user in one transaction.
+
+        An update first re-reads the stored status with a row lock, so
+        concurrent status changes of the same order move the counters one
+        after another, each from the status it actually replaces.
+        """
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        update_fields = kwargs.get('update_fields')
+        with transaction.atomic(using=using):
+            if not self._state.adding and (update_fields is None or 'status' in update_fields):
+                self._loaded_status = (
+                    type(self)._base_manager.using(using).select_for_update()
+                    .filter(pk=self.pk).values_list('status', flat=True).first()
+                )
+            super().save(*args, **kwargs)
+
+
+class BusinessOrderCounter(models.Model):
+    """Materialized number of orders per status of a business user.
+
+    Kept up to date by the order signals and by bulk order creation, so the
+    order count endpoints read a single row instead of counting orders.
+    """
+    business_user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name='order_counter'
+    )
+    in_progress = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    cancelled = models.IntegerField(default=0)
+
+    STATUS_FIELDS = [status for status, _ in Orders.status_choices]
+
+    @classmethod
+    def compute(cls, business_user_ids=None):
+        """Count the orders per status of the given business users (all if None) from the orders table."""
+        orders = Orders.objects.all()
+        if business_user_ids is not None:
+            orders = orders.filter(business_user__in=business_user_ids)
+
+        counters = {}
+        rows = orders.order_by().values_list('business_user', 'status').annotate(count=Count('pk'))
+        for business_user_id, status, count in rows:
+            counters.setdefault(business_user_id, dict.fromkeys(cls.STATUS_FIELDS, 0))[status] = count
+        return counters
+
+    @classmethod
+    def reconcile(cls, business_user_ids=None):
+        """Recompute the counters of the given business users (all if None) and store them."""
+        counters = cls.compute(business_user_ids)
+        if business_user_ids is not None:
+            for business_user_id in business_user_ids:
+                counters.setdefault(business_user_id, dict.fromkeys(cls.STATUS_FIELDS, 0))
+
+        with transaction.atomic():
+            if business_user_ids is None:
+                cls.objects.exclude(pk__in=counters).update(**dict.fromkeys(cls.STATUS_FIELDS, 0))
+            for business_user_id, values in counters.items():
+                cls.objects.update_or_create(business_user_id=business_user_id, defaults=values)
+        return counters
+
+    @classmethod
+    def increment(cls, business_user_id, reconcile_missing=True, **deltas):
+        """Atomically add the given per-status deltas to the counters of a business user.
+
+        A missing row is created from the orders table, which already
+        contains the change being counted, unless reconcile_missing is False.
+        """
+        deltas = {status: delta for status, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        updated = cls.objects.filter(pk=business_user_id).update(
+            **{status: F(status) + delta for status, delta in deltas.items()}
+        )
+        if not updated and reconcile_missing:
+            cls.reconcile([business_user_id])
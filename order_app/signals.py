@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import BusinessOrderCounter, Orders
+
+
+@receiver(post_save, sender=Orders)
+def order_saved(sender, instance, created, **kwargs):
+    """Count a new order and move status changes between the counters of its business user."""
+    loaded_status = getattr(instance, '_loaded_status', None)
+
+    if created:
+        BusinessOrderCounter.increment(instance.business_user_id, **{instance.status: 1})
+    elif loaded_status is None:
+        BusinessOrderCounter.reconcile([instance.business_user_id])
+    elif loaded_status != instance.status:
+        BusinessOrderCounter.increment(instance.business_user_id, **{loaded_status: -1, instance.status: 1})
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Orders)
+def order_deleted(sender, instance, **kwargs):
+    """Remove a deleted order from the counters of its business user.
+
+    A missing counter row is not recreated, it may have been deleted along
+    with the business user whose orders are being deleted.
+    """
+    BusinessOrderCounter.increment(instance.business_user_id, reconcile_missing=False, **{instance.status: -1})
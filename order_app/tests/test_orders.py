@@ -1,11 +1,24 @@
+import csv
+import json
+from datetime import timedelta
+from io import StringIO
+
 from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from rest_framework import status
 
+from core.query_budget import QueryBudgetMixin
 from profile_app.models import Profile
 from offer_app.models import Offer, OfferDetail
-from order_app.models import Orders
+from order_app.models import BusinessOrderCounter, Orders
 
 
 class OrdersAPIHappyPathTestCase(APITestCase):
@@ -99,6 +112,109 @@ class OrdersAPIHappyPathTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(response.data), 1)
 
+    def test_order_list_loads_offer_details_in_one_query(self):
+        """GET /api/orders/ - Die Liste lädt Orders inkl. Offer Details mit einer Query, neueste zuerst"""
+        for _ in range(5):
+            Orders.objects.create(
+                offer_detail=self.offer_detail,
+                customer_user=self.customer_user,
+                business_user=self.business_user,
+            )
+        self.client.force_authenticate(user=self.business_user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('orders-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(response.data[0]['title'], 'Logo Design Basic')
+        created = [order['created_at'] for order in response.data]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_order_list_excludes_orders_of_other_users(self):
+        """GET /api/orders/ - Orders ohne Beteiligung des Users werden nicht geliefert"""
+        other_customer = User.objects.create_user(username='customer2', password='testpass123')
+        Profile.objects.create(user=other_customer, type='customer')
+        other_business = User.objects.create_user(username='business2', password='testpass123')
+        Profile.objects.create(user=other_business, type='business')
+        Orders.objects.create(offer_detail=self.offer_detail, customer_user=other_customer, business_user=other_business)
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.get(reverse('orders-list'))
+
+        self.assertEqual([order['id'] for order in response.data], [self.order.id])
+
+    def test_order_list_streamed(self):
+        """GET /api/orders/?stream=1 - Die Liste wird in Chunks gestreamt und entspricht der normalen Liste"""
+        for _ in range(4):
+            Orders.objects.create(
+                offer_detail=self.offer_detail,
+                customer_user=self.customer_user,
+                business_user=self.business_user,
+            )
+        self.client.force_authenticate(user=self.business_user)
+        expected = self.client.get(reverse('orders-list')).json()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('orders-list'), {'stream': '1'})
+            content = b''.join(response.streaming_content)
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(content), expected)
+
+    def test_export_orders_as_csv(self):
+        """GET /api/orders/export/csv/ - Orders des Users werden als CSV exportiert"""
+        self.client.force_authenticate(user=self.business_user)
+
+        response = self.client.get(reverse('orders-export', kwargs={'export_format': 'csv'}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment; filename="orders.csv"', response['Content-Disposition'])
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode('utf-8').splitlines()))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['id'], str(self.order.id))
+        self.assertEqual(rows[0]['title'], 'Logo Design Basic')
+        self.assertEqual(rows[0]['price'], '150')
+        self.assertEqual(rows[0]['status'], 'in_progress')
+
+    def test_export_orders_as_ndjson_with_date_range(self):
+        """GET /api/orders/export/ndjson/ - NDJSON-Export mit created_at-Filter"""
+        old_order = Orders.objects.create(
+            offer_detail=self.offer_detail,
+            customer_user=self.customer_user,
+            business_user=self.business_user,
+        )
+        Orders.objects.filter(pk=old_order.pk).update(created_at=timezone.now() - timedelta(days=30))
+        self.client.force_authenticate(user=self.customer_user)
+        url = reverse('orders-export', kwargs={'export_format': 'ndjson'})
+
+        response = self.client.get(url, {'created_after': (timezone.now() - timedelta(days=1)).isoformat()})
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [self.order.id])
+
+        response = self.client.get(url, {'created_before': (timezone.now() - timedelta(days=1)).date().isoformat()})
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [old_order.id])
+
+    def test_order_list_pagination(self):
+        """GET /api/orders/?page_size= - Mit page oder page_size wird die Liste paginiert"""
+        for _ in range(4):
+            Orders.objects.create(
+                offer_detail=self.offer_detail,
+                customer_user=self.customer_user,
+                business_user=self.business_user,
+            )
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.get(reverse('orders-list'), {'page_size': 2, 'page': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNotNone(response.data['previous'])
+
     def test_create_order_as_customer_success(self):
         """POST /api/orders/ - Customer kann Order erstellen"""
         self.client.force_authenticate(user=self.customer_user)
@@ -115,6 +231,45 @@ class OrdersAPIHappyPathTestCase(APITestCase):
         self.assertEqual(response.data['business_user'], self.business_user.id)
         self.assertEqual(response.data['status'], 'in_progress')
 
+    def test_bulk_create_orders_as_customer_success(self):
+        """POST /api/orders/bulk/ - Customer kann mehrere Orders auf einmal erstellen"""
+        second_detail = OfferDetail.objects.create(
+            offer=self.offer, title='Logo Design Premium', revisions=5, delivery_time_in_days=10,
+            price=400, features=['Logo'], offer_type='premium'
+        )
+        self.client.force_authenticate(user=User.objects.get(pk=self.customer_user.pk))
+        url = reverse('orders-bulk-create')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                url, {'offer_detail_ids': [self.offer_detail.id, second_detail.id, self.offer_detail.id]}, format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual([order['price'] for order in response.data], [150, 400, 150])
+        self.assertTrue(all(order['business_user'] == self.business_user.id for order in response.data))
+        self.assertTrue(all(order['customer_user'] == self.customer_user.id for order in response.data))
+        self.assertNotIn('updated_at', response.data[0])
+        self.assertEqual(Orders.objects.filter(customer_user=self.customer_user).count(), 4)
+
+        insert_queries = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "order_app_orders"')]
+        self.assertEqual(len(insert_queries), 1)
+        detail_queries = [q for q in queries.captured_queries if 'FROM "offer_app_offerdetail"' in q['sql']]
+        self.assertEqual(len(detail_queries), 1)
+
+    def test_update_order_resolves_profile_type_once(self):
+        """PATCH /api/orders/{id}/ - Profiltyp wird für beide Permission-Checks nur einmal geladen"""
+        self.client.force_authenticate(user=User.objects.get(pk=self.business_user.pk))
+        url = reverse('orders-detail', kwargs={'pk': self.order.id})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(url, {'status': 'completed'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_queries = [q for q in queries.captured_queries if 'profile_app_profile' in q['sql']]
+        self.assertEqual(len(profile_queries), 1)
+
     def test_update_order_status_as_business_user_success(self):
         """PATCH /api/orders/{id}/ - Business User kann Order-Status aktualisieren"""
         self.client.force_authenticate(user=self.business_user)
@@ -179,6 +334,38 @@ class OrdersAPIHappyPathTestCase(APITestCase):
         self.assertIn('completed_order_count', response.data)
         self.assertGreaterEqual(response.data['completed_order_count'], 1)
 
+    def test_retrieve_unchanged_order_returns_304(self):
+        """GET /api/orders/{id}/ - Unveränderte Order liefert mit If-None-Match Status 304"""
+        self.client.force_authenticate(user=self.customer_user)
+        url = reverse('orders-detail', kwargs={'pk': self.order.id})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.order.status = 'completed'
+        self.order.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'completed')
+
+    def test_retrieve_order_etag_changes_with_offer_detail(self):
+        """GET /api/orders/{id}/ - Änderungen am Angebotsdetail erneuern den ETag der Order"""
+        self.client.force_authenticate(user=self.customer_user)
+        url = reverse('orders-detail', kwargs={'pk': self.order.id})
+        etag = self.client.get(url)['ETag']
+
+        self.offer_detail.price = 200
+        self.offer_detail.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['price'], 200)
+
 
 class OrdersAPIUnhappyPathTestCase(APITestCase):
     """Tests für fehlerhafte Order-Operationen (Unhappy Paths)"""
@@ -290,6 +477,51 @@ class OrdersAPIUnhappyPathTestCase(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_bulk_create_orders_as_business_user_fails(self):
+        """POST /api/orders/bulk/ - Business User kann keine Orders erstellen"""
+        self.client.force_authenticate(user=self.business_user)
+        url = reverse('orders-bulk-create')
+
+        response = self.client.post(url, {'offer_detail_ids': [self.offer_detail.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_create_orders_with_invalid_offer_detail_fails(self):
+        """POST /api/orders/bulk/ - Unbekannte Offer Details verhindern alle Orders"""
+        self.client.force_authenticate(user=self.customer_user)
+        url = reverse('orders-bulk-create')
+        before = Orders.objects.count()
+
+        response = self.client.post(url, {'offer_detail_ids': [self.offer_detail.id, 99999]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('99999', str(response.data['offer_detail_ids']))
+        self.assertEqual(Orders.objects.count(), before)
+
+    def test_bulk_create_orders_with_empty_list_fails(self):
+        """POST /api/orders/bulk/ - Eine leere Liste ist ungültig"""
+        self.client.force_authenticate(user=self.customer_user)
+        url = reverse('orders-bulk-create')
+
+        response = self.client.post(url, {'offer_detail_ids': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_orders_with_invalid_date_fails(self):
+        """GET /api/orders/export/csv/ - Ungültiges Datum liefert 400"""
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.get(reverse('orders-export', kwargs={'export_format': 'csv'}), {'created_after': 'gestern'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('created_after', response.data)
+
+    def test_export_orders_without_authentication_fails(self):
+        """GET /api/orders/export/csv/ - Unauthenticated (401)"""
+        response = self.client.get(reverse('orders-export', kwargs={'export_format': 'csv'}))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
     def test_update_order_as_customer_fails(self):
         """PATCH /api/orders/{id}/ - Customer kann Order-Status nicht ändern (403)"""
         self.client.force_authenticate(user=self.customer_user)
@@ -431,4 +663,235 @@ class OrdersAPIUnhappyPathTestCase(APITestCase):
         
         response = self.client.get(url)
         
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class BusinessOrderCounterTests(APITestCase):
+    """Tests für die materialisierten Order-Zähler pro Business User"""
+
+    def setUp(self):
+        self.customer_user = User.objects.create_user(username='customer1', password='testpass123')
+        Profile.objects.create(user=self.customer_user, type='customer')
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.admin_user = User.objects.create_user(username='admin1', password='testpass123', is_staff=True)
+
+        offer = Offer.objects.create(user=self.business_user, title='Logo Design', description='Test')
+        self.offer_detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1, delivery_time_in_days=5,
+            price=100, features=[], offer_type='basic'
+        )
+
+    def counters(self):
+        return self.client.get(reverse('order-counts', kwargs={'pk': self.business_user.id})).data
+
+    def create_order(self):
+        self.client.force_authenticate(user=self.customer_user)
+        response = self.client.post(reverse('orders-list'), {'offer_detail_id': self.offer_detail.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['id']
+
+    def test_counters_follow_order_lifecycle(self):
+        """Anlegen, Statuswechsel und Löschen einer Order aktualisieren die Zähler"""
+        order_id = self.create_order()
+        self.create_order()
+        self.assertEqual(self.counters(), {'in_progress': 2, 'completed': 0, 'cancelled': 0})
+
+        self.client.force_authenticate(user=self.business_user)
+        self.client.patch(reverse('orders-detail', kwargs={'pk': order_id}), {'status': 'completed'}, format='json')
+        self.assertEqual(self.counters(), {'in_progress': 1, 'completed': 1, 'cancelled': 0})
+
+        self.client.force_authenticate(user=self.admin_user)
+        self.client.delete(reverse('orders-detail', kwargs={'pk': order_id}))
+        self.assertEqual(self.counters(), {'in_progress': 1, 'completed': 0, 'cancelled': 0})
+
+    def test_concurrent_status_changes_are_counted_once(self):
+        """Zwei gleichzeitig geladene Orders mit demselben Statuswechsel verschieben die Zähler nur einmal"""
+        order_id = self.create_order()
+        first = Orders.objects.get(pk=order_id)
+        second = Orders.objects.get(pk=order_id)
+
+        first.status = 'completed'
+        first.save()
+        second.status = 'completed'
+        second.save()
+
+        counter = BusinessOrderCounter.objects.get(pk=self.business_user.id)
+        self.assertEqual((counter.in_progress, counter.completed, counter.cancelled), (0, 1, 0))
+
+    def test_status_change_after_concurrent_change_uses_stored_status(self):
+        """Ein Statuswechsel wird vom tatsächlich gespeicherten Status aus gezählt"""
+        order_id = self.create_order()
+        first = Orders.objects.get(pk=order_id)
+        second = Orders.objects.get(pk=order_id)
+
+        first.status = 'completed'
+        first.save()
+        second.status = 'cancelled'
+        second.save()
+
+        counter = BusinessOrderCounter.objects.get(pk=self.business_user.id)
+        self.assertEqual((counter.in_progress, counter.completed, counter.cancelled), (0, 0, 1))
+
+    def test_bulk_created_orders_are_counted(self):
+        """Per Bulk-Endpoint erstellte Orders werden mitgezählt"""
+        self.create_order()
+        self.client.post(
+            reverse('orders-bulk-create'), {'offer_detail_ids': [self.offer_detail.id] * 3}, format='json'
+        )
+
+        self.assertEqual(self.counters()['in_progress'], 4)
+
+    def test_count_endpoints_read_counters_with_one_query(self):
+        """Die Count-Endpoints kommen mit einer Query aus"""
+        self.create_order()
+        self.client.force_authenticate(user=self.customer_user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('order-count-in-progress', kwargs={'pk': self.business_user.id}))
+        self.assertEqual(response.data, {'order_count': 1})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('order-count-completed', kwargs={'pk': self.business_user.id}))
+        self.assertEqual(response.data, {'completed_order_count': 0})
+
+    def test_business_user_without_orders_has_zero_counters(self):
+        """Business User ohne Orders haben Zähler von 0"""
+        self.client.force_authenticate(user=self.customer_user)
+
+        self.assertEqual(self.counters(), {'in_progress': 0, 'completed': 0, 'cancelled': 0})
+
+    def test_order_counts_for_non_business_user_fails(self):
+        """Der kombinierte Endpoint liefert 404 für Customer User"""
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.get(reverse('order-counts', kwargs={'pk': self.customer_user.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deleting_business_user_deletes_counters(self):
+        """Beim Löschen eines Business Users werden Orders und Zähler entfernt"""
+        self.create_order()
+
+        self.business_user.delete()
+
+        self.assertFalse(BusinessOrderCounter.objects.exists())
+
+    def test_reconcile_command(self):
+        """Der Management-Command erkennt und korrigiert Abweichungen"""
+        self.create_order()
+        BusinessOrderCounter.objects.update(in_progress=7)
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_order_counters', '--check', stdout=StringIO())
+
+        call_command('reconcile_order_counters', stdout=StringIO())
+        call_command('reconcile_order_counters', '--check', stdout=StringIO())
+        self.assertEqual(BusinessOrderCounter.objects.get().in_progress, 1)
+
+
+class OrderQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query-Budget Tests: Die Bestellliste darf nicht mit der Anzahl der Bestellungen wachsen
+    """
+
+    def setUp(self):
+        self.customer_user = User.objects.create_user(username='customer1', password='testpass123')
+        Profile.objects.create(user=self.customer_user, type='customer')
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        offer = Offer.objects.create(user=self.business_user, title='Logo Design', description='Logo')
+        self.offer_detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=100, features=['Logo'], offer_type='basic'
+        )
+
+    def create_orders(self, count):
+        for _ in range(count):
+            Orders.objects.create(
+                offer_detail=self.offer_detail,
+                customer_user=self.customer_user,
+                business_user=self.business_user,
+            )
+
+    def test_orders_list_budget_as_customer(self):
+        """
+        Die Bestellliste eines Kunden bleibt bei 1 und 10 Bestellungen im Budget
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        self.assertQueryBudget('orders-list', self.create_orders)
+
+    def test_orders_list_budget_as_business(self):
+        """
+        Die Bestellliste eines Business Users bleibt bei 1 und 10 Bestellungen im Budget
+        """
+        self.client.force_authenticate(user=self.business_user)
+        self.assertQueryBudget('orders-list', self.create_orders)
+
+
+@override_settings(ROOT_URLCONF='core.async_urls')
+class AsyncOrderCountViewTests(APITestCase):
+    """
+    Tests für die asynchronen Order-Count-Views (ASYNC_READ_VIEWS)
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.customer_user = User.objects.create_user(username='customer1', password='testpass123')
+        Profile.objects.create(user=self.customer_user, type='customer')
+        offer = Offer.objects.create(user=self.business_user, title='Logo Design', description='Logo')
+        offer_detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=100, features=['Logo'], offer_type='basic'
+        )
+        for order_status in ('in_progress', 'in_progress', 'completed'):
+            Orders.objects.create(
+                offer_detail=offer_detail, customer_user=self.customer_user,
+                business_user=self.business_user, status=order_status
+            )
+        token = Token.objects.create(user=self.customer_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.auth_headers = {'Authorization': f'Token {token.key}'}
+
+    def test_counts(self):
+        """
+        Die asynchronen Views liefern dieselben Zähler wie die synchronen
+        """
+        pk = self.business_user.pk
+
+        self.assertEqual(self.client.get(reverse('order-count-in-progress', kwargs={'pk': pk})).json(), {'order_count': 2})
+        self.assertEqual(
+            self.client.get(reverse('order-count-completed', kwargs={'pk': pk})).json(), {'completed_order_count': 1}
+        )
+        self.assertEqual(
+            self.client.get(reverse('order-counts', kwargs={'pk': pk})).json(),
+            {'in_progress': 2, 'completed': 1, 'cancelled': 0}
+        )
+
+    def test_errors(self):
+        """
+        Unbekannte und Nicht-Business User liefern 404, anonyme Requests 401
+        """
+        self.assertEqual(self.client.get(reverse('order-counts', kwargs={'pk': 999})).status_code, 404)
+        response = self.client.get(reverse('order-counts', kwargs={'pk': self.customer_user.pk}))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'detail': 'User is not a business user.'})
+
+        self.client.credentials()
+        self.assertEqual(self.client.get(reverse('order-counts', kwargs={'pk': self.business_user.pk})).status_code, 401)
+
+    async def test_streaming_under_asgi(self):
+        """
+        Gestreamte Listen und Exporte werden unter ASGI asynchron gestreamt statt vorab gesammelt
+        """
+        response = await self.async_client.get(reverse('orders-list'), {'stream': '1'}, headers=self.auth_headers)
+        self.assertTrue(response.is_async)
+        content = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(json.loads(content)), 3)
+
+        url = reverse('orders-export', kwargs={'export_format': 'csv'})
+        response = await self.async_client.get(url, headers=self.auth_headers)
+        self.assertTrue(response.is_async)
+        content = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(list(csv.DictReader(content.decode('utf-8').splitlines()))), 3)
@@ -1,14 +1,17 @@
-from collections import OrderedDict
-
 from rest_framework import serializers
 
+from core.serializers import NullAsEmptyEmailField, NullAsEmptyStringModelSerializer, SparseFieldsetMixin
+
 from ..models import Profile
 
-class ProfileSerializer(serializers.ModelSerializer):
-    """Full serializer for user profiles including email management."""
+class ProfileSerializer(NullAsEmptyStringModelSerializer):
+    """Full serializer for user profiles including email management.
+
+    Null text fields are rendered as empty strings, in the order of Meta.fields.
+    """
     user = serializers.PrimaryKeyRelatedField(read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
-    email = serializers.EmailField(required=False)
+    email = NullAsEmptyEmailField(source='user.email', required=False)
 
     class Meta:
         model = Profile
@@ -28,47 +31,9 @@ class ProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['user', 'username', 'type', 'created_at']
 
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-
-        for field in [
-            'first_name',
-            'last_name',
-            'location',
-            'tel',
-            'description',
-            'working_hours'
-        ]:
-            if data[field] is None:
-                data[field] = ''
-
-        data["email"] = instance.user.email or ""
-
-        field_order = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type',
-            'email',
-            'created_at'
-        ]
-
-        ordered = OrderedDict()
-        for field in field_order:
-            if field in data:
-                ordered[field] = data[field]
-
-        return ordered
-    
     def update(self, instance, validated_data):
         """Update profile and associated user email if provided."""
-        email = validated_data.pop('email', None)
+        email = validated_data.pop('user', {}).get('email')
 
         if email is not None:
             user = instance.user
@@ -77,8 +42,11 @@ class ProfileSerializer(serializers.ModelSerializer):
         
         return super().update(instance, validated_data)
     
-class BaseProfileSerializer(serializers.ModelSerializer):
-    """Base serializer for profiles without email field."""
+class BaseProfileSerializer(SparseFieldsetMixin, NullAsEmptyStringModelSerializer):
+    """Base serializer for profiles without email field, supporting `?fields=`.
+
+    Null text fields are rendered as empty strings, in the order of Meta.fields.
+    """
     user = serializers.PrimaryKeyRelatedField(read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
 
@@ -97,40 +65,6 @@ class BaseProfileSerializer(serializers.ModelSerializer):
             'type'
         ]
         read_only_fields = ['user', 'username', 'type']
-
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-
-        for field in [
-            'first_name',
-            'last_name',
-            'location',
-            'tel',
-            'description',
-            'working_hours'
-        ]:
-            if field in data and data[field] is None:
-                data[field] = ''
-
-        field_order = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type'
-        ]
-
-        ordered = OrderedDict()
-        for field in field_order:
-            if field in data:
-                ordered[field] = data[field]
-
-        return ordered
     
 class BusinessProfileSerializer(BaseProfileSerializer):
     """Serializer for business profiles with extended fields."""
@@ -145,8 +79,11 @@ class BusinessProfileSerializer(BaseProfileSerializer):
            'tel',
            'description',
            'working_hours',
-           'type'
+           'type',
+           'review_count',
+           'average_rating'
        ]
+       read_only_fields = BaseProfileSerializer.Meta.read_only_fields + ['review_count', 'average_rating']
     
 class CustomerProfileSerializer(BaseProfileSerializer):
     """Serializer for customer profiles with basic fields."""
@@ -1,13 +1,28 @@
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
-from rest_framework import generics, mixins
+from django_filters.rest_framework import DjangoFilterBackend
+
+from rest_framework import generics, mixins, filters as drf_filters
 from rest_framework.permissions import IsAuthenticated
 
+from core.conditional import timestamp_etag
+from core.pagination import OptionalPageNumberPagination
+from core.streaming import StreamingListMixin
+
 from .serializers import ProfileSerializer, BusinessProfileSerializer, CustomerProfileSerializer, BaseProfileSerializer
 from ..models import Profile
+from ..filters.profile_filters import BusinessProfileFilter
 from .permissions import IsProfileOwnerOrReadOnly
 from ..models import Profile as Profiles
 
+def profile_etag(request, pk=None, **kwargs):
+    """ETag of the profile of the user with the given ID."""
+    return timestamp_etag(Profile.objects.filter(user=pk), 'updated_at')
+
+
+@method_decorator(condition(etag_func=profile_etag), name='get')
 class ProfileView(mixins.RetrieveModelMixin, mixins.UpdateModelMixin, generics.GenericAPIView):
     """API view for retrieving and updating user profiles."""
 
@@ -30,11 +45,21 @@ class ProfileView(mixins.RetrieveModelMixin, mixins.UpdateModelMixin, generics.G
         """Handle PATCH request to update a profile."""
         return self.partial_update(request, *args, **kwargs)
     
-class ProfilesListView(generics.ListAPIView):
-    """API view for listing profiles filtered by type (business or customer)."""
+class ProfilesListView(StreamingListMixin, generics.ListAPIView):
+    """API view for listing profiles filtered by type (business or customer).
+
+    Business profiles can be filtered and ordered by their stored rating
+    aggregates, e.g. `?ordering=-average_rating&min_review_count=5`.
+    `?page=` / `?page_size=` paginate the list, `?stream=1` streams it and
+    `?fields=` selects the serialized fields.
+    """
     permission_classes = [IsAuthenticated]
     queryset = Profile.objects.all()
     mode = None
+    filter_backends = [DjangoFilterBackend, drf_filters.OrderingFilter]
+    filterset_class = BusinessProfileFilter
+    pagination_class = OptionalPageNumberPagination
+    ordering_fields = ['average_rating', 'review_count']
 
     def get_dispatch(self, request, *args, **kwargs):
         """Handle dispatch with mode parameter."""
@@ -44,13 +69,19 @@ class ProfilesListView(generics.ListAPIView):
     
     def get_queryset(self):
         """Return profiles filtered by type based on mode."""
-        query_set = Profiles.objects.all()
+        query_set = Profiles.objects.select_related('user').order_by('pk')
 
         if self.mode == 'business':
             query_set = query_set.filter(type='business')
         elif self.mode == 'customer':
             query_set = query_set.filter(type='customer')
         return query_set
+
+    def filter_queryset(self, queryset):
+        """Apply rating filters and ordering to business profiles only."""
+        if self.mode != 'business':
+            return queryset
+        return super().filter_queryset(queryset)
     
     def get_serializer_class(self):
         """Return appropriate serializer based on profile type."""
@@ -0,0 +1,11 @@
+from django_filters import rest_framework as filters
+
+from ..models import Profile
+
+class BusinessProfileFilter(filters.FilterSet):
+    min_rating = filters.NumberFilter(field_name='average_rating', lookup_expr='gte')
+    min_review_count = filters.NumberFilter(field_name='review_count', lookup_expr='gte')
+
+    class Meta:
+        model = Profile
+        fields = ['min_rating', 'min_review_count']
@@ -0,0 +1,80 @@
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from rest_framework import serializers
+
+from profile_app.api.serializers import ProfileSerializer
+from profile_app.models import Profile
+
+
+class LegacyProfileSerializer(serializers.ModelSerializer):
+    """Previous implementation of ProfileSerializer, used as benchmark baseline."""
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    username = serializers.CharField(source='user.username', read_only=True)
+    email = serializers.EmailField(required=False)
+
+    class Meta:
+        model = Profile
+        fields = ProfileSerializer.Meta.fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+
+        for field in ['first_name', 'last_name', 'location', 'tel', 'description', 'working_hours']:
+            if data[field] is None:
+                data[field] = ''
+
+        data['email'] = instance.user.email or ''
+
+        ordered = OrderedDict()
+        for field in ProfileSerializer.Meta.fields:
+            if field in data:
+                ordered[field] = data[field]
+        return ordered
+
+
+def build_profiles(count):
+    """Return `count` unsaved business profiles with a mix of empty and filled fields."""
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        Profile(
+            pk=i,
+            user=User(pk=i, username=f'user{i}', email='' if i % 2 else f'user{i}@mail.de'),
+            type='business',
+            first_name=None if i % 2 else 'Max',
+            description='Beschreibung',
+            created_at=created_at,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+class Command(BaseCommand):
+    """Compare the serialization time of ProfileSerializer with its previous implementation."""
+    help = 'Serialize unsaved profiles with the legacy and the current ProfileSerializer and report the best times.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', type=int, default=10000, help='Number of profiles to serialize.')
+        parser.add_argument('--rounds', type=int, default=5, help='Timed rounds per serializer.')
+
+    def handle(self, *args, **options):
+        profiles = build_profiles(options['profiles'])
+        serializer_classes = (LegacyProfileSerializer, ProfileSerializer)
+
+        # Timed alternately so load spikes hit both serializers.
+        best = [None] * len(serializer_classes)
+        for _ in range(options['rounds']):
+            for index, serializer_class in enumerate(serializer_classes):
+                started = time.perf_counter()
+                serializer_class(profiles, many=True).data
+                elapsed = time.perf_counter() - started
+                best[index] = elapsed if best[index] is None else min(best[index], elapsed)
+
+        legacy, current = best
+        self.stdout.write(
+            f'ProfileSerializer, {options["profiles"]} profiles: legacy {legacy * 1000:.0f} ms, '
+            f'current {current * 1000:.0f} ms ({legacy / current:.2f}x)'
+        )
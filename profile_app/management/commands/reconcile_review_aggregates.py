@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from profile_app.models import Profile
+
+
+class Command(BaseCommand):
+    """Recompute the review_count / rating_sum / average_rating aggregates of business profiles."""
+    help = 'Reconcile the stored rating aggregates of all profiles, or report drift with --check.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report profiles whose aggregates differ from their reviews, without writing.',
+        )
+
+    def handle(self, *args, **options):
+        if not options['check']:
+            Profile.reconcile_review_aggregates()
+            self.stdout.write(self.style.SUCCESS('Review aggregates reconciled.'))
+            return
+
+        expected = Profile.compute_review_aggregates()
+        drifted = [
+            user_id
+            for user_id, review_count, rating_sum in Profile.objects.values_list('user_id', 'review_count', 'rating_sum').iterator()
+            if (review_count, rating_sum) != expected.get(user_id, (0, 0))
+        ]
+
+        if drifted:
+            raise CommandError(f'{len(drifted)} profiles have stale review aggregates, e.g. {drifted[:20]}.')
+        self.stdout.write(self.style.SUCCESS('All review aggregates are up to date.'))
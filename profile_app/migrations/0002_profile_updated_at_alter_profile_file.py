@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profile_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='file',
+            field=models.FileField(blank=True, null=True, upload_to='static/profiles/'),
+        ),
+    ]
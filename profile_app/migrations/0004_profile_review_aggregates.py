@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:23
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_review_aggregates(apps, schema_editor):
+    Profile = apps.get_model('profile_app', 'Profile')
+    Reviews = apps.get_model('review_app', 'Reviews')
+
+    rows = Reviews.objects.order_by().values_list('business_user').annotate(count=Count('pk'), total=Sum('rating'))
+    for business_user_id, count, total in rows:
+        Profile.objects.filter(user_id=business_user_id).update(
+            review_count=count, rating_sum=total, average_rating=total / count
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profile_app', '0003_hot_path_indexes'),
+        ('review_app', '0002_hot_path_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='average_rating',
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='rating_sum',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='review_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['type', '-average_rating'], name='profile_type_rating_idx'),
+        ),
+        migrations.RunPython(backfill_review_aggregates, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,9 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import Count, F, FloatField, Sum, Value
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+from review_app.models import Reviews
 
 class Profile(models.Model):
     """Extended user profile with additional information for customers and businesses."""
@@ -15,4 +19,56 @@ class Profile(models.Model):
 
     type = models.CharField(max_length=20, choices=[('customer', 'customer'), ('business', 'business')])
 
-    created_at = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    review_count = models.IntegerField(default=0, editable=False)
+    rating_sum = models.IntegerField(default=0, editable=False)
+    average_rating = models.FloatField(default=0, editable=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['type'], name='profile_type_idx'),
+            models.Index(fields=['type', '-average_rating'], name='profile_type_rating_idx'),
+        ]
+
+    @staticmethod
+    def average_rating_expression(review_count, rating_sum):
+        """Return the SQL expression for the average rating, 0 if there are no reviews."""
+        return Coalesce(Cast(rating_sum, FloatField()) / NullIf(review_count, 0), Value(0.0))
+
+    @classmethod
+    def apply_review_delta(cls, business_user_id, review_count=0, rating_sum=0):
+        """Atomically add review deltas to the rating aggregates of a business user's profile."""
+        if not review_count and not rating_sum:
+            return
+
+        new_count = F('review_count') + review_count
+        new_sum = F('rating_sum') + rating_sum
+        cls.objects.filter(user_id=business_user_id).update(
+            review_count=new_count,
+            rating_sum=new_sum,
+            average_rating=cls.average_rating_expression(new_count, new_sum),
+        )
+
+    @classmethod
+    def compute_review_aggregates(cls, queryset=None):
+        """Return {user_id: (review_count, rating_sum)} of the given profiles (all if None) from the reviews."""
+        reviews = Reviews.objects.order_by()
+        if queryset is not None:
+            reviews = reviews.filter(business_user__in=queryset.values('user_id'))
+        rows = reviews.values_list('business_user').annotate(count=Count('pk'), total=Sum('rating'))
+        return {business_user_id: (count, total) for business_user_id, count, total in rows}
+
+    @classmethod
+    def reconcile_review_aggregates(cls, queryset=None):
+        """Recompute the rating aggregates of the given profiles (all if None) from the reviews."""
+        if queryset is None:
+            queryset = cls.objects.all()
+        aggregates = cls.compute_review_aggregates(queryset)
+
+        queryset.exclude(user_id__in=aggregates).update(review_count=0, rating_sum=0, average_rating=0)
+        for business_user_id, (count, total) in aggregates.items():
+            queryset.filter(user_id=business_user_id).update(
+                review_count=count, rating_sum=total, average_rating=total / count
+            )
\ No newline at end of file
@@ -0,0 +1,39 @@
+from django.contrib.auth.models import User
+
+PROFILE_TYPE_ATTR = '_profile_type'
+
+
+def get_profile_type(request):
+    """Return the profile type ('business' or 'customer') of the requesting user.
+
+    The type is resolved once per request and memoized on the underlying
+    HttpRequest, so several permission checks share a single lookup. A
+    profile that is already cached on `request.user` is used without a
+    query; otherwise user and profile are fetched together. Returns None
+    for anonymous users and users without a profile.
+    """
+    http_request = getattr(request, '_request', request)
+    if hasattr(http_request, PROFILE_TYPE_ATTR):
+        return getattr(http_request, PROFILE_TYPE_ATTR)
+
+    user = getattr(request, 'user', None)
+    profile_type = None
+
+    if user is not None and user.is_authenticated:
+        if not User.profile.is_cached(user):
+            user = User.objects.select_related('profile').filter(pk=user.pk).first()
+        profile = getattr(user, 'profile', None)
+        profile_type = getattr(profile, 'type', None)
+
+    setattr(http_request, PROFILE_TYPE_ATTR, profile_type)
+    return profile_type
+
+
+def is_business(request):
+    """Return True if the requesting user has a business profile."""
+    return get_profile_type(request) == 'business'
+
+
+def is_customer(request):
+    """Return True if the requesting user has a customer profile."""
+    return get_profile_type(request) == 'customer'
@@ -1,6 +1,20 @@
-from rest_framework.test import APITestCase
+import json
+from io import StringIO
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory
+from rest_framework.test import APISimpleTestCase, APITestCase
 from django.urls import reverse
 
+from core.query_budget import QueryBudgetMixin
+from profile_app.api.serializers import ProfileSerializer
+from profile_app.management.commands.benchmark_profile_serializer import LegacyProfileSerializer, build_profiles
+from profile_app.models import Profile
+from review_app.models import Reviews
+from profile_app.roles import get_profile_type, is_business, is_customer
+
 def registerUser(self):
     reg_url = reverse('registration')
     payload = {
@@ -203,4 +217,287 @@ class ProfileTests(APITestCase):
         """
         url = reverse('profilesListCustomer')
         response = self.client.get(url, format='json')
-        self.assertEqual(response.status_code, 401)
\ No newline at end of file
+        self.assertEqual(response.status_code, 401)
+
+    def test_get_profile_not_modified(self):
+        """
+        Ein unverändertes Profil wird per If-None-Match mit 304 beantwortet, nach einer Änderung wieder vollständig
+        """
+        token = registerUser(self)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token)
+        url = reverse('profileGetPatch', kwargs={'pk': User.objects.get(username='loginUser').pk})
+
+        etag = self.client.get(url, format='json')['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.patch(url, {'location': 'Berlin'}, format='json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['location'], 'Berlin')
+
+class ProfileListTests(APITestCase):
+    """
+    Tests für Pagination, Feldauswahl und Query-Anzahl der Profil-Listen
+    """
+
+    def setUp(self):
+        for i in range(5):
+            user = User.objects.create_user(username=f'business{i}', password='testpass123')
+            Profile.objects.create(user=user, type='business', description='Lange Beschreibung')
+        self.client.force_authenticate(user=User.objects.get(username='business0'))
+
+    def test_list_is_loaded_with_one_query(self):
+        """
+        Die Liste lädt Profile inkl. User mit einer einzigen Query
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('profilesListBusiness'))
+
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(response.data[0]['username'], 'business0')
+
+    def test_pagination(self):
+        """
+        Mit page_size wird die Liste paginiert, ohne bleibt sie eine einfache Liste
+        """
+        response = self.client.get(reverse('profilesListBusiness'), {'page_size': 2, 'page': 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual([profile['username'] for profile in response.data['results']], ['business4'])
+        self.assertIsNone(response.data['next'])
+
+    def test_sparse_fieldset(self):
+        """
+        Mit ?fields= werden nur die angefragten Felder ausgeliefert
+        """
+        response = self.client.get(reverse('profilesListBusiness'), {'fields': 'user,username,file'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data[0]), ['user', 'username', 'file'])
+
+    def test_streamed_list_with_sparse_fieldset(self):
+        """
+        Mit ?stream=1 wird die Liste gestreamt, ?fields= gilt auch für den Stream
+        """
+        response = self.client.get(reverse('profilesListBusiness'), {'stream': '1', 'fields': 'user,username'})
+
+        self.assertTrue(response.streaming)
+        rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(list(rows[0]), ['user', 'username'])
+
+    def test_sparse_fieldset_with_unknown_field_fails(self):
+        """
+        Unbekannte Felder in ?fields= liefern Status 400
+        """
+        response = self.client.get(reverse('profilesListCustomer'), {'fields': 'user,description'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('description', str(response.data['fields']))
+
+
+class ProfileTypeResolverTests(APITestCase):
+    """Tests für die pro Request gemerkte Auflösung des Profiltyps"""
+
+    def setUp(self):
+        user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=user, type='business')
+        self.user_without_profile = User.objects.create_user(username='noprofile', password='testpass123')
+        self.factory = RequestFactory()
+
+    def make_request(self, user):
+        request = self.factory.get('/')
+        request.user = user
+        return request
+
+    def test_profile_type_is_resolved_once_per_request(self):
+        """
+        Der Profiltyp wird mit einer Query geladen und danach aus dem Request gelesen
+        """
+        request = self.make_request(User.objects.get(username='business1'))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_profile_type(request), 'business')
+            self.assertTrue(is_business(request))
+            self.assertFalse(is_customer(request))
+
+    def test_cached_profile_needs_no_query(self):
+        """
+        Ein bereits am User geladenes Profil wird ohne Query verwendet
+        """
+        user = User.objects.select_related('profile').get(username='business1')
+        request = self.make_request(user)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_profile_type(request), 'business')
+
+    def test_anonymous_and_missing_profile(self):
+        """
+        Anonyme User und User ohne Profil haben keinen Profiltyp
+        """
+        self.assertIsNone(get_profile_type(self.make_request(AnonymousUser())))
+        self.assertIsNone(get_profile_type(self.make_request(self.user_without_profile)))
+
+
+class BusinessRatingAggregateTests(APITestCase):
+    """
+    Tests für die gespeicherten Bewertungs-Aggregate der Business-Profile
+    """
+
+    def setUp(self):
+        self.customers = []
+        for i in range(3):
+            customer = User.objects.create_user(username=f'customer{i}', password='testpass123')
+            Profile.objects.create(user=customer, type='customer')
+            self.customers.append(customer)
+        self.top_business = User.objects.create_user(username='top', password='testpass123')
+        Profile.objects.create(user=self.top_business, type='business')
+        self.other_business = User.objects.create_user(username='other', password='testpass123')
+        Profile.objects.create(user=self.other_business, type='business')
+
+    def post_review(self, customer, business_user, rating):
+        self.client.force_authenticate(user=customer)
+        response = self.client.post(
+            reverse('reviews-list'),
+            {'business_user': business_user.id, 'rating': rating, 'description': 'Test'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+
+    def business_profiles(self, **params):
+        return {
+            profile['username']: profile
+            for profile in self.client.get(reverse('profilesListBusiness'), params).data
+        }
+
+    def test_aggregates_follow_review_lifecycle(self):
+        """
+        Erstellen, Ändern und Löschen von Bewertungen aktualisieren Anzahl und Durchschnitt
+        """
+        review_id = self.post_review(self.customers[0], self.top_business, 5)
+        self.post_review(self.customers[1], self.top_business, 2)
+        profile = self.business_profiles()['top']
+        self.assertEqual(profile['review_count'], 2)
+        self.assertEqual(profile['average_rating'], 3.5)
+
+        self.client.force_authenticate(user=self.customers[0])
+        self.client.patch(reverse('reviews-detail', kwargs={'pk': review_id}), {'rating': 4}, format='json')
+        self.assertEqual(self.business_profiles()['top']['average_rating'], 3.0)
+
+        self.client.delete(reverse('reviews-detail', kwargs={'pk': review_id}))
+        profile = self.business_profiles()['top']
+        self.assertEqual(profile['review_count'], 1)
+        self.assertEqual(profile['average_rating'], 2.0)
+
+    def test_business_without_reviews_has_zero_average(self):
+        """
+        Business-Profile ohne Bewertungen haben Anzahl und Durchschnitt 0
+        """
+        self.client.force_authenticate(user=self.customers[0])
+        profile = self.business_profiles()['other']
+
+        self.assertEqual(profile['review_count'], 0)
+        self.assertEqual(profile['average_rating'], 0)
+
+    def test_order_and_filter_by_rating(self):
+        """
+        Business-Profile lassen sich nach Durchschnitt sortieren und nach Mindestwerten filtern
+        """
+        self.post_review(self.customers[0], self.top_business, 5)
+        self.post_review(self.customers[1], self.top_business, 4)
+        self.post_review(self.customers[0], self.other_business, 3)
+
+        response = self.client.get(reverse('profilesListBusiness'), {'ordering': '-average_rating'})
+        self.assertEqual([profile['username'] for profile in response.data], ['top', 'other'])
+
+        response = self.client.get(reverse('profilesListBusiness'), {'ordering': 'average_rating'})
+        self.assertEqual([profile['username'] for profile in response.data], ['other', 'top'])
+
+        self.assertEqual(list(self.business_profiles(min_rating=4)), ['top'])
+        self.assertEqual(list(self.business_profiles(min_review_count=2)), ['top'])
+
+    def test_customer_profiles_have_no_rating_fields(self):
+        """
+        Customer-Profile enthalten keine Bewertungs-Aggregate
+        """
+        self.client.force_authenticate(user=self.customers[0])
+
+        response = self.client.get(reverse('profilesListCustomer'))
+
+        self.assertNotIn('average_rating', response.data[0])
+
+    def test_reconcile_command(self):
+        """
+        Der Management-Command erkennt und korrigiert abweichende Aggregate
+        """
+        self.post_review(self.customers[0], self.top_business, 5)
+        Reviews.objects.filter(business_user=self.top_business).update(rating=1)
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_review_aggregates', '--check', stdout=StringIO())
+
+        call_command('reconcile_review_aggregates', stdout=StringIO())
+        call_command('reconcile_review_aggregates', '--check', stdout=StringIO())
+        profile = Profile.objects.get(user=self.top_business)
+        self.assertEqual((profile.review_count, profile.rating_sum, profile.average_rating), (1, 1, 1.0))
+
+
+class ProfileSerializerOutputTests(APISimpleTestCase):
+    """
+    Vergleich der Profil-Serialisierung mit der vorherigen Implementierung
+    """
+
+    def setUp(self):
+        self.profiles = build_profiles(10)
+
+    def test_output_is_unchanged(self):
+        """
+        Die neue Serialisierung liefert dieselben Daten in derselben Reihenfolge
+        """
+        legacy = LegacyProfileSerializer(self.profiles, many=True).data
+        current = ProfileSerializer(self.profiles, many=True).data
+
+        self.assertEqual([list(row.items()) for row in current], [list(row.items()) for row in legacy])
+
+    def test_benchmark_command(self):
+        """
+        Test: benchmark_profile_serializer misst beide Serializer
+        """
+        out = StringIO()
+
+        call_command('benchmark_profile_serializer', '--profiles', '10', '--rounds', '1', stdout=out)
+
+        self.assertIn('ProfileSerializer, 10 profiles: legacy', out.getvalue())
+
+
+class ProfileQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query-Budget Tests: Die Profillisten dürfen nicht mit der Anzahl der Profile wachsen
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='viewer', password='testpass123')
+        Profile.objects.create(user=self.user, type='customer')
+        self.client.force_authenticate(user=self.user)
+        self.created = 0
+
+    def create_profiles(self, profile_type, count):
+        for _ in range(count):
+            self.created += 1
+            user = User.objects.create_user(username=f'{profile_type}{self.created}', password='testpass123')
+            Profile.objects.create(user=user, type=profile_type, first_name='Max')
+
+    def test_business_profiles_budget(self):
+        """
+        Die Business-Profilliste bleibt bei 1 und 10 Profilen im Budget
+        """
+        self.assertQueryBudget('profilesListBusiness', lambda count: self.create_profiles('business', count))
+
+    def test_customer_profiles_budget(self):
+        """
+        Die Kunden-Profilliste bleibt bei 1 und 10 Profilen im Budget
+        """
+        self.assertQueryBudget('profilesListCustomer', lambda count: self.create_profiles('customer', count))
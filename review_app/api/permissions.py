@@ -1,11 +1,11 @@
-from django.contrib.auth.models import User
-
 from rest_framework.permissions import BasePermission
+
+from profile_app.roles import is_customer
        
 class IsCustomerUser(BasePermission):
     """
-    Custom permission to only allow business users to create offers.
-    Assumes the user model has a `type` attribute.
+    Custom permission to only allow customer users to create reviews.
+    The profile type is resolved once per request.
     """
 
     def has_permission(self, request, view):
@@ -13,11 +13,7 @@ class IsCustomerUser(BasePermission):
         if not request.user.is_authenticated:
             return False
         
-        try:
-            user = User.objects.get(pk=request.user.pk)
-            return hasattr(user, 'profile') and user.profile.type == 'customer'
-        except User.DoesNotExist:
-            return False
+        return is_customer(request)
     
 class IsReviewer(BasePermission):
     """
@@ -27,4 +23,4 @@ class IsReviewer(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Check if the user is the owner of the review."""
-        return obj.reviewer == request.user
\ No newline at end of file
+        return obj.reviewer_id == request.user.pk
@@ -1,16 +1,22 @@
+from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework import viewsets, filters as drf_filters
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 
+from core.exports import export_response
+from core.streaming import StreamingListMixin
+
 from .serializers import ReviewSerializer
-from ..filters.review_filters import ReviewFilter
+from ..filters.review_filters import ReviewExportFilter, ReviewFilter
 from ..models import Reviews
 from .permissions import IsCustomerUser, IsReviewer
 
 
-class ReviewsViewSet(viewsets.ModelViewSet):
-    """ViewSet for managing reviews with filtering and ordering."""
+class ReviewsViewSet(StreamingListMixin, viewsets.ModelViewSet):
+    """ViewSet for managing reviews with filtering and ordering; `?stream=1` streams the list."""
     permission_classes = [IsAuthenticated]
     serializer_class = ReviewSerializer
     filter_backends = [DjangoFilterBackend, drf_filters.OrderingFilter]
@@ -18,6 +24,8 @@ class ReviewsViewSet(viewsets.ModelViewSet):
     ordering_fields = ['updated_at', 'rating']
     queryset = None
 
+    export_fields = ['id', 'business_user', 'reviewer', 'rating', 'description', 'created_at', 'updated_at']
+
     def get_queryset(self):
         """Return all reviews ordered by update time."""
         return (
@@ -41,6 +49,20 @@ class ReviewsViewSet(viewsets.ModelViewSet):
             self.permission_classes = [IsAuthenticated]
         return super().get_permissions()
     
+    @action(detail=False, methods=['get'], url_path=r'export/(?P<export_format>csv|ndjson)')
+    def export(self, request, export_format):
+        """Stream the reviews received or written by the user as CSV or NDJSON.
+
+        Supports the list filters plus a created_at range.
+        """
+        user = request.user
+        queryset = Reviews.objects.filter(Q(business_user=user) | Q(reviewer=user)).order_by('-created_at', '-pk')
+        filterset = ReviewExportFilter(request.query_params, queryset=queryset)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        return export_response(request, export_format, filterset.qs, self.export_fields, self.export_fields, 'reviews')
+
     def perform_create(self, serializer):
         """Save review with the current user as reviewer."""
         serializer.save(reviewer=self.request.user)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ReviewAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'review_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -8,4 +8,11 @@ class ReviewFilter(filters.FilterSet):
 
     class Meta:
         model = Reviews
-        fields = ['business_user_id', 'reviewer_id']
\ No newline at end of file
+        fields = ['business_user_id', 'reviewer_id']
+
+class ReviewExportFilter(ReviewFilter):
+    created_after = filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='gte')
+    created_before = filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='lt')
+
+    class Meta(ReviewFilter.Meta):
+        fields = ReviewFilter.Meta.fields + ['created_after', 'created_before']
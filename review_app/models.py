@@ -1,5 +1,5 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
 
 class Reviews(models.Model):
     """Model representing a review written by a customer for a business user."""
@@ -12,4 +12,25 @@ class Reviews(models.Model):
 
     class Meta:
         verbose_name_plural = "Reviews"
-    
\ No newline at end of file
+        indexes = [
+            models.Index(fields=['-updated_at'], name='review_updated_idx'),
+            models.Index(fields=['rating'], name='review_rating_idx'),
+            models.Index(fields=['business_user', '-updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['reviewer', '-updated_at'], name='review_reviewer_updated_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded rating so rating changes can be applied as deltas on save."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = instance.rating if 'rating' in field_names else None
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save the review and update the rating aggregates in one transaction.
+
+        post_save receivers still see the previously stored rating.
+        """
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+        self._loaded_rating = self.rating
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from profile_app.models import Profile
+
+from .models import Reviews
+
+
+@receiver(post_save, sender=Reviews)
+def review_saved(sender, instance, created, **kwargs):
+    """Apply a new review or a rating change to the aggregates of the reviewed business."""
+    if created:
+        Profile.apply_review_delta(instance.business_user_id, review_count=1, rating_sum=instance.rating)
+        return
+
+    loaded_rating = getattr(instance, '_loaded_rating', None)
+    if loaded_rating is None:
+        Profile.reconcile_review_aggregates(Profile.objects.filter(user_id=instance.business_user_id))
+    else:
+        Profile.apply_review_delta(instance.business_user_id, rating_sum=instance.rating - loaded_rating)
+
+
+@receiver(post_delete, sender=Reviews)
+def review_deleted(sender, instance, **kwargs):
+    """Remove a deleted review from the aggregates of the reviewed business."""
+    Profile.apply_review_delta(instance.business_user_id, review_count=-1, rating_sum=-instance.rating)
@@ -1,8 +1,13 @@
+import csv
+import io
+import json
+
 from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 
+from core.query_budget import QueryBudgetMixin
 from profile_app.models import Profile
 from review_app.models import Reviews
 
@@ -63,6 +68,82 @@ class GetReviewsHappyPathTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 3)
     
+    def test_get_reviews_streamed(self):
+        """
+        Mit ?stream=1 wird dieselbe Liste als Stream ausgeliefert, Filter greifen weiterhin
+        """
+        url = reverse('reviews-list')
+        expected = self.client.get(url, {'ordering': 'rating'}).json()
+
+        response = self.client.get(url, {'ordering': 'rating', 'stream': '1'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), expected)
+
+        response = self.client.get(url, {'business_user_id': self.business_user2.id, 'stream': '1'})
+        self.assertEqual(len(json.loads(b''.join(response.streaming_content))), 1)
+
+        response = self.client.get(url, {'business_user_id': 99999, 'stream': '1'})
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [])
+
+    def test_export_reviews_as_ndjson(self):
+        """
+        Der Export liefert nur Bewertungen, an denen der User beteiligt ist
+        """
+        url = reverse('reviews-export', kwargs={'export_format': 'ndjson'})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+        self.assertEqual({row['id'] for row in rows}, {self.review1.id, self.review3.id})
+
+        response = self.client.get(url, {'business_user_id': self.business_user2.id})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+        self.assertEqual([row['rating'] for row in rows], [3])
+
+    def test_export_reviews_as_csv(self):
+        """
+        Der CSV-Export enthält Kopfzeile und eine Zeile pro Bewertung
+        """
+        self.client.force_authenticate(user=self.business_user1)
+
+        response = self.client.get(
+            reverse('reviews-export', kwargs={'export_format': 'csv'}), {'created_after': '2000-01-01'}
+        )
+
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'id,business_user,reviewer,rating,description,created_at,updated_at')
+        self.assertEqual(len(lines), 3)
+
+    def test_export_csv_escapes_formulas(self):
+        """
+        Beschreibungen, die mit einem Formelzeichen, Tab oder Wagenrücklauf beginnen, werden im
+        CSV-Export entschärft, im NDJSON-Export aber unverändert ausgegeben
+        """
+        self.client.force_authenticate(user=self.business_user1)
+        descriptions = [
+            '=HYPERLINK("http://example.com")', '+1+2', '-1+2', '@SUM(A1:A2)', '\t=1+2', '\r=1+2',
+        ]
+        for description in descriptions:
+            with self.subTest(description=description):
+                self.review1.description = description
+                self.review1.save()
+
+                response = self.client.get(
+                    reverse('reviews-export', kwargs={'export_format': 'csv'}), {'created_after': '2000-01-01'}
+                )
+                content = b''.join(response.streaming_content).decode('utf-8')
+                rows = {int(row['id']): row for row in csv.DictReader(io.StringIO(content, newline=''))}
+                self.assertEqual(rows[self.review1.id]['description'], "'" + description)
+
+                response = self.client.get(reverse('reviews-export', kwargs={'export_format': 'ndjson'}))
+                content = b''.join(response.streaming_content).decode('utf-8')
+                rows = {row['id']: row for row in map(json.loads, content.splitlines())}
+                self.assertEqual(rows[self.review1.id]['description'], description)
+
     def test_get_reviews_filter_by_business_user_id(self):
         """
         Bewertungen können nach business_user_id gefiltert werden (Status 200)
@@ -512,3 +593,40 @@ class DeleteReviewUnhappyPathTests(APITestCase):
         response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ReviewQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query-Budget Tests: Die Bewertungsliste darf nicht mit der Anzahl der Bewertungen wachsen
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username='business1', password='testpass123')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.customer_user = User.objects.create_user(username='customer1', password='testpass123')
+        Profile.objects.create(user=self.customer_user, type='customer')
+        self.client.force_authenticate(user=self.customer_user)
+
+    def create_reviews(self, count):
+        for i in range(count):
+            Reviews.objects.create(
+                business_user=self.business_user,
+                reviewer=self.customer_user,
+                rating=i % 5 + 1,
+                description=f'Review {i}'
+            )
+
+    def test_reviews_list_budget(self):
+        """
+        Die Bewertungsliste bleibt bei 1 und 10 Bewertungen im Budget
+        """
+        self.assertQueryBudget('reviews-list', self.create_reviews)
+
+    def test_reviews_list_filtered_budget(self):
+        """
+        Auch gefiltert nach Business User bleibt die Bewertungsliste im Budget
+        """
+        self.assertQueryBudget(
+            'reviews-list', self.create_reviews,
+            params={'business_user_id': self.business_user.pk, 'ordering': '-rating'}
+        )